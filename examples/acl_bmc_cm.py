@@ -7,6 +7,15 @@ import sys
 from redfish_advantech.restful.v1api import redfish_advantech
 import argparse
 
+
+# Progress callback printing one updating console line per log entry
+def printProgress(nDone, nTotal, url):
+    if nDone < nTotal:
+        print("\rLogServicesLogEntries({})={}".format(nDone, url), end = '')
+    else:
+        print("\rLogServicesLogEntries({})={}".format(nDone, url))
+
+
 nLogLevel = 0
 parser = argparse.ArgumentParser()
 parser.add_argument("-v",
@@ -58,7 +67,8 @@ with redfish_advantech(login_host, login_port, login_account, login_password, nL
     sky8101.getSystems0EthernetInterfacesAll()
     sky8101.getSystems0LogServices()
     sky8101.getSystems0LogServicesLog()
-    sky8101.getSystems0LogServicesLogEntries()
+    sky8101.getSystems0LogServicesLogEntries(
+        progress=printProgress if nLogLevel <= 1 else None)
     #response = sky8101.get("/redfish/v1/Systems", None)
     #result = response.read().decode(errors='replace')
     # sky8101.logger.debug(result)
@@ -0,0 +1,59 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+import time
+from redfish_advantech.restful.v1api import redfish_advantech
+import argparse
+
+nLogLevel = 0
+parser = argparse.ArgumentParser()
+parser.add_argument("hostname", help="hostname or IP of the BMC")
+parser.add_argument("-p",
+                    "--port",
+                    type=int,
+                    default=443,
+                    help="port of the BMC")
+parser.add_argument("-u",
+                    "--user",
+                    default="admin",
+                    help="username")
+parser.add_argument("-P",
+                    "--password",
+                    default="admin",
+                    help="password")
+parser.add_argument("-i",
+                    "--include",
+                    action="append",
+                    help="only print paths matching this regular expression")
+parser.add_argument("-x",
+                    "--exclude",
+                    action="append",
+                    help="never follow paths matching this regular expression")
+parser.add_argument("-d",
+                    "--depth",
+                    type=int,
+                    default=None,
+                    help="maximum number of links from /redfish/v1")
+parser.add_argument("-j",
+                    "--concurrency",
+                    type=int,
+                    default=4,
+                    help="maximum number of requests in flight")
+parser.add_argument("-v",
+                    "--verbose",
+                    action="count",
+                    default=0,
+                    help="verbose level")
+args = parser.parse_args()
+if (args.verbose >= 0):
+    nLogLevel = args.verbose
+
+start = time.monotonic()
+with redfish_advantech(args.hostname, args.port, args.user, args.password, nLogLevel,
+                       nMaxConnections=args.concurrency, bLogItems=False) as client:
+    for uri, json_data in client.crawl(args.include, args.exclude, args.depth,
+                                       args.concurrency):
+        print(f"{uri} {json_data.get('@odata.type', '')}")
+print(f"crawled in {time.monotonic() - start:.2f}s")
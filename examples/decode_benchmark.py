@@ -0,0 +1,84 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# CPU time and peak memory to decode one large response body, the old way
+# against RestResponse.  The old methods decoded the bytes to a str for
+# logging, parsed that str (twice in getSystems0Processors and
+# getSystems0SimpleStorage) and copied each member with
+# json.loads(json.dumps(...)); RestResponse parses the bytes once and hands
+# the same object to every consumer.
+
+import json
+import time
+import tracemalloc
+from redfish_advantech.restful.v1api import RestResponse
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-e",
+                    "--entries",
+                    type=int,
+                    default=5000,
+                    help="number of log entries in the body")
+parser.add_argument("-r",
+                    "--repeat",
+                    type=int,
+                    default=20,
+                    help="number of responses decoded")
+args = parser.parse_args()
+
+
+# An expanded LogEntries collection like the one of an Advantech BMC
+def makeBody(nEntry):
+    base = "/redfish/v1/Systems/0/LogServices/Log/Entries"
+    return json.dumps({
+        '@odata.id': base,
+        'Name': "Log Entries",
+        'Members@odata.count': nEntry,
+        'Members': [{'@odata.id': "%s/%d" % (base, i), 'Id': str(i),
+                     'Name': "Log Entry %d" % i, 'EntryType': 'SEL',
+                     'Severity': ('OK', 'Warning', 'Critical')[i % 3],
+                     'Created': "2021-06-%02dT12:%02d:%02d+00:00" % (1 + i % 28, i % 60, i % 60),
+                     'Message': "Sensor %d reading crossed the upper threshold" % (i % 64)}
+                    for i in range(nEntry)]}).encode()
+
+
+# Decode as the methods did: str for the log, two parses, a copy per member
+def decodeBefore(body):
+    response = RestResponse(200, 'OK', {}, body)
+    result = response.read().decode(errors='replace')
+    json_data = json.loads(result)
+    nCount = len(json.loads(result)['Members'])
+    lstMember = [json.loads(json.dumps(member)) for member in json_data['Members']]
+    return nCount, lstMember
+
+
+# Decode once; every consumer gets the same parsed object
+def decodeAfter(body):
+    response = RestResponse(200, 'OK', {}, body)
+    json_data = response.json()
+    nCount = len(response.json()['Members'])
+    lstMember = json_data['Members']
+    return nCount, lstMember
+
+
+# Return (seconds, peak bytes) per response of decode
+def measure(decode, body):
+    start = time.process_time()
+    for i in range(args.repeat):
+        decode(body)
+    elapsed = (time.process_time() - start) / args.repeat
+    tracemalloc.start()
+    decode(body)
+    nPeak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, nPeak
+
+
+body = makeBody(args.entries)
+print(f"{args.entries} log entries, {len(body) / 1048576:.1f} MiB body, {args.repeat} responses")
+for strName, decode in (("before", decodeBefore), ("after", decodeAfter)):
+    elapsed, nPeak = measure(decode, body)
+    print(f"{strName:7} {elapsed * 1000:8.1f} ms CPU {nPeak / 1048576:8.1f} MiB peak per response")
@@ -0,0 +1,70 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+import sys
+from redfish_advantech.restful.fleet import Fleet
+from redfish_advantech.restful.linkmap import LinkMap
+from redfish_advantech.restful.sessionstore import SessionStore
+import argparse
+
+# hosts file: one "hostname port username password" per line
+nLogLevel = 0
+parser = argparse.ArgumentParser()
+parser.add_argument("hosts",
+                    help="file of BMCs, one 'hostname port username password' per line")
+parser.add_argument("-w",
+                    "--walk",
+                    default="thermal",
+                    choices=["thermal", "power", "chassis", "inventory", "logentries"],
+                    help="resource walk to run on every BMC")
+parser.add_argument("-j",
+                    "--workers",
+                    type=int,
+                    default=32,
+                    help="number of worker threads")
+parser.add_argument("-l",
+                    "--links",
+                    default=None,
+                    help="SQLite file to remember the links of every BMC in")
+parser.add_argument("-s",
+                    "--sessions",
+                    default=None,
+                    help="SQLite file to keep and reuse the sessions of every BMC in")
+parser.add_argument("-r",
+                    "--rate",
+                    type=float,
+                    default=None,
+                    help="maximum requests per second to each BMC")
+parser.add_argument("-v",
+                    "--verbose",
+                    action="count",
+                    default=0,
+                    help="verbose level")
+args = parser.parse_args()
+print(f"args.verbose level：{args.verbose}")
+if (args.verbose >= 0):
+    nLogLevel = args.verbose
+
+lstBMC = []
+with open(args.hosts) as f:
+    for line in f:
+        fields = line.split()
+        if (len(fields) == 4 and not fields[0].startswith('#')):
+            lstBMC.append((fields[0], int(fields[1]), fields[2], fields[3]))
+
+linkMap = None if args.links == None else LinkMap(args.links)
+sessionStore = None if args.sessions == None else SessionStore(args.sessions)
+dictRate = {} if args.rate == None else {'bRateLimit': True, 'rate': args.rate}
+fleet = Fleet(lstBMC, nMaxWorkers=args.workers, nLogLevel=nLogLevel, linkMap=linkMap,
+              sessionStore=sessionStore, **dictRate)
+nFailed = 0
+for result in fleet.run(args.walk):
+    if (result.ok()):
+        print(f"{result.hostname}:{result.port} {result.elapsed:.2f}s {result.result}")
+    else:
+        nFailed += 1
+        print(f"{result.hostname}:{result.port} FAILED ({result.breakerState}) {result.error}")
+print(f"{len(lstBMC) - nFailed}/{len(lstBMC)} BMCs succeeded")
+sys.exit(1 if nFailed else 0)
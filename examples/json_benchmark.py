@@ -0,0 +1,96 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# Time to parse Thermal, Power and LogEntries bodies with every JSON backend
+# installed (see redfish_advantech.restful.jsonbackend).  Pass the bodies
+# recorded from a BMC with -t/-w/-l (e.g. curl -k -H "X-Auth-Token: ..."
+# https://bmc/redfish/v1/Chassis/1u/Thermal > thermal.json); bodies like
+# the ones of an Advantech 1U chassis are generated for the others.
+
+import json
+import time
+from redfish_advantech.restful import jsonbackend
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-t",
+                    "--thermal",
+                    help="recorded body of Chassis/{id}/Thermal")
+parser.add_argument("-w",
+                    "--power",
+                    help="recorded body of Chassis/{id}/Power")
+parser.add_argument("-l",
+                    "--logentries",
+                    help="recorded body of Systems/{id}/LogServices/{id}/Entries")
+parser.add_argument("-e",
+                    "--entries",
+                    type=int,
+                    default=2000,
+                    help="number of log entries of the generated LogEntries body")
+parser.add_argument("-r",
+                    "--repeat",
+                    type=int,
+                    default=200,
+                    help="number of times each body is parsed")
+args = parser.parse_args()
+
+base = "/redfish/v1/Chassis/1u"
+THERMAL = {'@odata.id': base + "/Thermal",
+           'Temperatures': [{'@odata.id': "%s/Thermal#/Temperatures/%d" % (base, i),
+                             'Name': "CPU%d Temp" % i, 'ReadingCelsius': 30 + i % 20,
+                             'UpperThresholdCritical': 90, 'UpperThresholdFatal': 100,
+                             'Status': {'State': 'Enabled', 'Health': 'OK'}}
+                            for i in range(24)],
+           'Fans': [{'@odata.id': "%s/Thermal#/Fans/%d" % (base, i),
+                     'Name': "FAN%d" % i, 'Reading': 5000 + i * 37, 'ReadingUnits': 'RPM',
+                     'Status': {'State': 'Enabled', 'Health': 'OK'}}
+                    for i in range(8)]}
+POWER = {'@odata.id': base + "/Power",
+         'Voltages': [{'@odata.id': "%s/Power#/Voltages/%d" % (base, i),
+                       'Name': "P%d_VCC" % i, 'ReadingVolts': 12.0 + (i % 10) / 10,
+                       'Status': {'State': 'Enabled', 'Health': 'OK'}}
+                      for i in range(16)],
+         'PowerSupplies': [{'@odata.id': "%s/Power#/PowerSupplies/%d" % (base, i),
+                            'Name': "PSU%d" % i, 'LineInputVoltage': 230,
+                            'Status': {'State': 'Enabled', 'Health': 'OK'}}
+                           for i in range(2)]}
+
+
+# The generated LogEntries body of nEntry entries
+def makeLogEntries(nEntry):
+    url = "/redfish/v1/Systems/0/LogServices/Log/Entries"
+    return {'@odata.id': url,
+            'Members@odata.count': nEntry,
+            'Members': [{'@odata.id': "%s/%d" % (url, i), 'Id': str(i),
+                         'EntryType': 'SEL', 'Severity': ('OK', 'Warning', 'Critical')[i % 3],
+                         'Created': "2021-06-%02dT12:%02d:00+00:00" % (1 + i % 28, i % 60),
+                         'Message': "Sensor %d reading crossed the upper threshold" % (i % 64)}
+                        for i in range(nEntry)]}
+
+
+# The recorded body in fname, or the generated one
+def loadBody(fname, json_data):
+    if (fname):
+        with open(fname, 'rb') as f:
+            return f.read()
+    return json.dumps(json_data).encode()
+
+
+lstBody = [("Thermal", loadBody(args.thermal, THERMAL)),
+           ("Power", loadBody(args.power, POWER)),
+           ("LogEntries", loadBody(args.logentries, makeLogEntries(args.entries)))]
+lstBackend = [jsonbackend.getBackend(strName) for strName in sorted(jsonbackend.BACKENDS)
+              if jsonbackend.isAvailable(strName)]
+print("backends: %s (auto picks %s)" % (", ".join(b.strName for b in lstBackend),
+                                         jsonbackend.getBackend('auto').strName))
+for strName, body in lstBody:
+    print(f"{strName} ({len(body)} bytes)")
+    for backend in lstBackend:
+        start = time.perf_counter()
+        for i in range(args.repeat):
+            backend.loads(body)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        print(f"  {backend.strName:9} {elapsed * 1e6:10.1f} us/parse "
+              f"{len(body) / elapsed / 1048576:8.1f} MiB/s")
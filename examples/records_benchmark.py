@@ -0,0 +1,90 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# Bytes per kept sensor reading: the dicts of the parsed Thermal/Power
+# documents against the records of parsers.parseThermal/parsePower.
+# Every poll parses a fresh JSON body, as the clients do, so the dicts
+# hold their own copy of each name and URI while the records share one.
+
+import gc
+import json
+import tracemalloc
+from redfish_advantech.restful import parsers
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-b",
+                    "--bmcs",
+                    type=int,
+                    default=200,
+                    help="number of BMCs")
+parser.add_argument("-p",
+                    "--polls",
+                    type=int,
+                    default=10,
+                    help="number of polls of each BMC kept as history")
+args = parser.parse_args()
+
+
+# A Thermal and a Power body like the ones of an Advantech 1U chassis
+def makeBodies(nPoll):
+    base = "/redfish/v1/Chassis/1u"
+    thermal = {'@odata.id': base + "/Thermal",
+               'Temperatures': [{'@odata.id': "%s/Thermal#/Temperatures/%d" % (base, i),
+                                 'Name': "CPU%d Temp" % i, 'ReadingCelsius': 30 + (i + nPoll) % 20,
+                                 'Status': {'State': 'Enabled', 'Health': 'OK'}}
+                                for i in range(24)],
+               'Fans': [{'@odata.id': "%s/Thermal#/Fans/%d" % (base, i),
+                         'Name': "FAN%d" % i, 'Reading': 5000 + (i * 37 + nPoll) % 900,
+                         'ReadingUnits': 'RPM',
+                         'Status': {'State': 'Enabled', 'Health': 'OK'}}
+                        for i in range(8)]}
+    power = {'@odata.id': base + "/Power",
+             'Voltages': [{'@odata.id': "%s/Power#/Voltages/%d" % (base, i),
+                           'Name': "P%d_VCC" % i, 'ReadingVolts': 12.0 + ((i + nPoll) % 10) / 10,
+                           'Status': {'State': 'Enabled', 'Health': 'OK'}}
+                          for i in range(16)],
+             'PowerSupplies': [{'@odata.id': "%s/Power#/PowerSupplies/%d" % (base, i),
+                                'Name': "PSU%d" % i, 'LineInputVoltage': 230,
+                                'Status': {'State': 'Enabled', 'Health': 'OK'}}
+                               for i in range(2)]}
+    return json.dumps(thermal).encode(), json.dumps(power).encode()
+
+
+# Keep what keep() returns of every poll and measure its memory
+def measure(keep):
+    lstBody = [makeBodies(nPoll) for nPoll in range(args.polls)]
+    gc.collect()
+    tracemalloc.start()
+    lstKept = []
+    nReading = 0
+    for nBMC in range(args.bmcs):
+        for bodyThermal, bodyPower in lstBody:
+            thermal = keep('Temperatures', 'Fans', json.loads(bodyThermal), parsers.parseThermal)
+            power = keep('Voltages', 'PowerSupplies', json.loads(bodyPower), parsers.parsePower)
+            nReading += sum(len(lstReading) for lstReading in thermal + power)
+            lstKept.append((thermal, power))
+    gc.collect()
+    nBytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return nBytes, nReading
+
+
+# The sensor dicts of the parsed document
+def keepDicts(key1, key2, json_data, parse):
+    return (json_data[key1], json_data[key2])
+
+
+# The records of the parser
+def keepRecords(key1, key2, json_data, parse):
+    dictReadings = parse(json_data)
+    return (dictReadings[key1], dictReadings[key2])
+
+
+print(f"{args.bmcs} BMCs x {args.polls} polls of Thermal and Power")
+for strName, keep in (("dict", keepDicts), ("records", keepRecords)):
+    nBytes, nReading = measure(keep)
+    print(f"{strName:8} {nReading:9} readings {nBytes / 1048576:9.1f} MiB "
+          f"{nBytes / nReading:7.1f} bytes/reading")
@@ -39,5 +39,8 @@ setup(name='redfish_advantech',
           ],
           ':python_version >= "3.5"': [
               'jsonpatch'
+          ],
+          'fast': [
+              'orjson'
           ]
       })
@@ -0,0 +1,1323 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""asyncio version of redfish_advantech built on non-blocking sockets.
+
+Needs Python 3.6+ (async generators), so it is not imported by the
+redfish_advantech package; import it explicitly:
+
+    from redfish_advantech.restful.asyncapi import AsyncRedfishAdvantech
+"""
+
+# ---------Imports---------
+import io
+import ssl
+import time
+import asyncio
+import logging
+import http.client
+# ---------End of imports---------
+
+from redfish_advantech.restful import parsers
+from redfish_advantech.restful.cache import ETagCache
+from redfish_advantech.restful.retry import RetryPolicy
+from redfish_advantech.restful import breaker
+from redfish_advantech.restful import ratelimit
+from redfish_advantech.restful import concurrency
+from redfish_advantech.restful import jsonbackend
+from redfish_advantech.restful import jsonstream
+from redfish_advantech.restful.linkmap import LINK_KEYS
+from redfish_advantech.restful.connectionpool import (CHUNK_SIZE, GzipDecoder, isGzip,
+                                                      PoolTimeoutError, IDEMPOTENT_METHODS)
+from redfish_advantech.restful.v1api import (RestResponse, JsonDecodingError,
+                                             InvalidCredentialsError, RequestAttempts,
+                                             SESSIONS_URL, makeHeaders, getCached,
+                                             putCached, canReplay, loadLoggingConf)
+
+
+async def acquireSlot(limiter):
+    """Take a slot of a concurrency.AdaptiveLimiter without blocking the loop
+
+    The coroutines waiting are handed the freed slots in the order they
+    came; release() wakes them whatever thread or loop it runs in.
+
+    :param limiter: The limiter of the BMC.
+    :type limiter: concurrency.AdaptiveLimiter
+
+    """
+    loop = asyncio.get_event_loop()
+    future = loop.create_future()
+
+    # Resolve the future in its own loop, or pass the slot on if the
+    # waiter gave up after it was handed the slot
+    def handOver():
+        if (future.cancelled()):
+            limiter.cancel()
+        else:
+            future.set_result(None)
+
+    # Called by release() with the slot taken for this waiter
+    def wake():
+        if (loop.is_closed()):
+            return False
+        loop.call_soon_threadsafe(handOver)
+        return True
+
+    if (limiter.acquireOrWait(wake)):
+        return
+    try:
+        await future
+    except asyncio.CancelledError:
+        if (not limiter.cancelWait(wake) and future.done() and not future.cancelled()):
+            # The slot was handed over just before the cancellation
+            limiter.cancel()
+        raise
+
+
+class AsyncHTTPSConnection:
+    """One keep-alive HTTP/1.1 connection over asyncio streams"""
+
+    def __init__(self, hostname, port, timeout=10, sslContext=None):
+        self.hostname = hostname
+        self.port = port
+        self.timeout = timeout
+        self.sslContext = sslContext
+        self.reader = None
+        self.writer = None
+        self.idleSince = time.monotonic()
+        self.bStatusRead = False    # the last request got its status line
+
+    def isOpen(self):
+        return self.writer is not None
+
+    def isHealthy(self, idleTimeout):
+        """Return False if the idle connection must not be reused"""
+        if (time.monotonic() - self.idleSince > idleTimeout):
+            return False
+        # EOF while idle means the BMC has closed the connection.
+        return not self.reader.at_eof()
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(self.hostname, self.port, ssl=self.sslContext),
+            self.timeout)
+
+    def close(self):
+        if (self.writer is not None):
+            self.writer.close()
+        self.reader = None
+        self.writer = None
+
+    # Yield the body in pieces of at most CHUNK_SIZE bytes as they arrive
+    async def __readChunks(self, method, status, headers):
+        reader = self.reader
+        if (method == 'HEAD' or status in (204, 304) or 100 <= status < 200):
+            return
+        if ((headers.get('Transfer-Encoding') or '').lower() == 'chunked'):
+            while True:
+                line = await reader.readline()
+                try:
+                    nSize = int(line.split(b';', 1)[0], 16)
+                except ValueError:
+                    # EOF or a malformed chunk size, as http.client reports it
+                    raise http.client.IncompleteRead(b'') from None
+                if (nSize == 0):
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    return
+                while (nSize > 0):
+                    chunk = await reader.readexactly(min(nSize, CHUNK_SIZE))
+                    nSize -= len(chunk)
+                    yield chunk
+                await reader.readline()
+        elif (headers.get('Content-Length') is not None):
+            nSize = int(headers['Content-Length'])
+            while (nSize > 0):
+                chunk = await reader.readexactly(min(nSize, CHUNK_SIZE))
+                nSize -= len(chunk)
+                yield chunk
+        else:
+            while True:
+                chunk = await reader.read(CHUNK_SIZE)
+                if (not chunk):
+                    return
+                yield chunk
+
+    # Read the body, decompressing it chunk by chunk if it is gzip encoded
+    async def __readBody(self, method, status, headers):
+        if (isGzip(headers)):
+            decoder = GzipDecoder()
+            async for chunk in self.__readChunks(method, status, headers):
+                decoder.feed(chunk)
+            return (decoder.finish(), decoder.nWireBytes)
+        lstChunk = []
+        async for chunk in self.__readChunks(method, status, headers):
+            lstChunk.append(chunk)
+        data = b''.join(lstChunk)
+        return (data, len(data))
+
+    # Send the request and read the status line and headers
+    async def __sendHead(self, method, url, body, headers):
+        self.bStatusRead = False
+        if (self.writer is None):
+            await self.open()
+        lstLine = ['%s %s HTTP/1.1' % (method, url),
+                   'Host: %s:%s' % (self.hostname, self.port)]
+        for key, value in headers.items():
+            lstLine.append('%s: %s' % (key, value))
+        if (body is not None):
+            body = body.encode('utf-8') if isinstance(body, str) else body
+            lstLine.append('Content-Length: %d' % len(body))
+        self.writer.write(('\r\n'.join(lstLine) + '\r\n\r\n').encode('latin-1') + (body or b''))
+        await self.writer.drain()
+        statusLine = await self.reader.readline()
+        if (not statusLine):
+            raise http.client.RemoteDisconnected(
+                "Remote end closed connection without response")
+        self.bStatusRead = True
+        version, status, reason = (statusLine.decode('latin-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+        status = int(status)
+        lstHeader = []
+        while True:
+            line = await self.reader.readline()
+            if (line in (b'\r\n', b'\n', b'')):
+                break
+            lstHeader.append(line)
+        headers = http.client.parse_headers(io.BytesIO(b''.join(lstHeader) + b'\r\n'))
+        return (version, status, reason, headers)
+
+    async def __request(self, method, url, body, headers):
+        version, status, reason, headers = await self.__sendHead(method, url, body, headers)
+        data, nWireBytes = await self.__readBody(method, status, headers)
+        return (status, reason, headers, data, nWireBytes, self.willClose(version, headers))
+
+    def willClose(self, version, headers):
+        """Return True if the connection cannot be reused once the body
+        of a response with this version and headers has been read"""
+        return (version == 'HTTP/1.0' or self.reader.at_eof() or
+                (headers.get('Connection') or '').lower() == 'close')
+
+    async def request(self, method, url, body=None, headers=None):
+        """Send one request and read the whole response
+
+        :returns: tuple of (status, reason, headers, body bytes, bytes read
+                  from the socket, will close)
+
+        """
+        return await asyncio.wait_for(
+            self.__request(method, url, body, headers or {}), self.timeout)
+
+    async def openResponse(self, method, url, body=None, headers=None):
+        """Send one request and read the status line and headers only
+
+        The body is left on the socket for iterBody().
+
+        :returns: tuple of (HTTP version, status, reason, headers)
+
+        """
+        return await asyncio.wait_for(
+            self.__sendHead(method, url, body, headers or {}), self.timeout)
+
+    def iterBody(self, method, status, headers):
+        """Return an async generator of the body chunks of the response
+        openResponse() returned, as read from the socket"""
+        return self.__readChunks(method, status, headers)
+
+
+class AsyncStreamedResponse:
+    """A response whose body is read chunk by chunk by the caller
+
+    The asyncio counterpart of connectionpool.StreamedResponse: the
+    connection stays checked out of the pool until the body has been read
+    to the end (it is then reused) or close() is called (it is then
+    closed, since the rest of the body is still on the socket).
+
+    """
+
+    def __init__(self, pool, conn, method, version, status, reason, headers):
+        self.pool = pool
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.nBytes = 0
+        self.nWireBytes = 0
+        self.__conn = conn
+        self.__method = method
+        self.__version = version
+
+    async def iterChunks(self):
+        """Yield the (decompressed) body in chunks as it is read"""
+        conn = self.__conn
+        decoder = GzipDecoder() if isGzip(self.headers) else None
+        body = conn.iterBody(self.__method, self.status, self.headers)
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(body.__anext__(), self.pool.timeout)
+                except StopAsyncIteration:
+                    break
+                if (decoder == None):
+                    self.nWireBytes += len(chunk)
+                    self.nBytes += len(chunk)
+                    yield chunk
+                    continue
+                for data in decoder.iterDecompress(chunk):
+                    self.nBytes += len(data)
+                    yield data
+            if (decoder != None):
+                chunk = decoder.flush()
+                self.nWireBytes = decoder.nWireBytes
+                self.nBytes += len(chunk)
+                if (chunk):
+                    yield chunk
+        except BaseException:
+            self.close()
+            raise
+        self.__release(not conn.willClose(self.__version, self.headers))
+
+    async def read(self):
+        """Return the rest of the body"""
+        lstChunk = []
+        async for chunk in self.iterChunks():
+            lstChunk.append(chunk)
+        return b''.join(lstChunk)
+
+    def __release(self, bReuse):
+        if (self.__conn != None):
+            conn, self.__conn = self.__conn, None
+            self.pool.putConnection(conn, bReuse)
+
+    def close(self):
+        """Give the connection back; closed unless the body was read to the end"""
+        self.__release(False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+
+class AsyncConnectionPool:
+    """Bounded pool of AsyncHTTPSConnection to one BMC
+
+    The asyncio counterpart of HTTPSConnectionPool: request() and stream()
+    wait at most poolTimeout seconds (timeout if None) for a free connection before
+    raising PoolTimeoutError.
+
+    """
+
+    def __init__(self, hostname, port, timeout=10, nMaxConnections=4,
+                 idleTimeout=30, logger=None, poolTimeout=None):
+        self.hostname = hostname
+        self.port = port
+        self.timeout = timeout
+        self.poolTimeout = timeout if poolTimeout is None else poolTimeout
+        self.nMaxConnections = max(1, nMaxConnections)
+        self.idleTimeout = idleTimeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.sslContext = ssl._create_unverified_context()
+        self.__semaphore = None
+        self.__idle = []
+        self.nCreated = 0
+        self.nReused = 0
+        self.nReconnects = 0
+
+    def __getConnection(self):
+        while self.__idle:
+            conn = self.__idle.pop()
+            if (conn.isHealthy(self.idleTimeout)):
+                self.nReused += 1
+                return conn
+            conn.close()
+        self.nCreated += 1
+        self.logger.debug("Start the async http connection [%s:%s]",
+                          self.hostname, self.port)
+        return AsyncHTTPSConnection(self.hostname, self.port,
+                                    self.timeout, self.sslContext)
+
+    # Check a connection out of the pool, waiting at most poolTimeout
+    async def __checkOut(self):
+        if (self.__semaphore is None):
+            self.__semaphore = asyncio.Semaphore(self.nMaxConnections)
+        try:
+            await asyncio.wait_for(self.__semaphore.acquire(), self.poolTimeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeoutError(
+                "No free connection to %s:%s" % (self.hostname, self.port)) from None
+        return self.__getConnection()
+
+    def putConnection(self, conn, bReuse=True):
+        """Return a checked out connection to the pool
+
+        :param conn: The connection the request was sent on.
+        :param bReuse: False to close the connection instead of keeping it idle.
+        :type bReuse: bool
+
+        """
+        if (bReuse):
+            conn.idleSince = time.monotonic()
+            self.__idle.append(conn)
+        else:
+            conn.close()
+        self.__semaphore.release()
+
+    # Check a connection out and return it with the result of send(conn).
+    # A reused connection the BMC has silently closed fails before the
+    # status line is read; send is then awaited once more on a fresh
+    # connection, but only if method is idempotent.
+    async def __send(self, method, send):
+        conn = await self.__checkOut()
+        bFresh = not conn.isOpen()
+        while True:
+            try:
+                return conn, await send(conn)
+            except (http.client.RemoteDisconnected, BrokenPipeError,
+                    ConnectionResetError) as e:
+                conn.close()
+                if (bFresh or conn.bStatusRead or
+                        method.upper() not in IDEMPOTENT_METHODS):
+                    self.putConnection(conn, False)
+                    raise
+                self.nReconnects += 1
+                self.logger.info("Reconnect [%s:%s] after %s",
+                                 self.hostname, self.port, type(e).__name__)
+                bFresh = True
+            except BaseException:
+                self.putConnection(conn, False)
+                raise
+
+    async def request(self, method, url, body=None, headers=None):
+        """Send one request on a pooled connection and read the whole response
+
+        An idempotent request sent on a reused connection that the BMC has
+        silently closed is replayed once on a fresh connection, unless the
+        status line had already been read.  A gzip encoded body is
+        decompressed while it is read.
+
+        :returns: tuple of (status, reason, headers, body bytes, bytes read
+                  from the socket)
+        :raises PoolTimeoutError: if no connection is free within poolTimeout.
+
+        """
+        conn, result = await self.__send(
+            method, lambda conn: conn.request(method, url, body, headers))
+        status, reason, headers, data, nWireBytes, bWillClose = result
+        self.putConnection(conn, not bWillClose)
+        return (status, reason, headers, data, nWireBytes)
+
+    async def stream(self, method, url, body=None, headers=None):
+        """Send one request and return the response before its body is read
+
+        The request is replayed like request().  The caller reads the body
+        with iterChunks() and must close() the AsyncStreamedResponse if it
+        stops early; until then the connection is not back in the pool.
+
+        :returns: AsyncStreamedResponse
+        :raises PoolTimeoutError: if no connection is free within poolTimeout.
+
+        """
+        conn, head = await self.__send(
+            method, lambda conn: conn.openResponse(method, url, body, headers))
+        return AsyncStreamedResponse(self, conn, method, *head)
+
+    def close(self):
+        while self.__idle:
+            self.__idle.pop().close()
+
+
+class AsyncRedfishAdvantech:
+    """asyncio version of redfish_advantech
+
+    Uses the same parsers as redfish_advantech, so both clients keep the same
+    links (urlThermal, urlPower, urlBios, ...) after the same walk.  One event
+    loop can drive many instances, one per BMC, at once.  nConcurrency,
+    linkMap and sessionStore work as in redfish_advantech: at most
+    nConcurrency member requests are awaited at once, and the links and
+    sessions of earlier runs are reused.
+
+    """
+
+    def __init__(self, hostname, port, username, password, nLogLevel=0, nMaxConnections=4,
+                 bExpand=True, bETagCache=False, responseCache=None, retryPolicy=None,
+                 bCircuitBreaker=True, bRateLimit=False, bAdaptive=True, bLogItems=True,
+                 bGzip=False, jsonBackend='auto', nPageSize=None, nBreakerFailures=5,
+                 breakerResetTimeout=30, rate=ratelimit.DEFAULT_RATE,
+                 nBurst=ratelimit.DEFAULT_BURST, nConcurrency=None, linkMap=None,
+                 sessionStore=None):
+        self.__logVerbose = nLogLevel
+        # Load logging.conf
+        loadLoggingConf()
+        # create logger
+        self.logger = logging.getLogger('simpleExample')
+        if (self.get_logVerbose() >= 1):
+            self.logger.debug('=== Start to of AsyncRedfishAdvantech.__init__ ===')
+
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.theTimeout = 10
+        self.nMaxConnections = nMaxConnections
+        # Member requests awaited at once (default: one per pooled connection)
+        self.nConcurrency = nConcurrency or nMaxConnections
+        self.pool = None
+        self.authToken = None
+        self.location = None
+        self.url = ''
+        self.urlThermal = ''
+        self.urlPower = ''
+        self.urlBios = ''
+        self.urlProcessors = ''
+        self.urlSimpleStorage = ''
+        self.urlMemory = ''
+        self.urlEthernetInterfaces = ''
+        self.urlLogServices = ''
+        self.strPowerState = ''
+        self.urlReset = ''
+        self.lstURL = []
+        self.nCount = 0
+        self.urlLogEntries = ''
+        # Fetch collections with $expand when the service root supports it
+        self.bExpand = bExpand
+        self.dictProtocolFeatures = {}
+        self.dictExpanded = {}
+        # Revalidate GETs with If-None-Match and serve 304s from the cache
+        self.etagCache = ETagCache() if bETagCache else None
+        # Serve GETs from a (possibly shared) TTL + LRU cache.ResponseCache
+        self.responseCache = responseCache
+        # Start from the links a linkmap.LinkMap remembers for this BMC
+        self.linkMap = linkMap
+        self.strLinkKey = ''
+        self.setRemembered = set()
+        # The status of the last getJson(), read by isStaleLink() before
+        # anything else is awaited
+        self.nLastStatus = 0
+        # Reuse the sessions a sessionstore.SessionStore keeps across runs
+        self.sessionStore = sessionStore
+        # Serializes the re-login after a session has expired; created in
+        # the running loop on first use, as a Lock binds to the loop of
+        # its creation on older Pythons
+        self.authLock = None
+        # Retry idempotent requests on connection errors and 502/503/504
+        self.retryPolicy = retryPolicy or RetryPolicy()
+        # Fail fast while the circuit breaker of this BMC is open (see
+        # redfish_advantech)
+        self.breaker = breaker.getBreaker(
+            hostname, port, nFailureThreshold=nBreakerFailures,
+            resetTimeout=breakerResetTimeout) if bCircuitBreaker else None
+        # At most rate requests per second to this BMC, in bursts of nBurst,
+        # shared by every client of the process; opt-in, as a rate set for
+        # a slow BMC would cap the member fetches and $expand walks of a
+        # fast one
+        self.rateLimiter = ratelimit.getRateLimiter(
+            hostname, port, rate, nBurst) if bRateLimit else None
+        # Requests in flight to this BMC, adjusted by AIMD from latency and errors
+        self.limiter = concurrency.getLimiter(hostname, port) if bAdaptive else None
+        # Log the properties and readings the resource methods return
+        self.bLogItems = bLogItems
+        # Ask for gzip encoded bodies with Accept-Encoding
+        self.bGzip = bGzip
+        # Parse and serialize bodies with the fastest JSON library installed
+        # unless one is named ('orjson', 'ujson', 'simdjson', 'json')
+        self.jsonBackend = jsonbackend.getBackend(jsonBackend)
+        # Page collections with $top/$skip, nPageSize members per request,
+        # when the BMC supports it (Members@odata.nextLink is always followed)
+        self.nPageSize = nPageSize
+        self.nBytes = 0
+        self.nWireBytes = 0
+
+    # Log every top level property of json_data except the ones in skip
+    def logItems(self, json_data, skip=()):
+        if (self.bLogItems):
+            parsers.logItems(self.logger, json_data, skip)
+
+    def get_logVerbose(self):
+        """Return the level of log verbose"""
+        return self.__logVerbose
+
+    def set_logVerbose(self, logVerbose=0):
+        """Set log Verbose level
+
+        :param logVerbose: The level of log verbose to be set.
+        :type logVerbose: int
+
+        """
+        self.__logVerbose = logVerbose
+
+    async def __aenter__(self):
+        await self.login()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        await self.logout()
+        self.disconnect()
+
+    # Create the async http connection pool
+    def connect(self):
+        if (self.pool == None):
+            self.pool = AsyncConnectionPool(
+                self.hostname, self.port, timeout=self.theTimeout,
+                nMaxConnections=self.nMaxConnections, logger=self.logger)
+
+    # Redfish http request
+    async def rfRequest(self, method, url, payload=None, log=True, bReauth=True):
+        self.connect()
+        headers = makeHeaders(self.authToken, method, url, self.bGzip)
+        body = None
+        if (payload != None):
+            body = self.jsonBackend.dumps(payload)
+            headers['Content-Type'] = 'application/json'
+        response, etag = getCached(self, method, url, headers)
+        if (response != None):
+            if (log):
+                self.logger.info("--> rfRequest [%s %s] (cached)", method, url)
+            return response
+        if (log):
+            self.logger.info("--> rfRequest [%s %s]", method, url)
+        response = await self.sendRequest(method, url, body, headers)
+        if (bReauth and response.status in (401, 403) and
+                await self.reauthenticate(headers.get('X-Auth-Token'), response.status)):
+            headers['X-Auth-Token'] = self.authToken
+            self.logger.info("Replay [%s %s] with the new session", method, url)
+            response = await self.sendRequest(method, url, body, headers)
+        response = putCached(self, method, url, response, etag)
+        if (log):
+            self.logger.info("response.status(reason)=%d(%s)",
+                             response.status, response.reason)
+            self.logger.debug("Received %d bytes (%d on the wire)",
+                              response.nBytes, response.nWireBytes)
+        return response
+
+    # Return the body bytes received, decompressed and as read from the socket
+    def getTransferStats(self):
+        """Return {'nBytes': ..., 'nWireBytes': ...} of every response so far"""
+        return {'nBytes': self.nBytes, 'nWireBytes': self.nWireBytes}
+
+    # Send one request on the pool, retrying it as self.retryPolicy says
+    async def sendRequest(self, method, url, body, headers):
+        attempts = RequestAttempts(self, method, url)
+        while True:
+            delay = attempts.begin()
+            try:
+                if (delay > 0):
+                    await asyncio.sleep(delay)
+                if (self.limiter != None):
+                    await acquireSlot(self.limiter)
+                attempts.sending()
+                response = RestResponse(*await self.pool.request(method, url, body, headers),
+                                        jsonBackend=self.jsonBackend)
+            except BaseException as e:
+                delay = attempts.failed(e)
+                if (delay == None):
+                    raise
+            else:
+                self.nBytes += response.nBytes
+                self.nWireBytes += response.nWireBytes
+                delay = attempts.answered(response)
+                if (delay == None):
+                    return response
+            await asyncio.sleep(delay)
+
+    # GET url and return the parsed body of a 200 response or None
+    async def getJson(self, url, log=True):
+        response = await self.rfRequest("GET", url, log=log)
+        if (self.get_logVerbose() >= 2):
+            self.logger.debug("result=%s", response.text())
+        self.nLastStatus = response.getcode()
+        if (response.getcode() == 200):
+            return response.json()
+        return None
+
+    async def get(self, path, args=None, headers=None, lstSelect=None):
+        """Perform a GET request
+
+        :param path: the URL path.
+        :type path: str.
+        :param lstSelect: property paths to project the response to; sent as
+                          $select when the BMC supports it, otherwise the
+                          body is trimmed on the client side.
+        :type lstSelect: list.
+        :returns: returns a RestResponse of method 'Get'
+
+        """
+        url = self.selectURL(path, lstSelect)
+        try:
+            response = await self.rfRequest("GET", url)
+            if (lstSelect and response.getcode() == 200 and url == path):
+                response = RestResponse.fromJson(
+                    response, parsers.selectProperties(response.json(), lstSelect))
+            return response
+        except ValueError:
+            self.logger.error("Error in json decoding. path=%s, method=GET", path)
+            raise JsonDecodingError('Error in json decoding.')
+
+    # Add the $select query to url when the BMC supports it
+    def selectURL(self, url, lstSelect):
+        if (not lstSelect or not parsers.parseSelectQuery(self.dictProtocolFeatures)):
+            return url
+        return url + ('&' if '?' in url else '?') + parsers.selectQuery(lstSelect)
+
+    # GET url projected to lstSelect and return the parsed body or None
+    async def getSelected(self, url, lstSelect=None):
+        urlSelect = self.selectURL(url, lstSelect)
+        json_data = await self.getJson(urlSelect)
+        if (json_data != None and lstSelect and urlSelect == url):
+            json_data = parsers.selectProperties(json_data, lstSelect)
+        return json_data
+
+    # Get Redfish V1 root
+    async def getRedfishV1(self):
+        json_data = await self.getJson("/redfish/v1")
+        self.lstURL = []
+        self.nCount = 0
+        if (json_data != None):
+            self.dictProtocolFeatures = json_data.get('ProtocolFeaturesSupported', {})
+            for key, link in parsers.parseLinks(json_data, parsers.ROOT_LINKS):
+                self.lstURL.append(link)
+                self.logger.info("Next link=%s", link)
+            self.nCount = len(self.lstURL)
+            self.logItems(json_data, parsers.ROOT_LINKS)
+            self.loadLinks(json_data.get('UUID', ''))
+
+    # Login
+    async def login(self):
+        """ Login and start a REST session.  Remember to call logout() when you are done.
+
+        With a sessionStore, the session an earlier run kept is reused as long
+        as the BMC still accepts its token.
+
+        :raises InvalidCredentialsError: if the BMC answered without a token.
+
+        """
+        if (await self.resumeSession()):
+            return
+        url = SESSIONS_URL
+        self.logger.info("--> Login [POST %s]", url)
+        data = dict()
+        data['UserName'] = self.username
+        data['Password'] = self.password
+        response = await self.rfRequest("POST", url, data)
+        if (self.get_logVerbose() >= 1):
+            self.logger.debug("result=%s", response.text())
+        # Get Token and Location of session after login
+        self.authToken = response.headers['X-Auth-Token']
+        if (response.getcode() >= 400 or not self.authToken):
+            self.authToken = None
+            raise InvalidCredentialsError("Login to %s:%s as %s failed: %d(%s)" % (
+                self.hostname, self.port, self.username, response.status, response.reason))
+        self.logger.info("--> X-Auth-Token=%s]", self.authToken)
+        if (response.getcode() == 302):
+            json_data = response.json()
+            if ('@odata.id' in json_data):
+                self.location = json_data['@odata.id']
+                self.logger.info("location=%s", self.location)
+        if (self.sessionStore != None and self.authToken and self.location):
+            if (not self.sessionStore.put(self.getSessionKey(), self.authToken, self.location)):
+                self.logger.info("Another session is kept for %s, %s is deleted at logout",
+                                 self.getSessionKey(), self.location)
+
+    # Get the key of this BMC and user in the session store
+    def getSessionKey(self):
+        return self.sessionStore.makeKey(self.hostname, self.port, self.username)
+
+    # Reuse the session kept in the session store if its token is still valid
+    async def resumeSession(self):
+        if (self.sessionStore == None):
+            return False
+        session = self.sessionStore.get(self.getSessionKey())
+        if (session == None):
+            return False
+        self.authToken, self.location = session
+        if (await self.isSessionAlive()):
+            self.logger.info("Reuse session %s", self.location)
+            return True
+        self.logger.info("Session %s is gone, login again", self.location)
+        self.sessionStore.forget(self.getSessionKey(), self.authToken)
+        self.authToken = None
+        self.location = None
+        return False
+
+    # Return True if the BMC still accepts the session token
+    async def isSessionAlive(self):
+        # A GET of the session resource is the cheapest check of the token
+        response = await self.rfRequest("GET", self.location, bReauth=False)
+        return (response.getcode() == 200)
+
+    # Login again after the BMC rejected strToken; return True if the
+    # request can be replayed with self.authToken
+    async def reauthenticate(self, strToken, nStatus=401):
+        if (strToken == None):
+            return False
+        if (self.authLock == None):
+            self.authLock = asyncio.Lock()
+        async with self.authLock:
+            if (canReplay(strToken, self.authToken)):
+                # Another task has already logged in again
+                return True
+            if (self.authToken == None or
+                    (nStatus == 403 and self.location and await self.isSessionAlive())):
+                # Logged out, or a valid session lacking the privilege
+                return False
+            self.logger.warning("Session %s has expired, login again", self.location)
+            if (self.sessionStore != None):
+                self.sessionStore.forget(self.getSessionKey(), strToken)
+            self.location = None
+            await self.login()
+            return canReplay(strToken, self.authToken)
+
+    # Logout
+    async def logout(self, bDelete=False):
+        """ Logout of session. YOU MUST CALL THIS WHEN YOU ARE DONE TO FREE UP SESSIONS
+
+        With a sessionStore the session is kept open for the next run unless
+        bDelete is True.  A session the store does not keep (another process
+        stored its own first) is always deleted.
+        """
+        if (self.authToken and self.sessionStore != None and not bDelete):
+            session = self.sessionStore.get(self.getSessionKey())
+            if (session != None and session[0] == self.authToken):
+                self.logger.info("Keep session %s for reuse", self.location)
+                self.authToken = None
+                self.location = None
+        if (self.authToken):
+            if (self.sessionStore != None):
+                self.sessionStore.forget(self.getSessionKey(), self.authToken)
+            self.logger.info("--> Logout [DELETE %s]", self.location)
+            response = await self.rfRequest("DELETE", self.location, bReauth=False)
+            if response.status not in [200, 202, 204]:
+                self.logger.info("Invalid session resource: %s, return code: %d" % (
+                    self.location, response.status))
+            self.authToken = None
+            self.location = None
+
+    # Disconnect
+    def disconnect(self):
+        if (self.pool):
+            self.pool.close()
+        self.pool = None
+
+    # Set the link attributes this BMC's entry of the link map remembers
+    def loadLinks(self, strUUID):
+        if (self.linkMap == None):
+            return
+        self.strLinkKey = self.linkMap.makeKey(self.hostname, self.port, strUUID)
+        for key, url in self.linkMap.get(self.strLinkKey).items():
+            if (key in LINK_KEYS and getattr(self, key) == ''):
+                setattr(self, key, url)
+                self.setRemembered.add(url)
+                self.logger.debug("Remembered %s=%s", key, url)
+
+    # Remember the discovered link attributes in the link map
+    def saveLinks(self):
+        if (self.linkMap == None or self.strLinkKey == ''):
+            return
+        self.linkMap.put(self.strLinkKey, dict(
+            (key, getattr(self, key)) for key in LINK_KEYS if getattr(self, key) != ''))
+
+    # Forget every link of this BMC after a remembered link answered 404
+    def isStaleLink(self, url):
+        if (self.linkMap == None or self.nLastStatus != 404 or
+                url not in self.setRemembered):
+            return False
+        self.logger.warning("Link %s is gone, discover %s again", url, self.strLinkKey)
+        self.linkMap.forget(self.strLinkKey)
+        self.setRemembered.clear()
+        for key in LINK_KEYS:
+            setattr(self, key, '')
+        return True
+
+    # Await fetch(url) of the link in attribute strAttr and, if a remembered
+    # link has gone away, rediscover it with discover() and fetch it again;
+    # fetch returns None (or no members of a collection) when it failed
+    async def fetchLink(self, strAttr, fetch, discover):
+        json_data = await fetch(getattr(self, strAttr))
+        if (not json_data and self.isStaleLink(getattr(self, strAttr))):
+            await discover()
+            if (getattr(self, strAttr) != ''):
+                json_data = await fetch(getattr(self, strAttr))
+        return json_data
+
+    # Walk Chassis → Chassis/1u unless the Thermal and Power links are known
+    async def discoverChassis(self):
+        if (self.urlThermal == '' or self.urlPower == ''):
+            await self.getChassis()
+            await self.getChassis1u()
+
+    # Walk Systems → Systems/0 unless a link of Systems/0 is known
+    async def discoverSystems(self):
+        if ((self.urlBios, self.urlProcessors, self.urlSimpleStorage, self.urlMemory,
+             self.urlEthernetInterfaces, self.urlLogServices) == ('',) * 6):
+            await self.getSystems()
+            await self.getSystems0()
+
+    # Walk down to LogServices/Log unless the Entries link is known
+    async def discoverLogEntries(self):
+        if (self.urlLogEntries == ''):
+            await self.discoverSystems()
+            await self.getSystems0LogServices()
+            await self.getSystems0LogServicesLog()
+
+    # Get Chassis
+    async def getChassis(self):
+        json_data = await self.getJson("/redfish/v1/Chassis")
+        self.url = ''
+        if (json_data != None):
+            self.url = parsers.parseFirstMember(json_data)
+            self.logger.info("Next link=%s", self.url)
+
+    # Get Chassis/1u and return parsers.parseChassis() of it or None
+    async def getChassis1u(self):
+        dictChassis = None
+        if (self.url != ''):
+            json_data = await self.getJson(self.url)
+            if (json_data != None):
+                dictChassis = parsers.parseChassis(json_data)
+                self.urlThermal = dictChassis['Thermal']
+                self.urlPower = dictChassis['Power']
+                self.logger.info("Thermal self.url=%s", self.urlThermal)
+                self.logger.info("Power self.url=%s", self.urlPower)
+                self.saveLinks()
+        return dictChassis
+
+    # Get Chassis/1u/Thermal
+    async def getChassis1uThermal(self, bSelect=False):
+        dictThermal = None
+        if (self.urlThermal != ''):
+            json_data = await self.fetchLink(
+                'urlThermal', lambda url: self.getSelected(
+                    url, parsers.THERMAL_SELECT if bSelect else None), self.discoverChassis)
+            if (json_data != None):
+                dictThermal = parsers.parseThermal(json_data)
+                if (self.bLogItems):
+                    for reading in dictThermal['Temperatures']:
+                        self.logger.debug(
+                            "SensorName: %s = %s °C", reading.name, reading.readingCelsius)
+                    for reading in dictThermal['Fans']:
+                        self.logger.info(
+                            "SensorName: %s=%s RPM", reading.name, reading.reading)
+        return dictThermal
+
+    # Get Chassis/1u/Power
+    async def getChassis1uPower(self, bSelect=False):
+        dictPower = None
+        if (self.urlPower != ''):
+            json_data = await self.fetchLink(
+                'urlPower', lambda url: self.getSelected(
+                    url, parsers.POWER_SELECT if bSelect else None), self.discoverChassis)
+            if (json_data != None):
+                dictPower = parsers.parsePower(json_data)
+                if (self.bLogItems):
+                    for reading in dictPower['Voltages']:
+                        self.logger.info(
+                            "SensorName: %s=%s V(DC)", reading.name, reading.readingVolts)
+                    for reading in dictPower['PowerSupplies']:
+                        self.logger.info(
+                            "SensorName: %s=%s V(AC)", reading.name, reading.lineInputVoltage)
+        return dictPower
+
+    # Get Systems
+    async def getSystems(self):
+        json_data = await self.getJson("/redfish/v1/Systems")
+        self.url = ''
+        if (json_data != None):
+            self.url = parsers.parseFirstMember(json_data)
+            self.logger.info("Next link=%s", self.url)
+
+    # Get Systems/0 and return parsers.parseSystem() of it
+    async def getSystems0(self):
+        dictSystem = None
+        if (self.url != ''):
+            json_data = await self.getJson(self.url)
+            if (json_data != None):
+                dictSystem = parsers.parseSystem(json_data)
+                self.strPowerState = dictSystem['PowerState']
+                self.urlReset = dictSystem['Reset']
+                self.urlBios = dictSystem['Bios']
+                self.urlProcessors = dictSystem['Processors']
+                self.urlSimpleStorage = dictSystem['SimpleStorage']
+                self.urlMemory = dictSystem['Memory']
+                self.urlEthernetInterfaces = dictSystem['EthernetInterfaces']
+                self.urlLogServices = dictSystem['LogServices']
+                for key in parsers.SYSTEM_LINKS:
+                    self.logger.info("Next link=%s", dictSystem[key])
+                self.saveLinks()
+        return dictSystem
+
+    # Add the $expand query to a collection url when the BMC supports it
+    def expandURL(self, url):
+        strExpand = ''
+        if (self.bExpand):
+            strExpand = parsers.parseExpandQuery(self.dictProtocolFeatures)
+        if (strExpand == '' or url == ''):
+            return url
+        return url + ('&' if '?' in url else '?') + strExpand
+
+    # GET a resource of Systems/0 and log its properties
+    async def getSystems0Resource(self, url):
+        json_data = self.dictExpanded.get(url)
+        if (json_data == None):
+            json_data = await self.getJson(url)
+        if (json_data != None and self.get_logVerbose() >= 1):
+            self.logItems(json_data)
+        return json_data
+
+    # Yield every member of every page of the collection url; the next page
+    # is fetched while the current one is consumed (see collection.py)
+    async def iterCollection(self, url, nPageSize=None):
+        nPageSize = nPageSize or self.nPageSize
+        bTopSkip = bool(nPageSize) and parsers.parseTopSkipQuery(self.dictProtocolFeatures)
+        base = self.expandURL(url)
+
+        def pageURL(nSkip):
+            return base + ('&' if '?' in base else '?') + parsers.topSkipQuery(nPageSize, nSkip)
+
+        url = pageURL(0) if bTopSkip else base
+        setSeen = set([url])
+        nMembers = 0
+        nCount = None
+        task = None
+        try:
+            json_data = await self.getJson(url)
+            while (json_data != None):
+                lstMember = json_data.get('Members', [])
+                nMembers += len(lstMember)
+                if (nCount == None):
+                    nCount = json_data.get('Members@odata.count')
+                url = parsers.parseNextLink(json_data)
+                if (url == '' and bTopSkip and len(lstMember) >= nPageSize and
+                        (nCount == None or nMembers < nCount)):
+                    url = pageURL(nMembers)
+                if (url in setSeen):
+                    self.logger.warning("Page %s already read, stop", url)
+                    url = ''
+                setSeen.add(url)
+                if (url != ''):
+                    task = asyncio.ensure_future(self.getJson(url))
+                json_data = None
+                for member in lstMember:
+                    yield member
+                if (task != None):
+                    json_data, task = await task, None
+        finally:
+            if (task != None):
+                task.cancel()
+
+    # GET a collection of Systems/0, page by page, and keep its member links
+    async def getSystems0Collection(self, url):
+        lstURL = []
+        dictExpanded = {}
+        async for member in self.iterCollection(url):
+            link = member.get('@odata.id', '')
+            if (link != ''):
+                lstURL.append(link)
+                if (len(member) > 1):
+                    dictExpanded[link] = member
+        if (self.get_logVerbose() >= 1):
+            for link in lstURL:
+                self.logger.info("Next link=%s", link)
+        self.nCount = len(lstURL)
+        self.lstURL = lstURL
+        # Members that came back inline are served without another GET
+        self.dictExpanded = dictExpanded
+        return lstURL
+
+    # GET url unless it came back inline in the last collection
+    async def getMember(self, url):
+        json_data = self.dictExpanded.get(url)
+        if (json_data == None):
+            json_data = await self.getJson(url, log=False)
+        return json_data
+
+    # Await fetch(arg) for every arg of lstArg, at most nConcurrency
+    # (default self.nConcurrency) at once, and return the results in order
+    async def mapLimited(self, fetch, lstArg, nConcurrency=None):
+        semaphore = asyncio.Semaphore(max(1, nConcurrency or self.nConcurrency))
+
+        async def fetchOne(arg):
+            async with semaphore:
+                return await fetch(arg)
+
+        return await asyncio.gather(*[fetchOne(arg) for arg in lstArg])
+
+    # GET every member link of the last collection, nConcurrency at once,
+    # and return parse() of each member (None for non-200 responses)
+    async def getMembers(self, nLogVerbose=1, parse=None, nConcurrency=None):
+        lstJson = await self.mapLimited(self.getMember, self.lstURL[:self.nCount], nConcurrency)
+        if (self.get_logVerbose() >= nLogVerbose):
+            for json_data in lstJson:
+                if (json_data != None):
+                    self.logItems(json_data)
+        if (parse == None):
+            return lstJson
+        return [None if json_data == None else parse(json_data) for json_data in lstJson]
+
+    # Get Systems/0/Bios and return parsers.parseBios() of it
+    async def getSystems0Bios(self):
+        json_data = None
+        if (self.urlBios != ''):
+            json_data = await self.fetchLink('urlBios', self.getSystems0Resource,
+                                             self.discoverSystems)
+        return None if json_data == None else parsers.parseBios(json_data)
+
+    # Get Systems/0/Processors
+    async def getSystems0Processors(self):
+        json_data = None
+        if (self.urlProcessors != ''):
+            json_data = await self.fetchLink(
+                'urlProcessors', lambda url: self.getSystems0Resource(self.expandURL(url)),
+                self.discoverSystems)
+        self.url = ''
+        if (json_data != None):
+            self.dictExpanded = parsers.parseExpandedMembers(json_data)
+            self.url = parsers.parseFirstMember(json_data)
+            self.logger.info("Next link=%s", self.url)
+
+    # Get Systems/0/Processors/CPU0 and return parsers.parseProcessor() of it
+    async def getSystems0ProcessorsCPU0(self):
+        json_data = None
+        if (self.url != ''):
+            json_data = await self.getSystems0Resource(self.url)
+        return None if json_data == None else parsers.parseProcessor(json_data)
+
+    # Get Systems/0/SimpleStorage
+    async def getSystems0SimpleStorage(self):
+        if (self.urlSimpleStorage != ''):
+            await self.fetchLink('urlSimpleStorage', self.getSystems0Collection, self.discoverSystems)
+
+    # Get Systems/0/SimpleStorage/*
+    async def getSystems0SimpleStorageAll(self):
+        return await self.getMembers(parse=parsers.parseStorage)
+
+    # Get Systems/0/Memory
+    async def getSystems0Memory(self):
+        if (self.urlMemory != ''):
+            await self.fetchLink('urlMemory', self.getSystems0Collection, self.discoverSystems)
+
+    # Get Systems/0/Memory/*
+    async def getSystems0MemoryAll(self):
+        return await self.getMembers(parse=parsers.parseMemory)
+
+    # Get Systems/0/EthernetInterfaces
+    async def getSystems0EthernetInterfaces(self):
+        if (self.urlEthernetInterfaces != ''):
+            await self.fetchLink('urlEthernetInterfaces', self.getSystems0Collection, self.discoverSystems)
+
+    # Get Systems/0/EthernetInterfaces/*
+    async def getSystems0EthernetInterfacesAll(self):
+        return await self.getMembers(parse=parsers.parseEthernetInterface)
+
+    # Get Systems/0/LogServices
+    async def getSystems0LogServices(self):
+        if (self.urlLogServices != ''):
+            await self.fetchLink('urlLogServices', self.getSystems0Collection, self.discoverSystems)
+
+    # Get Systems/0/LogServices/Log and return parsers.parseLogService() of
+    # every log service
+    async def getSystems0LogServicesLog(self):
+        self.urlLogEntries = ''
+        lstLogService = []
+        for url in self.lstURL[:self.nCount]:
+            json_data = await self.getSystems0Resource(url)
+            if (json_data != None):
+                logService = parsers.parseLogService(json_data)
+                lstLogService.append(logService)
+                if (logService.entries != ''):
+                    self.urlLogEntries = logService.entries
+                    self.logger.info("Next link=%s", self.urlLogEntries)
+        self.saveLinks()
+        return lstLogService
+
+    # Get Systems/0/LogServices/Log/Entries and Entries/* and return
+    # parsers.parseLogEntry() of every entry
+    async def getSystems0LogServicesLogEntries(self, nConcurrency=None):
+        self.lstURL = []
+        self.nCount = 0
+        urlLogEntries = self.urlLogEntries
+        if (urlLogEntries != ''):
+            lstURL = await self.getSystems0Collection(urlLogEntries)
+            if (not lstURL and self.isStaleLink(urlLogEntries)):
+                await self.discoverLogEntries()
+                return await self.getSystems0LogServicesLogEntries(nConcurrency)
+            self.logger.info("Number of LogServicesLogEntries %d", self.nCount)
+        return await self.getMembers(2, parsers.parseLogEntry, nConcurrency)
+
+    # GET url and return the response before its body is read
+    async def openStream(self, url, headers):
+        attempts = RequestAttempts(self, "GET", url, bRetry=False)
+        delay = attempts.begin()
+        try:
+            if (delay > 0):
+                await asyncio.sleep(delay)
+            if (self.limiter != None):
+                await acquireSlot(self.limiter)
+            attempts.sending()
+            stream = await self.pool.stream("GET", url, None, headers)
+        except BaseException as e:
+            attempts.failed(e)
+            raise
+        attempts.answered(stream)
+        return stream
+
+    # GET the collection url and yield each member as soon as it is parsed
+    async def streamMembers(self, url, parse=None, dictProperties=None):
+        """GET a collection and parse its Members incrementally from the socket
+
+        See redfish_advantech.streamMembers; this is an async generator.
+
+        :param url: The collection link (with $expand for inline members).
+        :type url: str
+        :param parse: Turns each member into the yielded value, e.g.
+                      parsers.parseLogEntry (default the member document).
+        :type parse: callable
+        :param dictProperties: Filled with the other top level properties
+                               of the collection.
+        :type dictProperties: dict
+
+        """
+        self.connect()
+        self.logger.info("--> rfRequest [GET %s] (streamed)", url)
+        headers = makeHeaders(self.authToken, "GET", url, self.bGzip)
+        stream = await self.openStream(url, headers)
+        if (stream.status in (401, 403) and
+                await self.reauthenticate(headers.get('X-Auth-Token'), stream.status)):
+            stream.close()
+            headers['X-Auth-Token'] = self.authToken
+            self.logger.info("Replay [GET %s] with the new session", url)
+            stream = await self.openStream(url, headers)
+        self.nLastStatus = stream.status
+        async with stream:
+            if (stream.status != 200):
+                self.logger.info("response.status(reason)=%d(%s)",
+                                 stream.status, stream.reason)
+                return
+            parser = jsonstream.MembersParser(self.jsonBackend)
+            async for chunk in stream.iterChunks():
+                for json_data in parser.feed(chunk):
+                    yield json_data if parse == None else parse(json_data)
+            parser.close()
+            self.nBytes += stream.nBytes
+            self.nWireBytes += stream.nWireBytes
+        if (dictProperties != None):
+            dictProperties.update(parser.dictProperties)
+        self.logger.debug("%d members streamed", parser.nMembers)
+
+    # Yield every entry of Systems/0/LogServices/Log/Entries as it arrives;
+    # see redfish_advantech.iterSystems0LogServicesLogEntries
+    async def iterSystems0LogServicesLogEntries(self, nConcurrency=None):
+        urlLogEntries = self.urlLogEntries
+        if (urlLogEntries == ''):
+            return
+        lstURL = []
+        url = self.expandURL(urlLogEntries)
+        setSeen = set()
+        while (url != '' and url not in setSeen):
+            setSeen.add(url)
+            dictProperties = {}
+            members = self.streamMembers(url, dictProperties=dictProperties)
+            try:
+                async for json_data in members:
+                    if (len(json_data) > 1):
+                        yield parsers.parseLogEntry(json_data)
+                    elif (json_data.get('@odata.id', '') != ''):
+                        lstURL.append(json_data['@odata.id'])
+            finally:
+                # Give the connection back now if the caller stops early
+                await members.aclose()
+            if (len(setSeen) == 1 and self.isStaleLink(urlLogEntries)):
+                await self.discoverLogEntries()
+                async for entry in self.iterSystems0LogServicesLogEntries(nConcurrency):
+                    yield entry
+                return
+            url = parsers.parseNextLink(dictProperties)
+        nBatch = max(1, nConcurrency or self.nConcurrency)
+        for i in range(0, len(lstURL), nBatch):
+            lstJson = await self.mapLimited(lambda url: self.getJson(url, log=False),
+                                            lstURL[i:i + nBatch], nConcurrency)
+            for json_data in lstJson:
+                if (json_data != None):
+                    yield parsers.parseLogEntry(json_data)
+
+    # GET a collection and its members, nConcurrency at once; return
+    # [(member link, member document)] of the members that could be fetched
+    async def fetchCollection(self, url, nConcurrency=None):
+        json_data = None
+        if (url != ''):
+            json_data = await self.getJson(self.expandURL(url))
+        if (json_data == None):
+            return []
+        nCount, lstURL = parsers.parseMembers(json_data)
+        lstURL = [url for url in lstURL[:nCount] if url != '']
+        dictExpanded = parsers.parseExpandedMembers(json_data)
+
+        async def fetchOne(url):
+            if (url in dictExpanded):
+                return dictExpanded[url]
+            return await self.getJson(url, log=False)
+
+        lstJson = await self.mapLimited(fetchOne, lstURL, nConcurrency)
+        return [(url, json_data) for url, json_data in zip(lstURL, lstJson)
+                if json_data != None]
+
+    # GET every member of a collection and return {member id: parse(member)}
+    async def fetchCollectionById(self, url, parse, nConcurrency=None):
+        dictMember = {}
+        for urlMember, json_data in await self.fetchCollection(url, nConcurrency):
+            dictMember[parsers.parseMemberId(json_data, urlMember)] = parse(json_data)
+        return dictMember
+
+    # Run process(url, json_data) on every member, nConcurrency at once, and
+    # return {member id: result}
+    async def processMembers(self, lstMember, process, nConcurrency=None):
+        lstResult = await self.mapLimited(lambda member: process(*member), lstMember,
+                                          nConcurrency)
+        return dict((parsers.parseMemberId(json_data, url), result)
+                    for (url, json_data), result in zip(lstMember, lstResult))
+
+    # Get Thermal and Power of every chassis; see redfish_advantech.getChassisAll
+    async def getChassisAll(self, bSelect=False, nConcurrency=None):
+        async def processChassis(url, json_data):
+            dictChassis = {}
+            for key, parse, lstSelect in (('Thermal', parsers.parseThermal, parsers.THERMAL_SELECT),
+                                          ('Power', parsers.parsePower, parsers.POWER_SELECT)):
+                urlSensors = parsers.parseLink(json_data, key)
+                json_sensors = None
+                if (urlSensors != ''):
+                    json_sensors = await self.getSelected(urlSensors,
+                                                          lstSelect if bSelect else None)
+                dictChassis[key] = None if json_sensors == None else parse(json_sensors)
+            return dictChassis
+
+        return await self.processMembers(
+            await self.fetchCollection("/redfish/v1/Chassis", nConcurrency), processChassis,
+            nConcurrency)
+
+    # Get the inventory of every system; see redfish_advantech.getSystemsAll
+    async def getSystemsAll(self, nConcurrency=None):
+        async def processSystem(url, json_data):
+            dictSystem = parsers.parseSystem(json_data)
+            json_bios = None
+            if (dictSystem['Bios'] != ''):
+                json_bios = await self.getJson(dictSystem['Bios'])
+            lstDict = await asyncio.gather(
+                self.fetchCollectionById(dictSystem['Processors'], parsers.parseProcessor,
+                                         nConcurrency),
+                self.fetchCollectionById(dictSystem['Memory'], parsers.parseMemory,
+                                         nConcurrency),
+                self.fetchCollectionById(dictSystem['SimpleStorage'], parsers.parseStorage,
+                                         nConcurrency),
+                self.fetchCollectionById(dictSystem['EthernetInterfaces'],
+                                         parsers.parseEthernetInterface, nConcurrency))
+            return {'System': dictSystem,
+                    'Bios': None if json_bios == None else parsers.parseBios(json_bios),
+                    'Processors': lstDict[0],
+                    'Memory': lstDict[1],
+                    'SimpleStorage': lstDict[2],
+                    'EthernetInterfaces': lstDict[3]}
+
+        return await self.processMembers(
+            await self.fetchCollection("/redfish/v1/Systems", nConcurrency), processSystem,
+            nConcurrency)
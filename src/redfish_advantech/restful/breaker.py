@@ -0,0 +1,145 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Per-BMC circuit breakers shared by every client of the process."""
+
+# ---------Imports---------
+import time
+import logging
+import threading
+# ---------End of imports---------
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:
+    """Circuit breaker of one BMC
+
+    closed: requests go through; nFailureThreshold consecutive failures
+    open the circuit.  open: requests fail fast until resetTimeout seconds
+    have passed.  half-open: up to nHalfOpenProbes requests probe the BMC;
+    a success closes the circuit and a failure opens it again.
+
+    :param strHost: The "hostname:port" of the BMC.
+    :type strHost: str
+    :param nFailureThreshold: The consecutive failures that open the circuit.
+    :type nFailureThreshold: int
+    :param resetTimeout: Seconds an open circuit waits before probing.
+    :type resetTimeout: float
+    :param nHalfOpenProbes: The probes allowed at once when half-open.
+    :type nHalfOpenProbes: int
+
+    """
+
+    def __init__(self, strHost, nFailureThreshold=5, resetTimeout=30, nHalfOpenProbes=1):
+        self.strHost = strHost
+        self.nFailureThreshold = max(1, nFailureThreshold)
+        self.resetTimeout = resetTimeout
+        self.nHalfOpenProbes = max(1, nHalfOpenProbes)
+        self.logger = logging.getLogger('simpleExample')
+        self.__lock = threading.Lock()
+        self.strState = CLOSED
+        self.nFailures = 0
+        self.nProbes = 0
+        self.openedAt = 0.0
+        self.nRejected = 0
+
+    def getState(self):
+        """Return CLOSED, OPEN or HALF_OPEN (an expired OPEN reads HALF_OPEN)"""
+        with self.__lock:
+            if (self.strState == OPEN and
+                    time.monotonic() - self.openedAt >= self.resetTimeout):
+                return HALF_OPEN
+            return self.strState
+
+    def allow(self):
+        """Return True if a request may be sent to the BMC now
+
+        Every allowed request must be followed by recordSuccess(),
+        recordFailure() or cancel().
+        """
+        with self.__lock:
+            if (self.strState == OPEN):
+                if (time.monotonic() - self.openedAt < self.resetTimeout):
+                    self.nRejected += 1
+                    return False
+                self.strState = HALF_OPEN
+                self.nProbes = 0
+                self.logger.info("Circuit of %s is half-open", self.strHost)
+            if (self.strState == HALF_OPEN):
+                if (self.nProbes >= self.nHalfOpenProbes):
+                    self.nRejected += 1
+                    return False
+                self.nProbes += 1
+            return True
+
+    def cancel(self):
+        """The allowed request was not sent (no free connection): give its
+        half-open probe back without judging the BMC"""
+        with self.__lock:
+            if (self.strState == HALF_OPEN and self.nProbes > 0):
+                self.nProbes -= 1
+
+    def recordSuccess(self):
+        """The BMC answered"""
+        with self.__lock:
+            if (self.strState != CLOSED):
+                self.logger.info("Circuit of %s is closed", self.strHost)
+            self.strState = CLOSED
+            self.nFailures = 0
+            self.nProbes = 0
+
+    def recordFailure(self):
+        """The BMC could not be reached or did not answer in time"""
+        with self.__lock:
+            self.nFailures += 1
+            if (self.strState == HALF_OPEN or self.nFailures >= self.nFailureThreshold):
+                if (self.strState != OPEN):
+                    self.logger.warning("Circuit of %s is open after %d failure(s)",
+                                        self.strHost, self.nFailures)
+                self.strState = OPEN
+                self.openedAt = time.monotonic()
+                self.nProbes = 0
+
+    def reset(self):
+        """Close the circuit and forget the failures"""
+        self.recordSuccess()
+
+
+# The breakers of every BMC of the process, keyed by "hostname:port"
+_dictBreaker = {}
+_lock = threading.Lock()
+
+
+def getBreaker(hostname, port, **kwargs):
+    """Return the circuit breaker of hostname:port, creating it with kwargs
+
+    The first client of a BMC creates its breaker; a later one asking for
+    other thresholds gets the existing breaker and a warning.
+    """
+    strHost = "%s:%s" % (hostname, port)
+    with _lock:
+        if (strHost not in _dictBreaker):
+            _dictBreaker[strHost] = CircuitBreaker(strHost, **kwargs)
+            return _dictBreaker[strHost]
+        breaker = _dictBreaker[strHost]
+    wanted = CircuitBreaker(strHost, **kwargs)
+    lstConflict = ["%s=%s (asked %s)" % (key, getattr(breaker, key), getattr(wanted, key))
+                   for key in ('nFailureThreshold', 'resetTimeout', 'nHalfOpenProbes')
+                   if getattr(breaker, key) != getattr(wanted, key)]
+    if (lstConflict):
+        breaker.logger.warning("Circuit breaker of %s already exists with %s",
+                               strHost, ", ".join(lstConflict))
+    return breaker
+
+
+def getBreakerStates():
+    """Return {"hostname:port": state} of every known BMC"""
+    with _lock:
+        lstBreaker = list(_dictBreaker.values())
+    return dict((breaker.strHost, breaker.getState()) for breaker in lstBreaker)
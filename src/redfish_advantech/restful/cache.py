@@ -0,0 +1,239 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Response caches of the Advantech BMC Redfish clients."""
+
+# ---------Imports---------
+import re
+import time
+import threading
+from collections import OrderedDict
+# ---------End of imports---------
+
+# Default TTL policy of ResponseCache: (path regex, seconds); None keeps the
+# entry until a mutating request invalidates it, 0 does not cache the path.
+DEFAULT_POLICY = (
+    (r'^/redfish/v1/?$', 86400),
+    (r'^/redfish/v1/(OData|\$metadata)$', 86400),
+    (r'/PrivilegeMap$', 86400),
+    (r'/Thermal$', 5),
+    (r'/Power$', 5),
+    (r'/Bios$', None),
+    (r'/Processors/[^/]+$', 3600),
+    (r'/Memory/[^/]+$', 3600),
+)
+
+
+class ETagCache:
+    """Conditional GET cache keyed by URI
+
+    Keeps the ETag and the response of every 200 GET that carried an ETag.
+    The next GET of the same URI is sent with If-None-Match; when the BMC
+    answers 304 the cached response, including the object its json() has
+    already parsed, is served instead.  Treat cached documents as read-only.
+
+    nHit counts GETs sent with a validator, nMiss GETs sent without one and
+    nNotModified the 304s served from the cache.
+
+    :param nMaxEntries: The maximum number of cached URIs; the least
+                        recently used one is dropped first.
+    :type nMaxEntries: int
+
+    """
+
+    def __init__(self, nMaxEntries=1024):
+        self.nMaxEntries = max(1, nMaxEntries)
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()    # {url: (etag, response)}
+        self.nHit = 0
+        self.nMiss = 0
+        self.nNotModified = 0
+
+    def getValidator(self, url):
+        """Return the ETag to send as If-None-Match for url or None"""
+        with self.__lock:
+            entry = self.__entries.get(url)
+            if (entry == None):
+                self.nMiss += 1
+                return None
+            self.__entries.move_to_end(url)
+            self.nHit += 1
+            return entry[0]
+
+    def store(self, url, response):
+        """Keep a 200 response of url if it carries an ETag"""
+        etag = response.getheader('ETag')
+        with self.__lock:
+            if (response.getcode() != 200 or etag == None):
+                self.__entries.pop(url, None)
+                return
+            self.__entries[url] = (etag, response)
+            self.__entries.move_to_end(url)
+            while (len(self.__entries) > self.nMaxEntries):
+                self.__entries.popitem(last=False)
+
+    def notModified(self, url):
+        """Return the cached response of url after a 304 or None"""
+        with self.__lock:
+            entry = self.__entries.get(url)
+            if (entry == None):
+                return None
+            self.nNotModified += 1
+            return entry[1]
+
+    def invalidate(self, url=None):
+        """Drop the entry of url, or every entry when url is None"""
+        with self.__lock:
+            if (url == None):
+                self.__entries.clear()
+            else:
+                self.__entries.pop(url, None)
+
+    def getStats(self):
+        """Return the counters as a dict"""
+        with self.__lock:
+            return {'entries': len(self.__entries), 'hit': self.nHit,
+                    'miss': self.nMiss, 'notModified': self.nNotModified}
+
+
+class ResponseCache:
+    """Bounded TTL + LRU cache of GET responses keyed by (host, URI)
+
+    The TTL of a URI is the one of the first policy whose regex matches its
+    path; paths without a policy get defaultTTL.  Entries are dropped least
+    recently used first once nMaxEntries or nMaxBytes of bodies are exceeded.
+    A POST, PATCH, PUT or DELETE to a URI invalidates the resource it acts
+    on (the part before /Actions/), everything below it and its parent.
+
+    One instance can be shared by several clients and threads; treat cached
+    documents as read-only.
+
+    :param nMaxEntries: The maximum number of cached responses.
+    :type nMaxEntries: int
+    :param nMaxBytes: The maximum total size of the cached bodies.
+    :type nMaxBytes: int
+    :param policy: list of (path regex, TTL seconds or None); defaults to
+                   DEFAULT_POLICY.
+    :type policy: list
+    :param defaultTTL: The TTL of paths that match no policy (0: not cached).
+    :type defaultTTL: float
+
+    """
+
+    def __init__(self, nMaxEntries=1024, nMaxBytes=16 * 1024 * 1024,
+                 policy=None, defaultTTL=0):
+        self.nMaxEntries = max(1, nMaxEntries)
+        self.nMaxBytes = nMaxBytes
+        self.lstPolicy = [(re.compile(pattern), ttl) for pattern, ttl in
+                          (DEFAULT_POLICY if policy == None else policy)]
+        self.defaultTTL = defaultTTL
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()    # {(host, url): (expires, size, response)}
+        self.nBytes = 0
+        self.nHit = 0
+        self.nMiss = 0
+        self.nEvicted = 0
+        self.nInvalidated = 0
+
+    @staticmethod
+    def __path(url):
+        return url.split('?', 1)[0].rstrip('/') or '/'
+
+    def getTTL(self, url):
+        """Return the TTL of url: seconds, None (until invalidated) or 0"""
+        path = self.__path(url)
+        for pattern, ttl in self.lstPolicy:
+            if (pattern.search(path)):
+                return ttl
+        return self.defaultTTL
+
+    def setPolicy(self, pattern, ttl):
+        """Put a (path regex, TTL) policy in front of the others"""
+        with self.__lock:
+            self.lstPolicy.insert(0, (re.compile(pattern), ttl))
+
+    def __drop(self, key):
+        _, size, _ = self.__entries.pop(key)
+        self.nBytes -= size
+
+    def get(self, host, url):
+        """Return the cached response of url on host or None"""
+        key = (host, url)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if (entry != None and entry[0] != None and entry[0] <= time.monotonic()):
+                self.__drop(key)
+                entry = None
+            if (entry == None):
+                self.nMiss += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.nHit += 1
+            return entry[2]
+
+    def put(self, host, url, response):
+        """Keep a 200 response of url on host as its TTL policy says"""
+        if (response.getcode() != 200):
+            return
+        ttl = self.getTTL(url)
+        size = response.nBytes
+        if (ttl == 0 or size > self.nMaxBytes):
+            return
+        key = (host, url)
+        expires = None if ttl == None else time.monotonic() + ttl
+        with self.__lock:
+            if (key in self.__entries):
+                self.__drop(key)
+            self.__entries[key] = (expires, size, response)
+            self.nBytes += size
+            while (len(self.__entries) > self.nMaxEntries or self.nBytes > self.nMaxBytes):
+                self.__drop(next(iter(self.__entries)))
+                self.nEvicted += 1
+
+    def invalidate(self, host=None, url=None, bPrefix=False):
+        """Drop cached responses
+
+        :param host: Only drop the entries of this host (None: every host).
+        :param url: Only drop the entries of this URI (None: every URI).
+        :param bPrefix: Also drop every URI below url.
+        :type bPrefix: bool
+        :returns: the number of dropped entries
+
+        """
+        path = None if url == None else self.__path(url)
+        with self.__lock:
+            lstKey = []
+            for key in self.__entries:
+                if (host != None and key[0] != host):
+                    continue
+                if (path != None):
+                    keyPath = self.__path(key[1])
+                    if (keyPath != path and
+                            not (bPrefix and keyPath.startswith(path + '/'))):
+                        continue
+                lstKey.append(key)
+            for key in lstKey:
+                self.__drop(key)
+            self.nInvalidated += len(lstKey)
+            return len(lstKey)
+
+    def invalidateFor(self, host, method, url):
+        """Drop the entries a mutating request to url may have made stale"""
+        if (method not in ('POST', 'PATCH', 'PUT', 'DELETE')):
+            return 0
+        path = self.__path(url).split('/Actions/', 1)[0]
+        nDropped = self.invalidate(host, path, bPrefix=True)
+        parent = path.rsplit('/', 1)[0]
+        if (parent != ''):
+            nDropped += self.invalidate(host, parent)
+        return nDropped
+
+    def getStats(self):
+        """Return the counters as a dict"""
+        with self.__lock:
+            return {'entries': len(self.__entries), 'bytes': self.nBytes,
+                    'hit': self.nHit, 'miss': self.nMiss,
+                    'evicted': self.nEvicted, 'invalidated': self.nInvalidated}
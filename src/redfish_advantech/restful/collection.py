@@ -0,0 +1,129 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Lazy iterator over the members of a paged Redfish collection."""
+
+# ---------Imports---------
+import logging
+from concurrent.futures import ThreadPoolExecutor
+# ---------End of imports---------
+
+from redfish_advantech.restful import parsers
+
+
+class CollectionIterator:
+    """Iterate over the members of a collection, page by page
+
+    The next page is the Members@odata.nextLink of the current one.  When
+    nPageSize is given and the BMC supports $top/$skip, the collection is
+    also paged on the client side, nPageSize members per request, for BMCs
+    that return the whole collection at once.  While the caller consumes
+    a page the next one is already being fetched (bPrefetch).
+
+    Members@odata.count is kept in nCount but never trusted: the walk ends
+    when a page has no next page (it only saves the request of an empty
+    last $top/$skip page).
+
+    :param client: A logged-in redfish_advantech.
+    :type client: redfish_advantech
+    :param strName: The name logged with each page request.
+    :type strName: str
+    :param url: The collection link (with $expand for inline members).
+    :type url: str
+    :param nPageSize: The members per page requested with $top/$skip
+                      (None to only follow nextLink).
+    :type nPageSize: int
+    :param bPrefetch: Fetch the next page while the current one is consumed.
+    :type bPrefetch: bool
+    :param nLogVerbose: The log verbose level from which each page's body
+                        is logged.
+    :type nLogVerbose: int
+
+    """
+
+    def __init__(self, client, strName, url, nPageSize=None, bPrefetch=True, nLogVerbose=2):
+        self.client = client
+        self.strName = strName
+        self.url = url
+        self.nPageSize = nPageSize
+        self.bPrefetch = bPrefetch
+        self.nLogVerbose = nLogVerbose
+        self.bTopSkip = bool(nPageSize) and parsers.parseTopSkipQuery(
+            client.dictProtocolFeatures)
+        self.logger = logging.getLogger('simpleExample')
+        self.dictProperties = {}
+        self.nCount = None
+        self.nPages = 0
+        self.nMembers = 0
+
+    def __iter__(self):
+        return self.iterMembers()
+
+    # Return url with the $top/$skip query of the page starting at nSkip
+    def pageURL(self, nSkip):
+        return self.url + ('&' if '?' in self.url else '?') + parsers.topSkipQuery(
+            self.nPageSize, nSkip)
+
+    def getPage(self, url):
+        """GET one page and return its parsed body or None"""
+        return self.client.getResource(self.strName, url, self.nLogVerbose)
+
+    def getNextURL(self, json_data, nSkip):
+        """Return the link of the page after json_data or ''"""
+        url = parsers.parseNextLink(json_data)
+        if (url != ''):
+            return url
+        if (self.bTopSkip and len(json_data.get('Members', [])) >= self.nPageSize and
+                (self.nCount == None or nSkip < self.nCount)):
+            return self.pageURL(nSkip)
+        return ''
+
+    def iterMembers(self):
+        """Yield every member of every page in collection order
+
+        A page that cannot be fetched ends the walk; a nextLink already
+        visited ends it too instead of looping.
+
+        :returns: generator of the member documents (or {'@odata.id': ...}
+                  links when the BMC did not expand them)
+
+        """
+        url = self.pageURL(0) if self.bTopSkip else self.url
+        setSeen = set([url])
+        executor = ThreadPoolExecutor(max_workers=1) if self.bPrefetch else None
+        future = None
+        try:
+            json_data = self.getPage(url)
+            while (json_data != None):
+                self.nPages += 1
+                if (self.nPages == 1):
+                    self.nCount = json_data.get('Members@odata.count')
+                    self.dictProperties = dict(
+                        (key, value) for key, value in json_data.items() if key != 'Members')
+                lstMember = json_data.get('Members', [])
+                self.nMembers += len(lstMember)
+                url = self.getNextURL(json_data, self.nMembers)
+                if (url in setSeen):
+                    self.logger.warning("%s: page %s already read, stop", self.strName, url)
+                    url = ''
+                setSeen.add(url)
+                if (url != '' and executor != None):
+                    future = executor.submit(self.getPage, url)
+                json_data = None
+                for member in lstMember:
+                    yield member
+                if (url == ''):
+                    break
+                if (future != None):
+                    json_data, future = future.result(), None
+                else:
+                    json_data = self.getPage(url)
+            if (self.nCount != None and self.nCount != self.nMembers):
+                self.logger.info("%s: %d members read, Members@odata.count is %d",
+                                 self.strName, self.nMembers, self.nCount)
+        finally:
+            if (executor != None):
+                executor.shutdown(wait=True)
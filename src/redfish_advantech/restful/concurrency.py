@@ -0,0 +1,172 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Per-BMC adaptive (AIMD) limits of the requests in flight."""
+
+# ---------Imports---------
+import time
+import threading
+import collections
+# ---------End of imports---------
+
+
+class AdaptiveLimiter:
+    """Limit of the requests in flight to one BMC, adjusted by AIMD
+
+    Every request that completes in time while the limit is in use (as
+    many requests in flight as the limit allows) adds 1/limit to it, so it
+    grows by about one per round of requests (additive increase); a client
+    that never fills the limit, for example because its connection pool is
+    smaller, does not raise it.  An error (connection failure, timeout,
+    502/503/504) or a latency above latencyFactor times the fastest one
+    seen multiplies it by decrease (multiplicative decrease), at most once
+    per cooldown so one slow burst is not punished several times.
+
+    :param nInitial: The limit to start from.
+    :type nInitial: int
+    :param nMin: The lowest limit.
+    :type nMin: int
+    :param nMax: The highest limit.
+    :type nMax: int
+    :param decrease: The factor the limit is multiplied by on congestion.
+    :type decrease: float
+    :param latencyFactor: A latency this many times the fastest one seen
+                          counts as congestion.
+    :type latencyFactor: float
+
+    """
+
+    def __init__(self, nInitial=2, nMin=1, nMax=16, decrease=0.5, latencyFactor=4.0):
+        self.nMin = max(1, nMin)
+        self.nMax = max(self.nMin, nMax)
+        self.limit = float(min(self.nMax, max(self.nMin, nInitial)))
+        self.decrease = decrease
+        self.latencyFactor = latencyFactor
+        self.__cond = threading.Condition()
+        self.__waiters = collections.deque()    # wake() of acquireOrWait()
+        self.nInFlight = 0
+        self.minLatency = None
+        self.latency = 0.0
+        self.lastDecrease = 0.0
+        self.nIncreases = 0
+        self.nDecreases = 0
+
+    def getLimit(self):
+        """Return the current whole number of requests allowed in flight"""
+        return int(self.limit)
+
+    def tryAcquire(self):
+        """Take a slot if one is free and return True, else return False"""
+        with self.__cond:
+            if (self.nInFlight >= int(self.limit)):
+                return False
+            self.nInFlight += 1
+            return True
+
+    def acquire(self):
+        """Take a slot, blocking while the limit is reached"""
+        with self.__cond:
+            while (self.nInFlight >= int(self.limit)):
+                self.__cond.wait()
+            self.nInFlight += 1
+
+    def acquireOrWait(self, wake):
+        """Take a slot if one is free and no one waits, else queue wake
+
+        The waiters are handed the freed slots in the order they came:
+        release(), whatever thread it runs in, takes the slot for the first
+        waiter and calls its wake(), which returns False if the waiter is
+        gone so the slot goes to the next one.  This is how the asyncio
+        client (asyncapi.acquireSlot) waits without blocking its loop.
+
+        :param wake: Called without arguments once the slot is taken.
+        :type wake: callable
+        :returns: True if the slot was taken now, False if wake was queued
+
+        """
+        with self.__cond:
+            if (not self.__waiters and self.nInFlight < int(self.limit)):
+                self.nInFlight += 1
+                return True
+            self.__waiters.append(wake)
+            return False
+
+    def cancelWait(self, wake):
+        """Drop a wake queued by acquireOrWait()
+
+        :returns: True if it was still queued, False if it has already
+                  been handed a slot (give it back with cancel())
+
+        """
+        with self.__cond:
+            if (wake in self.__waiters):
+                self.__waiters.remove(wake)
+                return True
+            return False
+
+    def cancel(self):
+        """Give a slot back without a latency to adjust the limit with"""
+        with self.__cond:
+            self.nInFlight -= 1
+            self.__wakeWaiters()
+
+    # Hand the free slots to the waiters queued first; holds __cond
+    def __wakeWaiters(self):
+        while (self.__waiters and self.nInFlight < int(self.limit)):
+            wake = self.__waiters.popleft()
+            self.nInFlight += 1
+            if (not wake()):
+                self.nInFlight -= 1
+        self.__cond.notify_all()
+
+    def release(self, latency, bError=False):
+        """Give the slot back and adjust the limit
+
+        :param latency: The seconds the request took.
+        :type latency: float
+        :param bError: True if the request failed or the BMC was overloaded.
+        :type bError: bool
+
+        """
+        with self.__cond:
+            bInUse = (self.nInFlight >= int(self.limit))
+            self.nInFlight -= 1
+            now = time.monotonic()
+            bSlow = False
+            if (not bError):
+                self.latency = latency if self.latency == 0.0 else 0.8 * self.latency + 0.2 * latency
+                if (self.minLatency == None or latency < self.minLatency):
+                    self.minLatency = latency
+                bSlow = (latency > self.minLatency * self.latencyFactor and latency > 0.05)
+            if (bError or bSlow):
+                if (now - self.lastDecrease > max(self.latency, 0.1)):
+                    self.limit = max(self.nMin, self.limit * self.decrease)
+                    self.lastDecrease = now
+                    self.nDecreases += 1
+            elif (bInUse and self.limit < self.nMax):
+                self.limit = min(self.nMax, self.limit + 1.0 / self.limit)
+                self.nIncreases += 1
+            self.__wakeWaiters()
+
+
+# The limiters of every BMC of the process, keyed by "hostname:port"
+_dictLimiter = {}
+_lock = threading.Lock()
+
+
+def getLimiter(hostname, port, **kwargs):
+    """Return the adaptive limiter of hostname:port, creating it with kwargs"""
+    strHost = "%s:%s" % (hostname, port)
+    with _lock:
+        if (strHost not in _dictLimiter):
+            _dictLimiter[strHost] = AdaptiveLimiter(**kwargs)
+        return _dictLimiter[strHost]
+
+
+def getConcurrencyLimits():
+    """Return {"hostname:port": current limit} of every known BMC"""
+    with _lock:
+        return dict((strHost, limiter.getLimit()) for strHost, limiter in _dictLimiter.items())
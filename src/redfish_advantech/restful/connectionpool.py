@@ -0,0 +1,379 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Bounded keep-alive HTTPS connection pool for one Advantech BMC."""
+
+# ---------Imports---------
+import time
+import zlib
+import select
+import logging
+import threading
+import http.client
+# ---------End of imports---------
+
+
+# Bytes read from the socket at once while decompressing a body
+CHUNK_SIZE = 65536
+
+# Methods a BMC may receive twice without harm, the only ones replayed
+# after a reused connection turned out to be closed
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'PUT', 'DELETE')
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection could be checked out of the pool in time."""
+    pass
+
+
+class DecompressResponseError(Exception):
+    """Raised when decompressing response failed."""
+    pass
+
+
+class GzipDecoder:
+    """Decompress a gzip body chunk by chunk as it is read from the socket
+
+    The compressed body is never held whole: each chunk is inflated as it
+    arrives and only the decompressed chunks are kept.  nWireBytes counts
+    the compressed bytes fed.
+
+    """
+
+    def __init__(self):
+        self.__decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self.__lstChunk = []
+        self.nWireBytes = 0
+
+    def decompress(self, chunk):
+        """Return the decompressed bytes of one chunk of the body"""
+        self.nWireBytes += len(chunk)
+        try:
+            return self.__decompressor.decompress(chunk)
+        except zlib.error as e:
+            raise DecompressResponseError("Corrupt gzip body: %s" % e) from e
+
+    def iterDecompress(self, chunk):
+        """Yield the decompressed bytes of one chunk in pieces of at most
+        CHUNK_SIZE, so a highly compressed chunk is never inflated at once"""
+        self.nWireBytes += len(chunk)
+        try:
+            while True:
+                data = self.__decompressor.decompress(chunk, CHUNK_SIZE)
+                chunk = self.__decompressor.unconsumed_tail
+                if (data):
+                    yield data
+                if (not chunk and len(data) < CHUNK_SIZE):
+                    return
+        except zlib.error as e:
+            raise DecompressResponseError("Corrupt gzip body: %s" % e) from e
+
+    def flush(self):
+        """Return the last decompressed bytes once every chunk has been fed"""
+        try:
+            data = self.__decompressor.flush()
+        except zlib.error as e:
+            raise DecompressResponseError("Corrupt gzip body: %s" % e) from e
+        if (not self.__decompressor.eof):
+            raise DecompressResponseError(
+                "Truncated gzip body after %d bytes" % self.nWireBytes)
+        return data
+
+    def feed(self, chunk):
+        """Decompress one chunk of the body and keep it"""
+        self.__lstChunk.append(self.decompress(chunk))
+
+    def finish(self):
+        """Return the decompressed body once every chunk has been fed"""
+        self.__lstChunk.append(self.flush())
+        return b''.join(self.__lstChunk)
+
+
+def isGzip(headers):
+    """Return True if the response headers say the body is gzip encoded"""
+    return (headers.get('Content-Encoding') or '').strip().lower() in ('gzip', 'x-gzip')
+
+
+def readBody(response):
+    """Read the whole body of an http.client response, decompressing gzip
+
+    :returns: tuple of (body bytes, bytes read from the socket)
+
+    """
+    if (not isGzip(response.headers)):
+        data = response.read()
+        return (data, len(data))
+    decoder = GzipDecoder()
+    while True:
+        chunk = response.read(CHUNK_SIZE)
+        if (not chunk):
+            break
+        decoder.feed(chunk)
+    return (decoder.finish(), decoder.nWireBytes)
+
+
+class StreamedResponse:
+    """A response whose body is read chunk by chunk by the caller
+
+    The connection stays checked out of the pool until the body has been
+    read to the end (it is then reused) or close() is called (it is then
+    closed, since the rest of the body is still on the socket).
+
+    """
+
+    def __init__(self, pool, conn, response):
+        self.pool = pool
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self.nBytes = 0
+        self.nWireBytes = 0
+        self.__conn = conn
+        self.__response = response
+
+    def iterChunks(self):
+        """Yield the (decompressed) body in chunks as it is read"""
+        decoder = GzipDecoder() if isGzip(self.headers) else None
+        try:
+            while True:
+                chunk = self.__response.read(CHUNK_SIZE)
+                if (not chunk):
+                    break
+                if (decoder == None):
+                    self.nWireBytes += len(chunk)
+                    self.nBytes += len(chunk)
+                    yield chunk
+                    continue
+                for data in decoder.iterDecompress(chunk):
+                    self.nBytes += len(data)
+                    yield data
+            if (decoder != None):
+                chunk = decoder.flush()
+                self.nWireBytes = decoder.nWireBytes
+                self.nBytes += len(chunk)
+                if (chunk):
+                    yield chunk
+        except BaseException:
+            self.close()
+            raise
+        self.__release(not self.__response.will_close)
+
+    def read(self):
+        """Return the rest of the body"""
+        return b''.join(self.iterChunks())
+
+    def __release(self, bReuse):
+        if (self.__conn != None):
+            conn, self.__conn = self.__conn, None
+            self.pool.putConnection(conn, bReuse)
+
+    def close(self):
+        """Give the connection back; closed unless the body was read to the end"""
+        self.__release(False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class HTTPSConnectionPool:
+    """Bounded pool of keep-alive HTTPS connections to one BMC
+
+    Connections are created lazily up to nMaxConnections.  Idle connections
+    are kept (LIFO, so the warmest TLS session is reused first) and checked
+    for health before they are handed out again.
+
+    :param hostname: The BMC host name or IP address.
+    :type hostname: str
+    :param port: The BMC HTTPS port.
+    :type port: int
+    :param timeout: The socket timeout of every connection in seconds.
+    :type timeout: float
+    :param nMaxConnections: The maximum number of open connections.
+    :type nMaxConnections: int
+    :param idleTimeout: Idle connections older than this (seconds) are closed
+                        instead of being reused.
+    :type idleTimeout: float
+    :param poolTimeout: Seconds request() and stream() wait for a free
+                        connection before raising PoolTimeoutError (timeout
+                        if None).
+    :type poolTimeout: float
+
+    """
+
+    def __init__(self, hostname, port, timeout=10, nMaxConnections=4,
+                 idleTimeout=30, logger=None, poolTimeout=None):
+        self.hostname = hostname
+        self.port = port
+        self.timeout = timeout
+        self.poolTimeout = timeout if poolTimeout is None else poolTimeout
+        self.nMaxConnections = max(1, nMaxConnections)
+        self.idleTimeout = idleTimeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.__lock = threading.Condition()
+        self.__idle = []    # [(connection, time returned to the pool)]
+        self.__nOpen = 0
+        self.__closed = False
+        self.nCreated = 0
+        self.nReused = 0
+        self.nReconnects = 0
+
+    def __newConnection(self):
+        self.nCreated += 1
+        self.logger.debug("Start the http connection [%s:%s] (%d/%d)",
+                          self.hostname, self.port, self.__nOpen, self.nMaxConnections)
+        return http.client.HTTPSConnection(self.hostname, self.port,
+                                           timeout=self.timeout)
+
+    def __isHealthy(self, conn, idleSince):
+        """Return False if an idle connection must not be reused"""
+        if (time.monotonic() - idleSince > self.idleTimeout):
+            return False
+        sock = conn.sock
+        if (sock is None):
+            # Never connected or closed by http.client; it reconnects itself.
+            return True
+        try:
+            # An idle keep-alive socket must not be readable: readable means
+            # the BMC has closed it (EOF) or sent something unexpected.
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def getConnection(self, timeout=None):
+        """Check a connection out of the pool, blocking while all are busy
+
+        :param timeout: Seconds to wait for a free connection (None waits forever).
+        :type timeout: float
+        :returns: http.client.HTTPSConnection
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.__lock:
+            while True:
+                if (self.__closed):
+                    raise PoolTimeoutError("Connection pool is closed")
+                while self.__idle:
+                    conn, idleSince = self.__idle.pop()
+                    if (self.__isHealthy(conn, idleSince)):
+                        self.nReused += 1
+                        return conn
+                    self.logger.debug("Drop stale http connection [%s:%s]",
+                                      self.hostname, self.port)
+                    conn.close()
+                    self.__nOpen -= 1
+                if (self.__nOpen < self.nMaxConnections):
+                    self.__nOpen += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if (remaining is not None and remaining <= 0):
+                    raise PoolTimeoutError(
+                        "No free connection to %s:%s" % (self.hostname, self.port))
+                self.__lock.wait(remaining)
+        try:
+            return self.__newConnection()
+        except Exception:
+            with self.__lock:
+                self.__nOpen -= 1
+                self.__lock.notify()
+            raise
+
+    def putConnection(self, conn, bReuse=True):
+        """Return a connection to the pool
+
+        :param conn: The connection got from getConnection().
+        :param bReuse: False to close the connection instead of keeping it idle.
+        :type bReuse: bool
+
+        """
+        with self.__lock:
+            if (bReuse and not self.__closed):
+                self.__idle.append((conn, time.monotonic()))
+            else:
+                conn.close()
+                self.__nOpen -= 1
+            self.__lock.notify()
+
+    def __send(self, method, url, body, headers):
+        """Send the request and read the status line and headers
+
+        A reused connection the BMC has silently closed fails before any
+        status is read; the request is then replayed once on a fresh
+        connection, but only if method is idempotent.
+
+        :returns: tuple of (connection, http.client.HTTPResponse)
+
+        """
+        conn = self.getConnection(self.poolTimeout)
+        bFresh = (conn.sock is None)
+        while True:
+            try:
+                conn.request(method, url, body, headers or {})
+                return conn, conn.getresponse()
+            # BadStatusLine is what an empty status line raises before
+            # Python 3.5, and the base of its RemoteDisconnected
+            except (http.client.BadStatusLine, BrokenPipeError,
+                    ConnectionResetError, ConnectionAbortedError) as e:
+                conn.close()
+                if (bFresh or method.upper() not in IDEMPOTENT_METHODS):
+                    self.putConnection(conn, False)
+                    raise
+                self.nReconnects += 1
+                self.logger.info("Reconnect [%s:%s] after %s",
+                                 self.hostname, self.port, type(e).__name__)
+                bFresh = True
+            except BaseException:
+                self.putConnection(conn, False)
+                raise
+
+    def request(self, method, url, body=None, headers=None):
+        """Send one request on a pooled connection and read the whole response
+
+        An idempotent request sent on a reused connection that the BMC has
+        silently closed is replayed once on a fresh connection; a failure
+        while the body is read is never replayed.  A gzip encoded body is
+        decompressed while it is read (see readBody).
+
+        :returns: tuple of (status, reason, headers, body bytes, bytes read
+                  from the socket)
+        :raises PoolTimeoutError: if no connection is free within poolTimeout.
+
+        """
+        conn, response = self.__send(method, url, body, headers)
+        try:
+            data, nWireBytes = readBody(response)
+        except BaseException:
+            self.putConnection(conn, False)
+            raise
+        self.putConnection(conn, not response.will_close)
+        return (response.status, response.reason, response.headers, data, nWireBytes)
+
+    def stream(self, method, url, body=None, headers=None):
+        """Send one request and return the response before its body is read
+
+        The request is replayed like request().  The caller reads the body
+        with iterChunks() and must close() the StreamedResponse if it stops
+        early; until then the connection is not back in the pool.
+
+        :returns: StreamedResponse
+        :raises PoolTimeoutError: if no connection is free within poolTimeout.
+
+        """
+        conn, response = self.__send(method, url, body, headers)
+        return StreamedResponse(self, conn, response)
+
+    def close(self):
+        """Close every idle connection; busy ones are closed when returned"""
+        with self.__lock:
+            self.__closed = True
+            while self.__idle:
+                conn, _ = self.__idle.pop()
+                conn.close()
+                self.__nOpen -= 1
+            self.__lock.notify_all()
@@ -0,0 +1,129 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Breadth-first crawler of the whole Redfish tree of one BMC."""
+
+# ---------Imports---------
+import re
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+# ---------End of imports---------
+
+from redfish_advantech.restful import parsers
+
+# Paths not crawled unless lstExclude is given: schema files, message
+# registries and the (thousands of) members of the log entry collections
+DEFAULT_EXCLUDE = (
+    r'^/redfish/v1/JsonSchemas/',
+    r'^/redfish/v1/Registries/',
+    r'/Entries/[^/]+$',
+)
+
+
+class Crawler:
+    """Follow every @odata.id link of a BMC breadth-first from the root
+
+    Every link is fetched once.  A link is followed when it matches none of
+    lstExclude, and its document is yielded when it also matches one of
+    lstInclude (if given): the include patterns pick what is returned but
+    the crawl still goes through the documents that do not match, so
+    '/Thermal$' finds every Thermal under the chassis.  The patterns are
+    regular expressions searched in the path.  Up to nConcurrency GETs are
+    in flight at once, on the connection pool of the client.
+
+    :param client: A logged-in redfish_advantech.
+    :type client: redfish_advantech
+    :param lstInclude: Only yield documents whose link matches one of
+                       these patterns.
+    :type lstInclude: list
+    :param lstExclude: Never follow links matching one of these patterns
+                       (default DEFAULT_EXCLUDE).
+    :type lstExclude: list
+    :param nMaxDepth: The maximum number of links from the root to a
+                      crawled document (None for no limit).
+    :type nMaxDepth: int
+    :param nConcurrency: The maximum number of GETs in flight (default
+                         client.nConcurrency).
+    :type nConcurrency: int
+    :param strRoot: The link the crawl starts from.
+    :type strRoot: str
+
+    """
+
+    def __init__(self, client, lstInclude=None, lstExclude=None, nMaxDepth=None,
+                 nConcurrency=None, strRoot='/redfish/v1'):
+        self.client = client
+        self.lstInclude = [re.compile(pattern) for pattern in lstInclude or []]
+        self.lstExclude = [re.compile(pattern) for pattern in
+                           (DEFAULT_EXCLUDE if lstExclude == None else lstExclude)]
+        self.nMaxDepth = nMaxDepth
+        self.nConcurrency = max(1, nConcurrency or client.nConcurrency)
+        self.strRoot = strRoot
+        self.logger = logging.getLogger('simpleExample')
+        self.dictFailed = {}
+        self.nFetched = 0
+
+    def isFollowed(self, url):
+        """Return True if url matches none of the exclude patterns"""
+        path = url.split('?')[0]
+        return not any(pattern.search(path) for pattern in self.lstExclude)
+
+    def isIncluded(self, url):
+        """Return True if the document of url is yielded by crawl()"""
+        path = url.split('?')[0]
+        return (not self.lstInclude or
+                any(pattern.search(path) for pattern in self.lstInclude))
+
+    def fetch(self, url):
+        """GET url and return the parsed document or None"""
+        try:
+            response = self.client.rfRequest(False, "GET", url)
+        except Exception as e:
+            self.logger.warning("Crawl [GET %s] failed: %s", url, e)
+            self.dictFailed[url] = e
+            return None
+        if (response.getcode() != 200):
+            self.dictFailed[url] = response.getcode()
+            return None
+        return response.json()
+
+    def crawl(self):
+        """Crawl the tree and yield each (uri, document) as it arrives
+
+        Documents that could not be fetched are not yielded; dictFailed
+        keeps their status code or exception.  Stopping the iteration
+        stops the crawl once the GETs in flight have completed.
+
+        :returns: generator of (uri, dict)
+
+        """
+        setSeen = set([self.strRoot])
+        queue = deque([(self.strRoot, 0)])
+        dictFuture = {}
+        with ThreadPoolExecutor(max_workers=self.nConcurrency) as executor:
+            try:
+                while (queue or dictFuture):
+                    while (queue and len(dictFuture) < self.nConcurrency):
+                        url, nDepth = queue.popleft()
+                        dictFuture[executor.submit(self.fetch, url)] = (url, nDepth)
+                    setDone = wait(dictFuture, return_when=FIRST_COMPLETED)[0]
+                    for future in setDone:
+                        url, nDepth = dictFuture.pop(future)
+                        json_data = future.result()
+                        if (json_data == None):
+                            continue
+                        self.nFetched += 1
+                        if (self.nMaxDepth == None or nDepth < self.nMaxDepth):
+                            for link in parsers.parseAllLinks(json_data):
+                                if (link not in setSeen and self.isFollowed(link)):
+                                    setSeen.add(link)
+                                    queue.append((link, nDepth + 1))
+                        if (self.isIncluded(url)):
+                            yield (url, json_data)
+            finally:
+                for future in dictFuture:
+                    future.cancel()
@@ -0,0 +1,253 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Run a resource walk across many Advantech BMCs on a thread pool."""
+
+# ---------Imports---------
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+# ---------End of imports---------
+
+from redfish_advantech.restful import parsers
+from redfish_advantech.restful import breaker
+from redfish_advantech.restful import ratelimit
+from redfish_advantech.restful import concurrency
+from redfish_advantech.restful.v1api import redfish_advantech
+
+
+# GET url with client and return the parsed body of a 200 response or None
+def getJson(client, url, lstSelect=None):
+    if (url == ''):
+        return None
+    response = client.get(url, lstSelect=lstSelect)
+    if (response.getcode() == 200):
+        return response.json()
+    return None
+
+
+# Walk Chassis → Chassis/1u → Thermal (straight to Thermal if its link is known)
+def walkThermal(client):
+    client.discoverChassis()
+    json_data = client.fetchLink(
+        'urlThermal', lambda url: getJson(client, url, parsers.THERMAL_SELECT),
+        client.discoverChassis)
+    return None if json_data == None else parsers.parseThermal(json_data)
+
+
+# Walk Chassis → Chassis/1u → Power (straight to Power if its link is known)
+def walkPower(client):
+    client.discoverChassis()
+    json_data = client.fetchLink(
+        'urlPower', lambda url: getJson(client, url, parsers.POWER_SELECT),
+        client.discoverChassis)
+    return None if json_data == None else parsers.parsePower(json_data)
+
+
+# Walk every chassis and return {chassis id: {'Thermal': ..., 'Power': ...}}
+def walkChassis(client):
+    return client.getChassisAll(bSelect=True)
+
+
+# Walk every system and return {system id: records of its Bios, Processors,
+# Memory, SimpleStorage and EthernetInterfaces}
+def walkInventory(client):
+    return client.getSystemsAll()
+
+
+# Walk Systems/0/LogServices/Log/Entries and return the record of every entry
+def walkLogEntries(client):
+    client.discoverLogEntries()
+    return client.getSystems0LogServicesLogEntries()
+
+
+# The walks that can be named in Fleet.run()
+WALKS = {'thermal': walkThermal,
+         'power': walkPower,
+         'chassis': walkChassis,
+         'inventory': walkInventory,
+         'logentries': walkLogEntries}
+
+
+class FleetResult:
+    """The outcome of one walk on one BMC
+
+    error is None when the walk succeeded, otherwise the exception it raised;
+    result is whatever the walk returned.  breakerState is the state of the
+    BMC's circuit breaker after the walk, for schedulers to skip or demote
+    hosts whose circuit is open, and nConcurrencyLimit its adaptive limit
+    of requests in flight (None without one).
+
+    """
+
+    def __init__(self, hostname, port, walk, result=None, error=None, elapsed=0.0):
+        self.hostname = hostname
+        self.port = port
+        self.walk = walk
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+        strHost = "%s:%s" % (hostname, port)
+        self.breakerState = breaker.getBreakerStates().get(strHost, breaker.CLOSED)
+        self.nConcurrencyLimit = concurrency.getConcurrencyLimits().get(strHost)
+
+    def ok(self):
+        """Return True if the walk succeeded"""
+        return self.error == None
+
+    def __repr__(self):
+        return "FleetResult(%s:%s %s %s %.2fs %s)" % (
+            self.hostname, self.port, self.walk,
+            "ok" if self.ok() else repr(self.error), self.elapsed, self.breakerState)
+
+
+class Fleet:
+    """Run a resource walk across many BMCs on a bounded thread pool
+
+    :param lstBMC: The BMCs, each a tuple of (hostname, port, username,
+                   password) or (hostname, port, (username, password)).
+    :type lstBMC: list
+    :param nMaxWorkers: The number of worker threads of the fleet.
+    :type nMaxWorkers: int
+    :param nPerBMC: The maximum number of concurrent walks and connections
+                    per BMC.
+    :type nPerBMC: int
+    :param nLogLevel: The log verbose level of every client.
+    :type nLogLevel: int
+    :param linkMap: The linkmap.LinkMap shared by every client, so later runs
+                    go straight to the links found by earlier ones.
+    :type linkMap: LinkMap
+    :param sessionStore: The sessionstore.SessionStore shared by every
+                         client, so sessions are reused instead of opened
+                         and closed on every run.
+    :type sessionStore: SessionStore
+    :param bLogItems: Log the properties of every document the walks read;
+                      the walks return them either way.
+    :type bLogItems: bool
+    :param bGzip: Ask every BMC for gzip encoded bodies.
+    :type bGzip: bool
+    :param jsonBackend: The JSON backend of every client (see jsonbackend).
+    :type jsonBackend: str
+    :param nPageSize: The members per $top/$skip page of every client.
+    :type nPageSize: int
+    :param nBreakerFailures: The failures in a row that open the circuit
+                             breaker of a BMC.
+    :type nBreakerFailures: int
+    :param breakerResetTimeout: Seconds an open circuit waits before the
+                                BMC is probed again.
+    :type breakerResetTimeout: float
+    :param bRateLimit: Limit the requests per second to each BMC.
+    :type bRateLimit: bool
+    :param rate: The requests per second allowed to each BMC.
+    :type rate: float
+    :param nBurst: The requests that may be sent to a BMC at once after a
+                   pause.
+    :type nBurst: int
+
+    """
+
+    def __init__(self, lstBMC, nMaxWorkers=32, nPerBMC=1, nLogLevel=0, linkMap=None,
+                 sessionStore=None, bLogItems=False, bGzip=False, jsonBackend='auto',
+                 nPageSize=None, nBreakerFailures=5, breakerResetTimeout=30,
+                 bRateLimit=False, rate=ratelimit.DEFAULT_RATE, nBurst=ratelimit.DEFAULT_BURST):
+        self.lstBMC = [self.__normalize(bmc) for bmc in lstBMC]
+        self.nMaxWorkers = max(1, nMaxWorkers)
+        self.nPerBMC = max(1, nPerBMC)
+        self.nLogLevel = nLogLevel
+        self.linkMap = linkMap
+        self.sessionStore = sessionStore
+        self.bLogItems = bLogItems
+        self.bGzip = bGzip
+        self.jsonBackend = jsonBackend
+        self.nPageSize = nPageSize
+        self.nBreakerFailures = nBreakerFailures
+        self.breakerResetTimeout = breakerResetTimeout
+        self.bRateLimit = bRateLimit
+        self.rate = rate
+        self.nBurst = nBurst
+        self.logger = logging.getLogger('simpleExample')
+        self.__lock = threading.Lock()
+        self.__dictSemaphore = {}
+
+    @staticmethod
+    def __normalize(bmc):
+        if (len(bmc) == 3):
+            return (bmc[0], bmc[1], bmc[2][0], bmc[2][1])
+        return tuple(bmc)
+
+    def __getSemaphore(self, hostname, port):
+        with self.__lock:
+            if ((hostname, port) not in self.__dictSemaphore):
+                self.__dictSemaphore[(hostname, port)] = threading.BoundedSemaphore(self.nPerBMC)
+            return self.__dictSemaphore[(hostname, port)]
+
+    # Logout without letting a failure hide the outcome of the walk
+    def logoutQuietly(self, client):
+        try:
+            client.logout()
+        except Exception as e:
+            self.logger.warning("Logout from %s:%s failed: %s",
+                                client.hostname, client.port, e)
+
+    def runOne(self, bmc, walk, strWalk):
+        """Run walk on one BMC and return its FleetResult; never raises"""
+        hostname, port, username, password = bmc
+        start = time.monotonic()
+        with self.__getSemaphore(hostname, port):
+            client = None
+            try:
+                client = redfish_advantech(hostname, port, username, password,
+                                           self.nLogLevel, nMaxConnections=self.nPerBMC,
+                                           linkMap=self.linkMap,
+                                           sessionStore=self.sessionStore,
+                                           bLogItems=self.bLogItems,
+                                           bGzip=self.bGzip,
+                                           jsonBackend=self.jsonBackend,
+                                           nPageSize=self.nPageSize,
+                                           nBreakerFailures=self.nBreakerFailures,
+                                           breakerResetTimeout=self.breakerResetTimeout,
+                                           bRateLimit=self.bRateLimit, rate=self.rate,
+                                           nBurst=self.nBurst)
+                client.getRedfishV1()
+                client.login()
+                try:
+                    result = walk(client)
+                finally:
+                    self.logoutQuietly(client)
+                return FleetResult(hostname, port, strWalk, result,
+                                   elapsed=time.monotonic() - start)
+            except Exception as e:
+                self.logger.error("Walk %s failed on %s:%s: %s",
+                                  strWalk, hostname, port, e)
+                return FleetResult(hostname, port, strWalk, error=e,
+                                   elapsed=time.monotonic() - start)
+            finally:
+                if (client != None):
+                    client.disconnect()
+
+    def run(self, walk):
+        """Run walk on every BMC and yield each FleetResult as it completes
+
+        A BMC that fails does not stop the others; its FleetResult carries
+        the error instead.
+
+        :param walk: A name of WALKS ('thermal', 'power', 'chassis',
+                     'inventory', 'logentries') or a callable taking a logged-in
+                     redfish_advantech and returning the result.
+        :returns: generator of FleetResult
+
+        """
+        if (callable(walk)):
+            strWalk = getattr(walk, '__name__', 'walk')
+        else:
+            strWalk = walk
+            walk = WALKS[walk]
+        with ThreadPoolExecutor(max_workers=self.nMaxWorkers) as executor:
+            lstFuture = [executor.submit(self.runOne, bmc, walk, strWalk)
+                         for bmc in self.lstBMC]
+            for future in as_completed(lstFuture):
+                yield future.result()
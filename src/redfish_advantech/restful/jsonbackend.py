@@ -0,0 +1,136 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""JSON decoders/encoders the clients can parse response bodies with
+
+Every backend has loads(bytes) -> object, raising ValueError on bad JSON,
+and dumps(object) -> bytes.  orjson, ujson and pysimdjson are used when
+installed; the stdlib json module is always available.
+"""
+
+# ---------Imports---------
+import json
+import importlib
+import threading
+# ---------End of imports---------
+
+# The backends tried by getBackend('auto'), fastest first
+AUTO_ORDER = ('orjson', 'simdjson', 'ujson', 'json')
+
+
+class JsonBackend:
+    """A named pair of loads/dumps functions
+
+    :param strName: The name of the backend ('orjson', 'json', ...).
+    :type strName: str
+    :param loads: Parse JSON bytes to Python objects.
+    :param dumps: Serialize Python objects to JSON bytes.
+
+    """
+
+    def __init__(self, strName, loads, dumps):
+        self.strName = strName
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return "JsonBackend(%s)" % self.strName
+
+    def loadsLenient(self, data):
+        """Parse JSON bytes that may not be valid UTF-8
+
+        Some BMCs put Latin-1 bytes in strings (b'\\xb0C' for a degree
+        sign); the strict decoders reject the whole body.  Such a body is
+        parsed again decoded with U+FFFD replacement characters, the way
+        the body has always been decoded for the log.
+
+        :param data: The JSON bytes.
+        :type data: bytes
+        :raises ValueError: if data is not JSON.
+
+        """
+        try:
+            return self.loads(data)
+        except ValueError:
+            try:
+                data.decode('utf-8')
+            except UnicodeDecodeError:
+                return self.loads(data.decode('utf-8', 'replace'))
+            raise
+
+
+# Build the backend of the stdlib json module
+def _makeJson():
+    return JsonBackend('json', json.loads, lambda obj: json.dumps(obj).encode())
+
+
+# Build the backend of orjson; it parses bytes and returns bytes itself
+def _makeOrjson():
+    orjson = importlib.import_module('orjson')
+    return JsonBackend('orjson', orjson.loads, orjson.dumps)
+
+
+# Build the backend of ujson
+def _makeUjson():
+    ujson = importlib.import_module('ujson')
+    return JsonBackend('ujson', ujson.loads, lambda obj: ujson.dumps(obj).encode())
+
+
+# Build the backend of pysimdjson; loads() returns plain dicts and lists
+def _makeSimdjson():
+    simdjson = importlib.import_module('simdjson')
+    return JsonBackend('simdjson', simdjson.loads, lambda obj: json.dumps(obj).encode())
+
+
+# Builders of the backends by name
+BACKENDS = {'json': _makeJson,
+            'orjson': _makeOrjson,
+            'ujson': _makeUjson,
+            'simdjson': _makeSimdjson}
+
+# The stdlib backend, used when a client does not name one
+STDLIB = _makeJson()
+
+_dictBackend = {'json': STDLIB}
+_lock = threading.Lock()
+
+
+def isAvailable(strName):
+    """Return True if the backend strName is installed"""
+    try:
+        getBackend(strName)
+    except ValueError:
+        return False
+    return True
+
+
+def getBackend(backend=None):
+    """Return the JsonBackend named backend
+
+    :param backend: A name of BACKENDS, 'auto' for the fastest one installed,
+                    None for the stdlib json, or a JsonBackend (returned as is).
+    :returns: JsonBackend
+    :raises ValueError: if the backend is unknown or not installed.
+
+    """
+    if (backend == None):
+        return STDLIB
+    if (isinstance(backend, JsonBackend)):
+        return backend
+    if (backend == 'auto'):
+        for strName in AUTO_ORDER:
+            if (isAvailable(strName)):
+                return getBackend(strName)
+    if (backend not in BACKENDS):
+        raise ValueError("Unknown JSON backend %r (one of %s or 'auto')" % (
+            backend, ", ".join(sorted(BACKENDS))))
+    with _lock:
+        if (backend not in _dictBackend):
+            try:
+                _dictBackend[backend] = BACKENDS[backend]()
+            except ImportError as e:
+                raise ValueError("JSON backend %r is not installed" % backend) from e
+        return _dictBackend[backend]
@@ -0,0 +1,187 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Incremental parser of the Members array of a Redfish collection
+
+A LogEntries collection fetched with $expand can be megabytes.  Instead
+of holding the whole body and its parsed tree, MembersParser is fed the
+body chunk by chunk as it is read from the socket and hands out each
+member as soon as its closing brace has arrived.  Only the member being
+read is buffered, so memory stays bounded by the largest member.
+"""
+
+# ---------Imports---------
+import re
+# ---------End of imports---------
+
+from redfish_advantech.restful import jsonbackend
+
+# A whole string, a structural character, or the quote of a string that
+# has not fully arrived yet (matched last)
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_TOKEN = re.compile(_STRING + rb'|[{}\[\],:]|"')
+# Inside the members only the brackets matter: skip everything up to the
+# next bracket outside of a string (or the quote of an unfinished string)
+_SKIP = re.compile(rb'(?:[^"{}\[\]]+|' + _STRING + rb')*')
+
+_QUOTE = ord('"')
+_OPEN = (ord('{'), ord('['))
+_CLOSE = (ord('}'), ord(']'))
+_BRACE = ord('{')
+_BRACKET = ord('[')
+_COLON = ord(':')
+_COMMA = ord(',')
+
+
+class MembersParser:
+    """Parse a collection document incrementally, member by member
+
+    feed() takes the next chunk of the body and returns the members it
+    completed.  The other top level properties (Members@odata.count,
+    Members@odata.nextLink, Name, ...) are parsed into dictProperties as
+    they complete, wherever they are placed around Members.
+
+    :param jsonBackend: The jsonbackend.JsonBackend each member is parsed
+                        with (stdlib json if None).
+    :type jsonBackend: JsonBackend
+    :param strKey: The top level array whose items are handed out.
+    :type strKey: str
+
+    """
+
+    def __init__(self, jsonBackend=None, strKey='Members'):
+        self.jsonBackend = jsonBackend or jsonbackend.STDLIB
+        self.strKey = strKey
+        self.dictProperties = {}
+        self.nMembers = 0
+        self.bDone = False
+        self.__buf = bytearray()
+        self.__pos = 0              # next byte of __buf to scan
+        self.__nDepth = 0
+        self.__bExpectKey = False   # the next top level string is a key
+        self.__key = None           # the top level key being read
+        self.__nValueStart = -1     # start of a top level value other than Members
+        self.__bMembers = False     # inside the Members array
+        self.__nMemberStart = -1    # start of the member being read
+
+    def __loads(self, start, end):
+        try:
+            return self.jsonBackend.loadsLenient(bytes(self.__buf[start:end]))
+        except ValueError as e:
+            raise ValueError("Bad JSON in the %s collection: %s" % (self.strKey, e)) from e
+
+    def __endValue(self, end):
+        if (self.__nValueStart >= 0):
+            self.dictProperties[self.__key] = self.__loads(self.__nValueStart, end)
+            self.__nValueStart = -1
+
+    def feed(self, chunk):
+        """Scan the next chunk of the body
+
+        :param chunk: The next bytes of the body.
+        :type chunk: bytes
+        :returns: list of the members completed by chunk
+        :raises ValueError: if the body is not a JSON object.
+
+        """
+        buf = self.__buf
+        buf += chunk
+        pos = self.__pos
+        lstMember = []
+        while True:
+            if (self.__nDepth > 2):
+                pos = _SKIP.match(buf, pos).end()
+                if (pos >= len(buf) or buf[pos] == _QUOTE):
+                    break   # the rest is in the next chunk
+                pos += 1
+                c = buf[pos - 1]
+            else:
+                match = _TOKEN.search(buf, pos)
+                if (match == None):
+                    pos = len(buf)
+                    break
+                if (match.end() - match.start() == 1 and buf[match.start()] == _QUOTE):
+                    pos = match.start()
+                    break   # the rest of the string is in the next chunk
+                pos = match.end()
+                c = buf[pos - 1]
+            if (c == _QUOTE):
+                if (self.__nDepth == 1 and self.__bExpectKey):
+                    self.__key = self.__loads(match.start(), pos)
+                    self.__bExpectKey = False
+            elif (c in _OPEN):
+                self.__nDepth += 1
+                if (self.__nDepth == 1):
+                    if (c != _BRACE):
+                        raise ValueError("A collection must be a JSON object")
+                    self.__bExpectKey = True
+                elif (self.__nDepth == 2 and c == _BRACKET and self.__key == self.strKey):
+                    self.__bMembers = True
+                    self.__nValueStart = -1
+                elif (self.__nDepth == 3 and self.__bMembers):
+                    self.__nMemberStart = pos - 1
+            elif (c in _CLOSE):
+                self.__nDepth -= 1
+                if (self.__nDepth == 2 and self.__nMemberStart >= 0):
+                    lstMember.append(self.__loads(self.__nMemberStart, pos))
+                    self.__nMemberStart = -1
+                    self.nMembers += 1
+                elif (self.__nDepth == 1 and self.__bMembers):
+                    self.__bMembers = False
+                elif (self.__nDepth == 0):
+                    self.__endValue(pos - 1)
+                    self.bDone = True
+            elif (self.__nDepth == 1):
+                if (c == _COLON):
+                    self.__nValueStart = pos
+                elif (c == _COMMA):
+                    self.__endValue(pos - 1)
+                    self.__bExpectKey = True
+        # Drop the bytes no longer needed so the buffer stays small
+        lstStart = [start for start in (self.__nValueStart, self.__nMemberStart) if start >= 0]
+        nKeep = min(lstStart + [pos])
+        if (nKeep > 0):
+            del buf[:nKeep]
+            pos -= nKeep
+            if (self.__nValueStart >= 0):
+                self.__nValueStart -= nKeep
+            if (self.__nMemberStart >= 0):
+                self.__nMemberStart -= nKeep
+        self.__pos = pos
+        return lstMember
+
+    def close(self):
+        """Check the whole body has been fed
+
+        :raises ValueError: if the body ended before the collection did.
+
+        """
+        if (not self.bDone):
+            raise ValueError("The %s collection ended after %d members" % (
+                self.strKey, self.nMembers))
+
+    def parse(self, chunks):
+        """Feed every chunk of chunks and yield each member as it completes
+
+        :param chunks: Iterable of the bytes of the body.
+        :returns: generator of the parsed members
+
+        """
+        for chunk in chunks:
+            for member in self.feed(chunk):
+                yield member
+        self.close()
+
+
+def iterMembers(chunks, jsonBackend=None, strKey='Members'):
+    """Yield each member of the collection body read as chunks
+
+    :param chunks: Iterable of the bytes of the body.
+    :param jsonBackend: The jsonbackend.JsonBackend to parse members with.
+    :returns: generator of the parsed members
+
+    """
+    return MembersParser(jsonBackend, strKey).parse(chunks)
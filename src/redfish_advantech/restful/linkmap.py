@@ -0,0 +1,103 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Persisted map of the links discovered on each Advantech BMC."""
+
+# ---------Imports---------
+import sqlite3
+import threading
+# ---------End of imports---------
+
+# The link attributes of redfish_advantech kept in the map
+LINK_KEYS = ("urlThermal", "urlPower", "urlBios", "urlProcessors",
+             "urlSimpleStorage", "urlMemory", "urlEthernetInterfaces",
+             "urlLogServices", "urlLogEntries")
+
+
+class LinkMap:
+    """SQLite database of the leaf links discovered on each BMC
+
+    The links are keyed by host, port and the UUID of the service root, so a
+    BMC that is replaced or re-flashed with a new UUID is discovered again.
+    Each link is a row of its own: put() only writes the links that changed,
+    and several threads and processes (for example a Fleet per cron job)
+    can share the database without overwriting each other's BMCs, like
+    sessionstore.SessionStore.
+
+    :param fname: The SQLite database file, or ':memory:' for a database
+                  private to this instance.
+    :type fname: str
+    :param timeout: Seconds to wait for another process holding the lock.
+    :type timeout: float
+
+    """
+
+    def __init__(self, fname='redfish_links.db', timeout=30):
+        self.fname = fname
+        self.timeout = timeout
+        self.__lock = threading.Lock()
+        # An in-memory database only lives as long as its connection
+        self.__db = None
+        if (fname == ':memory:'):
+            self.__db = sqlite3.connect(fname, timeout=timeout, check_same_thread=False)
+        db = self.__connect()
+        try:
+            with db:
+                db.execute("CREATE TABLE IF NOT EXISTS links ("
+                           "key TEXT NOT NULL, name TEXT NOT NULL, url TEXT NOT NULL, "
+                           "PRIMARY KEY (key, name))")
+        finally:
+            self.__close(db)
+
+    def __connect(self):
+        if (self.__db != None):
+            return self.__db
+        return sqlite3.connect(self.fname, timeout=self.timeout)
+
+    def __close(self, db):
+        if (db is not self.__db):
+            db.close()
+
+    @staticmethod
+    def makeKey(hostname, port, strUUID):
+        """Return the key of the BMC at hostname:port with service root UUID"""
+        return "%s:%s/%s" % (hostname, port, strUUID)
+
+    def get(self, key):
+        """Return the links kept for key ({} when unknown)"""
+        with self.__lock:
+            db = self.__connect()
+            try:
+                lstRow = db.execute("SELECT name, url FROM links WHERE key = ?",
+                                    (key,)).fetchall()
+            finally:
+                self.__close(db)
+        return dict(lstRow)
+
+    def put(self, key, dictLinks):
+        """Merge dictLinks into the links of key, writing only the changed ones"""
+        with self.__lock:
+            db = self.__connect()
+            try:
+                with db:
+                    dictOld = dict(db.execute("SELECT name, url FROM links WHERE key = ?",
+                                              (key,)).fetchall())
+                    lstRow = [(key, name, url) for name, url in dictLinks.items()
+                              if dictOld.get(name) != url]
+                    if (lstRow):
+                        db.executemany("INSERT OR REPLACE INTO links VALUES (?, ?, ?)", lstRow)
+            finally:
+                self.__close(db)
+
+    def forget(self, key):
+        """Drop the links of key so the BMC is discovered again"""
+        with self.__lock:
+            db = self.__connect()
+            try:
+                with db:
+                    db.execute("DELETE FROM links WHERE key = ?", (key,))
+            finally:
+                self.__close(db)
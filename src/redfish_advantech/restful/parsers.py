@@ -0,0 +1,389 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Parsers of Advantech BMC Redfish documents
+
+Shared by redfish_advantech and AsyncRedfishAdvantech so the blocking and
+the asyncio clients always extract the same links and readings.
+"""
+
+# ---------Imports---------
+from redfish_advantech.restful import records
+from redfish_advantech.restful.records import intern
+# ---------End of imports---------
+
+# Links followed from the service root
+ROOT_LINKS = ("OData", "SessionService", "AccountService", "EventService",
+              "Systems", "Chassis", "Managers", "Links")
+# Links followed from AccountService
+ACCOUNT_SERVICE_LINKS = ("Accounts", "Roles", "PrivilegeMap")
+# Links followed from EventService
+EVENT_SERVICE_LINKS = ("Subscriptions",)
+# Links followed from Chassis/1u
+CHASSIS_LINKS = ("Thermal", "Power")
+# Links followed from Systems/0, in the order of the original walk
+SYSTEM_LINKS = ("Bios", "Processors", "SimpleStorage", "Memory",
+                "EthernetInterfaces", "LogServices")
+# $select projections of the properties the sensor parsers read
+THERMAL_SELECT = ("Temperatures/Name", "Temperatures/ReadingCelsius", "Temperatures/Status",
+                  "Fans/Name", "Fans/Reading", "Fans/ReadingUnits", "Fans/Status")
+POWER_SELECT = ("Voltages/Name", "Voltages/ReadingVolts", "Voltages/Status",
+                "PowerSupplies/Name", "PowerSupplies/LineInputVoltage", "PowerSupplies/Status")
+
+
+def parseLink(json_data, key):
+    """Return the @odata.id of the json_data[key] navigation property
+
+    :param json_data: The parsed Redfish document.
+    :type json_data: dict
+    :param key: The name of the navigation property.
+    :type key: str
+    :returns: the link or '' if there is none
+
+    """
+    value = json_data.get(key)
+    if (isinstance(value, dict)):
+        return value.get('@odata.id', '')
+    return ''
+
+
+def parseLinks(json_data, keys):
+    """Return the links of the navigation properties named in keys
+
+    :returns: list of (key, link) in document order
+
+    """
+    lstLink = []
+    for key, value in json_data.items():
+        if (key in keys and isinstance(value, dict) and '@odata.id' in value):
+            lstLink.append((key, value['@odata.id']))
+    return lstLink
+
+
+def parseMembers(json_data):
+    """Return the member links of a Redfish collection
+
+    :returns: tuple of (Members@odata.count, list of member links)
+
+    """
+    lstURL = []
+    for member in json_data.get('Members', []):
+        if ('@odata.id' in member):
+            lstURL.append(member['@odata.id'])
+    return (json_data.get('Members@odata.count', len(lstURL)), lstURL)
+
+
+def parseNextLink(json_data):
+    """Return the Members@odata.nextLink of a collection page or ''"""
+    url = json_data.get('Members@odata.nextLink')
+    return url if isinstance(url, str) else ''
+
+
+def parseAllLinks(json_data):
+    """Return every @odata.id link a document refers to
+
+    Links of every depth are returned once, in document order, without
+    their '#/...' fragment; the document's own @odata.id is left out.
+
+    :returns: list of links
+
+    """
+    strSelf = json_data.get('@odata.id', '') if isinstance(json_data, dict) else ''
+    lstLink = []
+    setLink = set([strSelf.split('#')[0]])
+    lstValue = [json_data]
+    while (lstValue):
+        value = lstValue.pop()
+        if (isinstance(value, dict)):
+            link = value.get('@odata.id')
+            if (isinstance(link, str)):
+                link = link.split('#')[0]
+                if (link not in setLink):
+                    setLink.add(link)
+                    lstLink.append(link)
+            lstValue.extend(reversed(list(value.values())))
+        elif (isinstance(value, list)):
+            lstValue.extend(reversed(value))
+    return lstLink
+
+
+def parseExpandedMembers(json_data):
+    """Return the members of a collection fetched with $expand
+
+    :returns: dict of member link to member document; members that only
+              carry their @odata.id (not expanded) are left out
+
+    """
+    dictMember = {}
+    for member in json_data.get('Members', []):
+        if ('@odata.id' in member and len(member) > 1):
+            dictMember[member['@odata.id']] = member
+    return dictMember
+
+
+def parseExpandQuery(dictProtocolFeatures):
+    """Return the $expand query to fetch collection members inline or ''
+
+    :param dictProtocolFeatures: ProtocolFeaturesSupported of the service root.
+    :type dictProtocolFeatures: dict
+    :returns: '$expand=.($levels=1)', '$expand=.', '$expand=*' or ''
+
+    """
+    dictExpand = (dictProtocolFeatures or {}).get('ExpandQuery') or {}
+    if (dictExpand.get('NoLinks')):
+        strExpand = '$expand=.'
+    elif (dictExpand.get('ExpandAll')):
+        strExpand = '$expand=*'
+    else:
+        return ''
+    if (dictExpand.get('Levels')):
+        strExpand += '($levels=1)'
+    return strExpand
+
+
+def parseSelectQuery(dictProtocolFeatures):
+    """Return True if the service root advertises $select support"""
+    return bool((dictProtocolFeatures or {}).get('SelectQuery'))
+
+
+def parseTopSkipQuery(dictProtocolFeatures):
+    """Return True if the service root advertises $top/$skip support"""
+    return bool((dictProtocolFeatures or {}).get('TopSkipQuery'))
+
+
+def topSkipQuery(nTop, nSkip=0):
+    """Return the $top/$skip query of one page of a collection"""
+    if (nSkip == 0):
+        return '$top=%d' % nTop
+    return '$top=%d&$skip=%d' % (nTop, nSkip)
+
+
+def selectQuery(lstSelect):
+    """Return the $select query of the property paths in lstSelect"""
+    return '$select=' + ','.join(lstSelect)
+
+
+def selectProperties(json_data, lstSelect):
+    """Trim a parsed document to the property paths in lstSelect
+
+    Paths use '/' between a property and its sub-properties, as in
+    $select; sub-properties of an array apply to each element.  OData
+    annotations (@odata.id, @odata.type, ...) are always kept.
+
+    :param json_data: The parsed Redfish document (dict or list of dict).
+    :param lstSelect: The property paths, e.g. ("Fans/Name", "Fans/Reading").
+    :type lstSelect: list
+    :returns: a trimmed copy of json_data
+
+    """
+    dictTree = {}
+    for path in lstSelect:
+        node = dictTree
+        for name in path.split('/'):
+            node = node.setdefault(name, {})
+    return _selectTree(json_data, dictTree)
+
+
+def _selectTree(value, dictTree):
+    if (isinstance(value, list)):
+        return [_selectTree(item, dictTree) for item in value]
+    if (not isinstance(value, dict) or not dictTree):
+        return value
+    dictSelected = {}
+    for key, item in value.items():
+        if (key in dictTree):
+            dictSelected[key] = _selectTree(item, dictTree[key])
+        elif (key.startswith('@odata.')):
+            dictSelected[key] = item
+    return dictSelected
+
+
+def parseFirstMember(json_data):
+    """Return the link of the first member of a collection or ''"""
+    lstMember = json_data.get('Members') or [{}]
+    return lstMember[0].get('@odata.id', '')
+
+
+def parseSensors(lstSensor, key, record, keys=()):
+    """Return a record of every sensor that has the reading key
+
+    :param lstSensor: The sensor array, e.g. Thermal's Temperatures.
+    :type lstSensor: list
+    :param key: The property of the reading, e.g. 'ReadingCelsius'.
+    :type key: str
+    :param record: The records class, built as record(uri, Name, reading,
+                   *keys, Health).
+    :type record: type
+    :param keys: More properties of the sensor, between reading and Health.
+    :type keys: tuple
+    :returns: list of record
+
+    """
+    lstReading = []
+    for sensor in lstSensor or []:
+        if (key in sensor):
+            lstReading.append(record(
+                intern(sensor.get('@odata.id')), intern(sensor.get('Name')), sensor[key],
+                *[intern(sensor.get(name)) for name in keys],
+                intern(parseHealth(sensor))))
+    return lstReading
+
+
+def parseThermal(json_data):
+    """Return the readings of Chassis/{id}/Thermal
+
+    :returns: dict with 'Temperatures' [records.TemperatureReading] and
+              'Fans' [records.FanReading]
+
+    """
+    return {'Temperatures': parseSensors(json_data.get('Temperatures'), 'ReadingCelsius',
+                                         records.TemperatureReading),
+            'Fans': parseSensors(json_data.get('Fans'), 'Reading', records.FanReading,
+                                 ('ReadingUnits',))}
+
+
+def parsePower(json_data):
+    """Return the readings of Chassis/{id}/Power
+
+    :returns: dict with 'Voltages' [records.VoltageReading] and
+              'PowerSupplies' [records.PsuReading]
+
+    """
+    return {'Voltages': parseSensors(json_data.get('Voltages'), 'ReadingVolts',
+                                     records.VoltageReading),
+            'PowerSupplies': parseSensors(json_data.get('PowerSupplies'), 'LineInputVoltage',
+                                          records.PsuReading)}
+
+
+def parseSystem(json_data):
+    """Return PowerState, the SYSTEM_LINKS and the Reset target of Systems/{id}
+
+    :returns: dict with 'PowerState', one entry per SYSTEM_LINKS key and
+              'Reset' ('' when the system has no such link)
+
+    """
+    dictSystem = {'PowerState': json_data.get('PowerState', '')}
+    for key in SYSTEM_LINKS:
+        dictSystem[key] = parseLink(json_data, key)
+    dictReset = (json_data.get('Actions') or {}).get('#ComputerSystem.Reset') or {}
+    dictSystem['Reset'] = dictReset.get('target', '')
+    return dictSystem
+
+
+def parseChassis(json_data):
+    """Return Id, Name, ChassisType, Health and the CHASSIS_LINKS of Chassis/{id}
+
+    :returns: dict with 'Id', 'Name', 'ChassisType', 'Health' and one entry
+              per CHASSIS_LINKS key ('' when the chassis has no such link)
+
+    """
+    dictChassis = {'Id': json_data.get('Id'),
+                   'Name': json_data.get('Name'),
+                   'ChassisType': json_data.get('ChassisType'),
+                   'Health': parseHealth(json_data)}
+    for key in CHASSIS_LINKS:
+        dictChassis[key] = parseLink(json_data, key)
+    return dictChassis
+
+
+def parseMemberId(json_data, url):
+    """Return the Id of a collection member, else the last segment of url"""
+    return intern(json_data.get('Id') or url.split('?')[0].rstrip('/').split('/')[-1])
+
+
+def parseHealth(json_data):
+    """Return Status/Health of a resource or ''"""
+    return (json_data.get('Status') or {}).get('Health', '')
+
+
+def parseRecord(json_data, keys, record):
+    """Return record(@odata.id, json_data[key] of each of keys, Health)
+
+    String properties are interned, since the same models, vendors and
+    states repeat across the fleet.
+
+    """
+    return record(intern(json_data.get('@odata.id')),
+                  *[intern(json_data.get(key)) for key in keys],
+                  intern(parseHealth(json_data)))
+
+
+def parseBios(json_data):
+    """Return Id, AttributeRegistry and the Attributes of Systems/{id}/Bios"""
+    return {'Id': json_data.get('Id'),
+            'AttributeRegistry': json_data.get('AttributeRegistry'),
+            'Attributes': dict(json_data.get('Attributes') or {})}
+
+
+def parseProcessor(json_data):
+    """Return the records.Processor of Systems/{id}/Processors/{id}"""
+    return parseRecord(json_data, ('Id', 'Name', 'Model', 'Manufacturer', 'TotalCores',
+                                   'TotalThreads', 'MaxSpeedMHz'), records.Processor)
+
+
+def parseStorage(json_data):
+    """Return the records.Storage of Systems/{id}/SimpleStorage/{id}"""
+    lstDevice = [(intern(device.get('Name')), device.get('CapacityBytes'))
+                 for device in json_data.get('Devices') or []]
+    return records.Storage(intern(json_data.get('@odata.id')), intern(json_data.get('Id')),
+                           intern(json_data.get('Name')), lstDevice,
+                           intern(parseHealth(json_data)))
+
+
+def parseMemory(json_data):
+    """Return the records.MemoryModule of Systems/{id}/Memory/{id}"""
+    return parseRecord(json_data, ('Id', 'Name', 'CapacityMiB', 'MemoryDeviceType',
+                                   'OperatingSpeedMhz', 'Manufacturer', 'PartNumber',
+                                   'SerialNumber'), records.MemoryModule)
+
+
+def parseEthernetInterface(json_data):
+    """Return the records.NetworkInterface of Systems/{id}/EthernetInterfaces/{id}"""
+    lstAddress = [address.get('Address') for address in json_data.get('IPv4Addresses') or []]
+    return records.NetworkInterface(
+        intern(json_data.get('@odata.id')), intern(json_data.get('Id')),
+        intern(json_data.get('Name')), json_data.get('MACAddress'), json_data.get('SpeedMbps'),
+        intern(json_data.get('LinkStatus')), lstAddress, intern(parseHealth(json_data)))
+
+
+def parseLogService(json_data):
+    """Return the records.LogService of Systems/{id}/LogServices/{id}"""
+    return records.LogService(
+        intern(json_data.get('@odata.id')), intern(json_data.get('Id')),
+        intern(json_data.get('Name')), json_data.get('MaxNumberOfRecords'),
+        intern(json_data.get('OverWritePolicy')), json_data.get('ServiceEnabled'),
+        parseLink(json_data, 'Entries'), intern(parseHealth(json_data)))
+
+
+def parsePrivilegeMap(json_data):
+    """Return the records.PrivilegeMap of AccountService/PrivilegeMap"""
+    dictEntity = {}
+    for mapping in json_data.get('Mappings') or []:
+        dictOperation = dictEntity.setdefault(intern(mapping.get('Entity')), {})
+        for operation, lstPrivilege in (mapping.get('OperationMap') or {}).items():
+            dictOperation[intern(operation)] = [
+                [intern(privilege) for privilege in item.get('Privilege') or []]
+                for item in lstPrivilege or []]
+    return records.PrivilegeMap(intern(json_data.get('@odata.id')), intern(json_data.get('Id')),
+                                intern(json_data.get('Name')), dictEntity)
+
+
+def parseLogEntry(json_data):
+    """Return the records.LogEntry of a log entry
+
+    The Message is not interned: it is mostly unique per entry.
+
+    """
+    return records.LogEntry(intern(json_data.get('@odata.id')), intern(json_data.get('Id')),
+                            json_data.get('Created'), intern(json_data.get('Severity')),
+                            intern(json_data.get('EntryType')), json_data.get('Message'))
+
+
+def logItems(logger, json_data, skip=()):
+    """Log every top level property of json_data except the ones in skip"""
+    for key, value in json_data.items():
+        if (key not in skip):
+            logger.debug("%s: %s", key, value)
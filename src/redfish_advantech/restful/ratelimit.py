@@ -0,0 +1,91 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Per-BMC token bucket rate limiters shared by every client of the process."""
+
+# ---------Imports---------
+import time
+import logging
+import threading
+# ---------End of imports---------
+
+# Requests per second and burst size of a BMC that was not configured
+DEFAULT_RATE = 20
+DEFAULT_BURST = 10
+
+
+class TokenBucket:
+    """Token bucket of one BMC
+
+    Holds up to nBurst tokens and refills rate tokens per second; every
+    request takes one.  reserve() takes the token right away, letting the
+    bucket go negative, and returns how long the caller must wait for it,
+    so threads and asyncio tasks are served in the order they asked.
+
+    :param rate: The sustained requests per second.
+    :type rate: float
+    :param nBurst: The requests that may be sent at once after a pause.
+    :type nBurst: int
+
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, nBurst=DEFAULT_BURST):
+        self.__lock = threading.Lock()
+        self.rate = max(0.001, float(rate))
+        self.nBurst = max(1, nBurst)
+        self.tokens = float(self.nBurst)
+        self.updated = time.monotonic()
+        self.nWaits = 0
+
+    def setRate(self, rate, nBurst=None):
+        """Change the rate (and burst size) of the bucket"""
+        with self.__lock:
+            self.rate = max(0.001, float(rate))
+            if (nBurst != None):
+                self.nBurst = max(1, nBurst)
+
+    def reserve(self):
+        """Take one token and return the seconds to wait before sending"""
+        with self.__lock:
+            now = time.monotonic()
+            self.tokens = min(self.nBurst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if (self.tokens >= 0):
+                return 0.0
+            self.nWaits += 1
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Take one token, sleeping until it is available"""
+        delay = self.reserve()
+        if (delay > 0):
+            time.sleep(delay)
+
+
+# The buckets of every BMC of the process, keyed by "hostname:port"
+_dictBucket = {}
+_lock = threading.Lock()
+
+
+def getRateLimiter(hostname, port, rate=DEFAULT_RATE, nBurst=DEFAULT_BURST):
+    """Return the token bucket of hostname:port, creating it with rate/nBurst
+
+    The first client of a BMC creates its bucket; a later one asking for
+    another rate or burst gets the existing bucket and a warning.
+    """
+    strHost = "%s:%s" % (hostname, port)
+    with _lock:
+        if (strHost not in _dictBucket):
+            _dictBucket[strHost] = TokenBucket(rate, nBurst)
+            return _dictBucket[strHost]
+        bucket = _dictBucket[strHost]
+    wanted = TokenBucket(rate, nBurst)
+    if ((bucket.rate, bucket.nBurst) != (wanted.rate, wanted.nBurst)):
+        logging.getLogger('simpleExample').warning(
+            "Rate limiter of %s already exists with rate=%s, nBurst=%s (asked %s, %s)",
+            strHost, bucket.rate, bucket.nBurst, wanted.rate, wanted.nBurst)
+    return bucket
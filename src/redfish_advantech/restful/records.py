@@ -0,0 +1,123 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Compact sensor and inventory records returned by the parsers
+
+A fleet keeps millions of readings (BMCs x sensors x history), so every
+record has __slots__ instead of a per-instance __dict__, and the strings
+that repeat across BMCs and polls (sensor names, URIs, health, units,
+...) are interned so all the records share one copy of each.
+"""
+
+# ---------Imports---------
+import sys
+# ---------End of imports---------
+
+
+def intern(value):
+    """Return the interned copy of a str value; other values unchanged"""
+    if (isinstance(value, str)):
+        return sys.intern(value)
+    return value
+
+
+# Return value with its lists and dicts turned into hashable equivalents
+def _freeze(value):
+    if (isinstance(value, (list, tuple))):
+        return tuple(_freeze(item) for item in value)
+    if (isinstance(value, dict)):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    return value
+
+
+class Record:
+    """Base of the records: positional fields in the order of __slots__"""
+
+    __slots__ = ()
+
+    def __init__(self, *args):
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+        for name in self.__slots__[len(args):]:
+            setattr(self, name, None)
+
+    def asDict(self):
+        """Return the fields of the record as a dict"""
+        return dict((name, getattr(self, name)) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.asDict() == other.asDict()
+
+    def __hash__(self):
+        # Equal records hash equal; list and dict fields are hashed by value
+        return hash((type(self),) + tuple(_freeze(getattr(self, name))
+                                          for name in self.__slots__))
+
+    def __repr__(self):
+        return "%s(%s)" % (type(self).__name__, ", ".join(
+            "%s=%r" % (name, getattr(self, name)) for name in self.__slots__))
+
+
+class TemperatureReading(Record):
+    """A temperature sensor of Chassis/{id}/Thermal"""
+    __slots__ = ('uri', 'name', 'readingCelsius', 'health')
+
+
+class FanReading(Record):
+    """A fan of Chassis/{id}/Thermal"""
+    __slots__ = ('uri', 'name', 'reading', 'readingUnits', 'health')
+
+
+class VoltageReading(Record):
+    """A voltage sensor of Chassis/{id}/Power"""
+    __slots__ = ('uri', 'name', 'readingVolts', 'health')
+
+
+class PsuReading(Record):
+    """A power supply of Chassis/{id}/Power"""
+    __slots__ = ('uri', 'name', 'lineInputVoltage', 'health')
+
+
+class Processor(Record):
+    """A member of Systems/{id}/Processors"""
+    __slots__ = ('uri', 'id', 'name', 'model', 'manufacturer', 'totalCores',
+                 'totalThreads', 'maxSpeedMHz', 'health')
+
+
+class Storage(Record):
+    """A member of Systems/{id}/SimpleStorage; devices is [(Name, CapacityBytes)]"""
+    __slots__ = ('uri', 'id', 'name', 'devices', 'health')
+
+
+class MemoryModule(Record):
+    """A member of Systems/{id}/Memory"""
+    __slots__ = ('uri', 'id', 'name', 'capacityMiB', 'memoryDeviceType',
+                 'operatingSpeedMhz', 'manufacturer', 'partNumber', 'serialNumber',
+                 'health')
+
+
+class NetworkInterface(Record):
+    """A member of Systems/{id}/EthernetInterfaces; ipv4Addresses is [Address]"""
+    __slots__ = ('uri', 'id', 'name', 'macAddress', 'speedMbps', 'linkStatus',
+                 'ipv4Addresses', 'health')
+
+
+class LogService(Record):
+    """A member of Systems/{id}/LogServices; entries is the link of its Entries"""
+    __slots__ = ('uri', 'id', 'name', 'maxNumberOfRecords', 'overWritePolicy',
+                 'serviceEnabled', 'entries', 'health')
+
+
+class PrivilegeMap(Record):
+    """AccountService/PrivilegeMap; operationMap is {Entity: {Operation:
+    [[Privilege]]}}, an operation being allowed with every privilege of
+    one of its lists"""
+    __slots__ = ('uri', 'id', 'name', 'operationMap')
+
+
+class LogEntry(Record):
+    """A member of Systems/{id}/LogServices/{id}/Entries"""
+    __slots__ = ('uri', 'id', 'created', 'severity', 'entryType', 'message')
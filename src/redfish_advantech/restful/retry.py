@@ -0,0 +1,85 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Retry policy of the Advantech BMC Redfish clients."""
+
+# ---------Imports---------
+import time
+import random
+from email.utils import parsedate_to_datetime
+# ---------End of imports---------
+
+
+class RetryPolicy:
+    """When and how long to wait before a failed request is sent again
+
+    Only idempotent methods are retried: after a connection error or
+    timeout, or when the BMC answers one of lstStatus.  The delay grows
+    exponentially from backoff up to maxBackoff with up to jitter (a
+    fraction of the delay) added at random; a Retry-After header of a
+    503 is honored up to maxRetryAfter seconds instead.
+
+    :param nMaxRetries: The number of retries after the first attempt
+                        (0 disables retrying).
+    :type nMaxRetries: int
+    :param backoff: The delay before the first retry in seconds.
+    :type backoff: float
+    :param maxBackoff: The longest computed delay in seconds.
+    :type maxBackoff: float
+    :param jitter: The random fraction of the delay added to it.
+    :type jitter: float
+    :param lstStatus: The HTTP status codes that are retried.
+    :type lstStatus: tuple
+    :param maxRetryAfter: The longest Retry-After delay honored in seconds.
+    :type maxRetryAfter: float
+
+    """
+
+    # Methods that can be sent twice without changing the result
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+    def __init__(self, nMaxRetries=3, backoff=0.5, maxBackoff=10, jitter=0.5,
+                 lstStatus=(502, 503, 504), maxRetryAfter=60):
+        self.nMaxRetries = max(0, nMaxRetries)
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self.jitter = jitter
+        self.lstStatus = tuple(lstStatus)
+        self.maxRetryAfter = maxRetryAfter
+
+    def isRetryable(self, method, nStatus=None):
+        """Return True if method (answered with nStatus, if any) may be retried"""
+        if (method not in self.IDEMPOTENT_METHODS):
+            return False
+        return nStatus == None or nStatus in self.lstStatus
+
+    def parseRetryAfter(self, strRetryAfter):
+        """Return the seconds of a Retry-After header value or None"""
+        if (strRetryAfter == None):
+            return None
+        try:
+            delay = float(strRetryAfter)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(strRetryAfter).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(0.0, delay), self.maxRetryAfter)
+
+    def getDelay(self, nAttempt, strRetryAfter=None):
+        """Return the seconds to wait before retry number nAttempt + 1
+
+        :param nAttempt: The number of retries already made.
+        :type nAttempt: int
+        :param strRetryAfter: The Retry-After header of the response, if any.
+        :type strRetryAfter: str
+
+        """
+        delay = self.parseRetryAfter(strRetryAfter)
+        if (delay != None):
+            return delay
+        delay = min(self.maxBackoff, self.backoff * (2 ** nAttempt))
+        return delay + random.uniform(0, delay * self.jitter)
@@ -0,0 +1,115 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""SQLite store of Redfish session tokens shared across processes."""
+
+# ---------Imports---------
+import os
+import time
+import sqlite3
+import threading
+# ---------End of imports---------
+
+
+class SessionStore:
+    """Keep the X-Auth-Token and session location of each BMC and user
+
+    Backed by a SQLite database so that several threads and processes (for
+    example cron-driven pollers) can share the sessions; SQLite's file
+    locking serializes the writers.  The tokens are credentials: a new
+    database file is created readable and writable by its owner only
+    (mode 0600), and SQLite gives its journal the same mode.
+
+    Only one session is kept per BMC and user.  When two processes log in
+    at the same time the first one stored wins (see put()); the other one
+    must delete its session at logout.
+
+    :param fname: The SQLite database file, or ':memory:' for a database
+                  private to this instance.
+    :type fname: str
+    :param timeout: Seconds to wait for another process holding the lock.
+    :type timeout: float
+
+    """
+
+    def __init__(self, fname='redfish_sessions.db', timeout=30):
+        self.fname = fname
+        self.timeout = timeout
+        self.__lock = threading.Lock()
+        # An in-memory database only lives as long as its connection
+        self.__db = None
+        if (fname == ':memory:'):
+            self.__db = sqlite3.connect(fname, timeout=timeout, check_same_thread=False)
+        elif (not os.path.exists(fname)):
+            os.close(os.open(fname, os.O_CREAT | os.O_WRONLY, 0o600))
+        db = self.__connect()
+        try:
+            with db:
+                db.execute("CREATE TABLE IF NOT EXISTS sessions ("
+                           "key TEXT PRIMARY KEY, token TEXT NOT NULL, "
+                           "location TEXT NOT NULL, updated REAL NOT NULL)")
+        finally:
+            self.__close(db)
+
+    def __connect(self):
+        if (self.__db != None):
+            return self.__db
+        return sqlite3.connect(self.fname, timeout=self.timeout)
+
+    def __close(self, db):
+        if (db is not self.__db):
+            db.close()
+
+    @staticmethod
+    def makeKey(hostname, port, username):
+        """Return the key of the session of username on hostname:port"""
+        return "%s@%s:%s" % (username, hostname, port)
+
+    def get(self, key):
+        """Return (token, location) of key or None"""
+        with self.__lock:
+            db = self.__connect()
+            try:
+                row = db.execute("SELECT token, location FROM sessions WHERE key = ?",
+                                 (key,)).fetchone()
+            finally:
+                self.__close(db)
+        return None if row == None else (row[0], row[1])
+
+    def put(self, key, token, location):
+        """Keep token and location as the session of key, unless one is kept
+
+        A session already kept for key is never replaced, so a session
+        another process stored is not orphaned on the BMC; forget() a
+        session before storing its successor.
+
+        :returns: True if the session is stored, False if another one is
+                  kept for key
+
+        """
+        with self.__lock:
+            db = self.__connect()
+            try:
+                with db:
+                    cursor = db.execute("INSERT OR IGNORE INTO sessions VALUES (?, ?, ?, ?)",
+                                        (key, token, location, time.time()))
+            finally:
+                self.__close(db)
+        return cursor.rowcount == 1
+
+    def forget(self, key, token=None):
+        """Drop the session of key (only if it still is token, when given)"""
+        with self.__lock:
+            db = self.__connect()
+            try:
+                with db:
+                    if (token == None):
+                        db.execute("DELETE FROM sessions WHERE key = ?", (key,))
+                    else:
+                        db.execute("DELETE FROM sessions WHERE key = ? AND token = ?",
+                                   (key, token))
+            finally:
+                self.__close(db)
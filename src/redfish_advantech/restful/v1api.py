@@ -12,19 +12,36 @@ import os
 import sys
 import ssl
 import time
-import gzip
 import json
 import base64
 import logging.config
 import http.client
 import re
 import inspect  # add by CH Huang
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 from collections import (OrderedDict)
 
 from urllib.parse import urlparse, urlencode, quote
 from io import StringIO
 from io import BytesIO
+
+from redfish_advantech.restful.connectionpool import (HTTPSConnectionPool, PoolTimeoutError,
+                                                      DecompressResponseError)
+from redfish_advantech.restful.retry import RetryPolicy
+from redfish_advantech.restful import breaker
+from redfish_advantech.restful import ratelimit
+from redfish_advantech.restful import concurrency
+from redfish_advantech.restful import jsonbackend
+from redfish_advantech.restful import jsonstream
+from redfish_advantech.restful.cache import ETagCache
+from redfish_advantech.restful.linkmap import LINK_KEYS
+from redfish_advantech.restful import parsers
+from redfish_advantech.restful.crawler import Crawler
+from redfish_advantech.restful.collection import CollectionIterator
 # ---------End of imports---------
 
 # ---------Debug logger---------
@@ -49,11 +66,6 @@ class ServerDownOrUnreachableError(Exception):
     pass
 
 
-class DecompressResponseError(Exception):
-    """Raised when decompressing response failed."""
-    pass
-
-
 class JsonDecodingError(Exception):
     """Raised when there is an error in json data."""
     pass
@@ -64,11 +76,323 @@ class BadRequestError(Exception):
     pass
 
 
+_bLoggingConfLoaded = False
+
+
+def loadLoggingConf(fname='logging.conf'):
+    """Load logging.conf once per process for every client instance"""
+    global _bLoggingConfLoaded
+    if (not _bLoggingConfLoaded):
+        logging.config.fileConfig(fname)
+        _bLoggingConfLoaded = True
+
+
+# The session collection a login POSTs to
+SESSIONS_URL = "/redfish/v1/SessionService/Sessions"
+
+# RestResponse._json until the body has been parsed (the body may be null)
+_NOT_PARSED = object()
+
+
+class RestResponse:
+    """Response of a Redfish request whose body has already been read
+
+    The body is read as soon as the response arrives so the connection can
+    go back to the pool; read()/getcode()/status/reason/headers behave like
+    http.client.HTTPResponse for the callers.  nBytes is the size of the
+    (decompressed) body and nWireBytes the bytes read from the socket,
+    smaller than nBytes when the body came gzip encoded.
+
+    The body is decoded in one place: json() parses the bytes once and
+    every caller gets the same object, so callers must not modify it.
+    text() decodes the bytes once for logging.  jsonBackend is the
+    jsonbackend.JsonBackend the body is parsed with (stdlib json if None).
+
+    """
+
+    def __init__(self, status, reason, headers, body, nWireBytes=None, jsonBackend=None):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = body
+        self._json = _NOT_PARSED
+        self._text = None
+        self.nBytes = len(body)
+        self.nWireBytes = self.nBytes if nWireBytes == None else nWireBytes
+        self.jsonBackend = jsonBackend or jsonbackend.STDLIB
+
+    @classmethod
+    def fromJson(cls, response, json_data):
+        """Return a copy of response whose body is the parsed json_data
+
+        The body bytes are only serialized if read() is called.
+        """
+        copy = cls(response.status, response.reason, response.headers, b'',
+                   response.nWireBytes, response.jsonBackend)
+        copy._body = None
+        copy._json = json_data
+        copy.nBytes = response.nBytes
+        return copy
+
+    def read(self):
+        """Return the body bytes of the response"""
+        if (self._body == None):
+            self._body = self.jsonBackend.dumps(self._json)
+        return self._body
+
+    def text(self):
+        """Return the body decoded as UTF-8 (for logging); decoded once"""
+        if (self._text == None):
+            self._text = self.read().decode(errors='replace')
+        return self._text
+
+    def json(self):
+        """Return the parsed JSON body; the bytes are parsed once and kept
+
+        Bytes that are not valid UTF-8 are replaced by U+FFFD like text()
+        does (see JsonBackend.loadsLenient).
+        """
+        if (self._json is _NOT_PARSED):
+            self._json = self.jsonBackend.loadsLenient(self._body)
+        return self._json
+
+    def getcode(self):
+        """Return the HTTP status code of the response"""
+        return self.status
+
+    def getheader(self, name, default=None):
+        """Return the value of the response header name"""
+        return self.headers.get(name, default)
+
+
+# The errors of a request that mean the BMC could not be reached or did
+# not answer in time (FutureTimeoutError and EOFError are the ones of
+# asyncio); anything else raised while a request is in flight is not the
+# BMC's fault
+TRANSPORT_ERRORS = (OSError, http.client.HTTPException, PoolTimeoutError,
+                    FutureTimeoutError, EOFError)
+
+
+def makeHeaders(authToken, method, url, bGzip=False):
+    """Return the headers of a request, with X-Auth-Token once logged in
+
+    The login request never sends a token, so a re-login does not reuse
+    the expired one.
+    """
+    headers = {'Accept': '*/*', 'Connection': 'Keep-Alive', 'OData-Version': '4.0'}
+    if (authToken != None and not (method == "POST" and url == SESSIONS_URL)):
+        headers['X-Auth-Token'] = authToken
+    if (bGzip):
+        headers['Accept-Encoding'] = 'gzip'
+    return headers
+
+
+def getCached(client, method, url, headers):
+    """Look a request up in the response and ETag caches of client
+
+    Adds If-None-Match to headers when the ETag cache has a validator.
+
+    :returns: tuple of (the cached RestResponse or None, the ETag sent or None)
+
+    """
+    if (method != "GET"):
+        return (None, None)
+    if (client.responseCache != None):
+        response = client.responseCache.get("%s:%s" % (client.hostname, client.port), url)
+        if (response != None):
+            return (response, None)
+    etag = None
+    if (client.etagCache != None):
+        etag = client.etagCache.getValidator(url)
+        if (etag != None):
+            headers['If-None-Match'] = etag
+    return (None, etag)
+
+
+def putCached(client, method, url, response, etag):
+    """Update the caches of client with the response of a request
+
+    :returns: the response to hand over, the cached one for a 304
+
+    """
+    if (client.etagCache != None and method == "GET"):
+        if (response.status == 304 and etag != None):
+            response = client.etagCache.notModified(url) or response
+        else:
+            client.etagCache.store(url, response)
+    if (client.responseCache != None):
+        strHost = "%s:%s" % (client.hostname, client.port)
+        if (method == "GET"):
+            client.responseCache.put(strHost, url, response)
+        else:
+            client.responseCache.invalidateFor(strHost, method, url)
+    return response
+
+
+def canReplay(strToken, authToken):
+    """Return True if a request the BMC rejected with strToken can be
+    replayed with authToken, the token of another session"""
+    return strToken != None and authToken not in (None, strToken)
+
+
+class RequestAttempts:
+    """The circuit breaker, rate limit, concurrency limit and retry
+    decisions of one request, without its I/O
+
+    redfish_advantech and the asyncio client share it and only do the
+    (blocking or non-blocking) I/O, reporting its outcome:
+
+        attempts = RequestAttempts(client, method, url)
+        while True:
+            delay = attempts.begin()
+            try:
+                # sleep delay, take a slot of client.limiter, then
+                attempts.sending()
+                response = ...send the request...
+            except BaseException as e:
+                delay = attempts.failed(e)
+                if (delay == None):
+                    raise
+            else:
+                delay = attempts.answered(response)
+                if (delay == None):
+                    return response
+            # sleep delay
+
+    :param client: The client whose breaker, rateLimiter, limiter,
+                   retryPolicy, hostname, port and logger are used.
+    :param method: The request method.
+    :type method: str
+    :param url: The request link.
+    :type url: str
+    :param bRetry: False to never retry, e.g. a streamed response.
+    :type bRetry: bool
+
+    """
+
+    def __init__(self, client, method, url, bRetry=True):
+        self.client = client
+        self.method = method
+        self.url = url
+        self.bRetry = bRetry
+        self.nAttempt = 0
+        self.start = None
+
+    def begin(self):
+        """Start an attempt; return the seconds to wait before sending it
+
+        :raises ServerDownOrUnreachableError: if the circuit of the BMC is
+                                              open (no token is taken).
+
+        """
+        client = self.client
+        if (client.breaker != None and not client.breaker.allow()):
+            raise ServerDownOrUnreachableError(
+                "Circuit of %s:%s is open, %s %s not sent" % (
+                    client.hostname, client.port, self.method, self.url))
+        if (client.rateLimiter != None):
+            return max(0.0, client.rateLimiter.reserve())
+        return 0.0
+
+    def sending(self):
+        """The slot of client.limiter (if any) is taken: the request goes out"""
+        self.start = time.monotonic()
+
+    # Give the slot of client.limiter back; adjust the limit unless the
+    # outcome says nothing about the BMC (bError None)
+    def __release(self, bError):
+        if (self.start == None or self.client.limiter == None):
+            self.start = None
+            return
+        if (bError == None):
+            self.client.limiter.cancel()
+        else:
+            self.client.limiter.release(time.monotonic() - self.start, bError)
+        self.start = None
+
+    # Return the delay before the next attempt and count this one
+    def __retry(self, retryAfter, strWhy):
+        delay = self.client.retryPolicy.getDelay(self.nAttempt, retryAfter)
+        self.client.logger.warning("Retry [%s %s] in %.2fs after %s",
+                                   self.method, self.url, delay, strWhy)
+        self.nAttempt += 1
+        return delay
+
+    def answered(self, response):
+        """The BMC answered; return None if response is the final one, else
+        the seconds to wait before the retry
+
+        :raises RetriesExhaustedError: if the BMC kept answering a
+                                       retryable status.
+
+        """
+        client = self.client
+        self.__release(response.status in client.retryPolicy.lstStatus)
+        if (client.breaker != None):
+            if (response.status >= 500):
+                client.breaker.recordFailure()
+            else:
+                client.breaker.recordSuccess()
+        if (not self.bRetry or not client.retryPolicy.isRetryable(self.method, response.status)):
+            return None
+        if (self.nAttempt >= client.retryPolicy.nMaxRetries):
+            raise RetriesExhaustedError(
+                "%s %s to %s:%s answered %d(%s) after %d attempt(s)" % (
+                    self.method, self.url, client.hostname, client.port, response.status,
+                    response.reason, self.nAttempt + 1))
+        return self.__retry(response.getheader('Retry-After'),
+                            "%d(%s)" % (response.status, response.reason))
+
+    def failed(self, e):
+        """The attempt raised e; return None if e must be raised as is,
+        else the seconds to wait before the retry
+
+        Only TRANSPORT_ERRORS count against the BMC and are retried.  No
+        free connection (PoolTimeoutError) gives a half-open probe back,
+        and so does any error that is not the BMC's fault.
+
+        :raises ServerDownOrUnreachableError: if a transport error is not
+                                              retried.
+
+        """
+        client = self.client
+        if (isinstance(e, DecompressResponseError)):
+            # The BMC answered; the body it sent is unusable
+            self.__release(False)
+            if (client.breaker != None):
+                client.breaker.recordSuccess()
+            return None
+        if (not isinstance(e, TRANSPORT_ERRORS)):
+            self.__release(None)
+            if (client.breaker != None):
+                client.breaker.cancel()
+            return None
+        self.__release(True)
+        if (client.breaker != None):
+            if (isinstance(e, PoolTimeoutError)):
+                client.breaker.cancel()
+            else:
+                client.breaker.recordFailure()
+        if (not self.bRetry or not client.retryPolicy.isRetryable(self.method) or
+                self.nAttempt >= client.retryPolicy.nMaxRetries):
+            raise ServerDownOrUnreachableError(
+                "%s %s to %s:%s failed after %d attempt(s): %s" % (
+                    self.method, self.url, client.hostname, client.port,
+                    self.nAttempt + 1, e)) from e
+        return self.__retry(None, type(e).__name__)
+
+
 class redfish_advantech:
-    def __init__(self, hostname, port, username, password, nLogLevel=0):
+    def __init__(self, hostname, port, username, password, nLogLevel=0, nMaxConnections=4,
+                 nConcurrency=None, bExpand=True, bETagCache=False, responseCache=None,
+                 linkMap=None, sessionStore=None, retryPolicy=None,
+                 bCircuitBreaker=True, bRateLimit=False, bAdaptive=True, bLogItems=True,
+                 bGzip=False, jsonBackend='auto', nPageSize=None, nBreakerFailures=5,
+                 breakerResetTimeout=30, rate=ratelimit.DEFAULT_RATE,
+                 nBurst=ratelimit.DEFAULT_BURST):
         self.__logVerbose = nLogLevel
         # Load logging.conf
-        logging.config.fileConfig('logging.conf')
+        loadLoggingConf()
         # create logger
         self.logger = logging.getLogger('simpleExample')
         if (self.get_logVerbose() >= 1): 
@@ -82,7 +406,10 @@ class redfish_advantech:
         self.password = password
         self.payload = None
         self.theTimeout = 10
-        self.connection = None
+        self.nMaxConnections = nMaxConnections
+        # Concurrent member fetches per BMC (default: one per pooled connection)
+        self.nConcurrency = nConcurrency or nMaxConnections
+        self.pool = None
         self.authToken = None
         self.location = None
         self.url = ''
@@ -96,6 +423,7 @@ class redfish_advantech:
         self.urlEthernetInterfaces = ''
         self.urlLogServices = ''
         self.strPowerState = ''
+        self.urlReset = ''
         self.lstURL = []
         self.nCount = 0
         self.nIndex = 0
@@ -103,11 +431,75 @@ class redfish_advantech:
         self.nCount2 = 0
         self.nIndex2 = 0
         self.urlLogEntries = ''
+        # Fetch collections with $expand when the service root supports it
+        self.bExpand = bExpand
+        self.dictProtocolFeatures = {}
+        self.dictExpanded = {}
+        # Revalidate GETs with If-None-Match and serve 304s from the cache
+        self.etagCache = ETagCache() if bETagCache else None
+        # Serve GETs from a (possibly shared) TTL + LRU cache.ResponseCache
+        self.responseCache = responseCache
+        # Start from the links a linkmap.LinkMap remembers for this BMC
+        self.linkMap = linkMap
+        self.strLinkKey = ''
+        self.setRemembered = set()
+        # Guards the discovered links and walk state shared by the threads
+        self.linkLock = threading.RLock()
+        self.__local = threading.local()
+        self.nLastStatus = 0
+        # Reuse the sessions a sessionstore.SessionStore keeps across runs
+        self.sessionStore = sessionStore
+        # Serializes the re-login after a session has expired
+        self.authLock = threading.Lock()
+        self.poolLock = threading.Lock()
+        # Retry idempotent requests on connection errors and 502/503/504
+        self.retryPolicy = retryPolicy or RetryPolicy()
+        # Fail fast while the circuit breaker of this BMC is open: it opens
+        # after nBreakerFailures failures in a row and probes the BMC again
+        # after breakerResetTimeout seconds
+        self.breaker = breaker.getBreaker(
+            hostname, port, nFailureThreshold=nBreakerFailures,
+            resetTimeout=breakerResetTimeout) if bCircuitBreaker else None
+        # At most rate requests per second to this BMC, in bursts of nBurst,
+        # shared by every client of the process; opt-in, as a rate set for
+        # a slow BMC would cap the member fetches and $expand walks of a
+        # fast one
+        self.rateLimiter = ratelimit.getRateLimiter(
+            hostname, port, rate, nBurst) if bRateLimit else None
+        # Requests in flight to this BMC, adjusted by AIMD from latency and errors
+        self.limiter = concurrency.getLimiter(hostname, port) if bAdaptive else None
+        # Log the properties and readings the resource methods return
+        self.bLogItems = bLogItems
+        # Ask for gzip encoded bodies with Accept-Encoding
+        self.bGzip = bGzip
+        # Parse and serialize bodies with the fastest JSON library installed
+        # unless one is named ('orjson', 'ujson', 'simdjson', 'json')
+        self.jsonBackend = jsonbackend.getBackend(jsonBackend)
+        # Page collections with $top/$skip, nPageSize members per request,
+        # when the BMC supports it (Members@odata.nextLink is always followed)
+        self.nPageSize = nPageSize
+        self.statsLock = threading.Lock()
+        self.nBytes = 0
+        self.nWireBytes = 0
+
+    @property
+    def nLastStatus(self):
+        """The status of the last GET this thread made through getResource()"""
+        return getattr(self.__local, 'nLastStatus', 0)
+
+    @nLastStatus.setter
+    def nLastStatus(self, nStatus):
+        self.__local.nLastStatus = nStatus
 
     def log(self, msg):
         self.logger.info("%s [hostname=%s port%d]",
                          msg, self.hostname, self.port)
 
+    # Log every top level property of json_data except the ones in skip
+    def logItems(self, json_data, skip=()):
+        if (self.bLogItems):
+            parsers.logItems(self.logger, json_data, skip)
+
     def get_logVerbose(self):
         """Return the level of log verbose"""
         return self.__logVerbose
@@ -137,45 +529,116 @@ class redfish_advantech:
         self.logout()
         self.disconnect()
 
+    # Create the http connection pool
+    def connect(self):
+        with self.poolLock:
+            if (self.pool == None):
+                self.pool = HTTPSConnectionPool(
+                    self.hostname, self.port, timeout=self.theTimeout,
+                    nMaxConnections=self.nMaxConnections, logger=self.logger)
+                self.logger.debug("Start the http connection pool")
+
     # Redfish http request
-    def rfRequest(self, log=True):
+    def rfRequest(self, log=True, method=None, url=None, payload=None, bReauth=True):
+        """Send a request on a connection checked out of the pool
+
+        method, url and payload default to self.method, self.url and
+        self.payload for older callers; every method of this class passes
+        them explicitly so one instance can be shared by several threads.
+        A request rejected with 401/403 because the
+        session has expired is replayed once after login() unless bReauth
+        is False.  Errors other than the transport ones (a payload that
+        cannot be serialized, a failed re-login, ...) are raised as is.
+
+        :raises ServerDownOrUnreachableError: if the BMC cannot be reached
+                                              (see sendRequest).
+        :raises RetriesExhaustedError: if the BMC kept answering a
+                                       retryable status.
+
+        """
         if (self.get_logVerbose() >= 1 and log): 
             self.logger.debug('=== redfish_advantech.rfRequest ===')
+        if (method == None):
+            method = self.method
+            url = self.url
+            payload = self.payload
         response = None
-        if (self.authToken == None):  # for login only
-            headers = {'Accept': '*/*',
-                       'self.connection': 'Keep-Alive', 'OData-Version': '4.0'}
-        else:  # for other requests
-            headers = {'Accept': '*/*', 'self.connection': 'Keep-Alive',
-                       'OData-Version': '4.0', 'X-Auth-Token': self.authToken}
-        try:
-            if (log):
-                self.logger.info(
-                    "--> rfRequest [%s %s]", self.method, self.url)
-                if (self.payload == None):
-                    self.logger.debug("headers=%s", headers)
-                else:
-                    self.logger.debug("headers=%s", headers)
-                    self.logger.debug("self.payload=%s", self.payload)
-            if (self.connection):
-                if (self.payload == None):
-                    self.connection.request(
-                        self.method, self.url, self.payload, headers)
-                else:
-                    self.connection.request(
-                        self.method, self.url, json.dumps(self.payload), headers)
-                response = self.connection.getresponse()
+        headers = self.getHeaders(method, url)
+        if (log):
+            self.logger.info(
+                "--> rfRequest [%s %s]", method, url)
+            if (payload == None):
+                self.logger.debug("headers=%s", headers)
+            else:
+                self.logger.debug("headers=%s", headers)
+                self.logger.debug("payload=%s", payload)
+        if (self.pool):
+            if (payload == None):
+                body = None
             else:
-                self.logger.error("self.connection is None")
-        except Exception as e:
-            self.logger.error(e)
+                body = self.jsonBackend.dumps(payload)
+                headers['Content-Type'] = 'application/json'
+            response, etag = getCached(self, method, url, headers)
+            if (response == None):
+                response = self.sendRequest(method, url, body, headers)
+                if (bReauth and response.status in (401, 403) and
+                        self.reauthenticate(headers.get('X-Auth-Token'), response.status)):
+                    headers['X-Auth-Token'] = self.authToken
+                    self.logger.info("Replay [%s %s] with the new session", method, url)
+                    response = self.sendRequest(method, url, body, headers)
+                response = putCached(self, method, url, response, etag)
+            elif (log):
+                self.logger.debug("Served from the response cache")
+        else:
+            self.logger.error("self.pool is None")
 
+        if (response == None):
+            raise ServerDownOrUnreachableError(
+                "No response to %s %s from %s:%s" % (method, url, self.hostname, self.port))
         if (log):
             self.logger.info("response.status(reason)=%d(%s)",
                              response.status, response.reason)
+            self.logger.debug("Received %d bytes (%d on the wire)",
+                              response.nBytes, response.nWireBytes)
         return response
 
-    def get(self, path, args=None, headers=None):
+    # Return the request headers of method url
+    def getHeaders(self, method, url):
+        return makeHeaders(self.authToken, method, url, self.bGzip)
+
+    # Return the body bytes received, decompressed and as read from the socket
+    def getTransferStats(self):
+        """Return {'nBytes': ..., 'nWireBytes': ...} of every response so far"""
+        with self.statsLock:
+            return {'nBytes': self.nBytes, 'nWireBytes': self.nWireBytes}
+
+    # Send one request on the pool, retrying it as self.retryPolicy says
+    def sendRequest(self, method, url, body, headers):
+        attempts = RequestAttempts(self, method, url)
+        while True:
+            delay = attempts.begin()
+            try:
+                if (delay > 0):
+                    time.sleep(delay)
+                if (self.limiter != None):
+                    self.limiter.acquire()
+                attempts.sending()
+                response = RestResponse(*self.pool.request(method, url, body, headers),
+                                        jsonBackend=self.jsonBackend)
+            except BaseException as e:
+                delay = attempts.failed(e)
+                if (delay == None):
+                    raise
+            else:
+                with self.statsLock:
+                    self.nBytes += response.nBytes
+                    self.nWireBytes += response.nWireBytes
+                delay = attempts.answered(response)
+                if (delay == None):
+                    return response
+            time.sleep(delay)
+
+    def get(self, path, args=None, headers=None, lstSelect=None):
         """Perform a GET request
 
         :param path: the URL path.
@@ -184,75 +647,52 @@ class redfish_advantech:
         :type args: dict.
         :param headers: dict of headers to be appended.
         :type headers: dict.
+        :param lstSelect: property paths to project the response to; sent as
+                          $select when the BMC supports it, otherwise the
+                          body is trimmed on the client side.
+        :type lstSelect: list.
         :returns: returns a rest request with method 'Get'
 
         """
         if (self.get_logVerbose() >= 1): 
             self.logger.debug('=== redfish_advantech.get ===')
-        self.url = path
-        self.method = "GET"
+        url = self.selectURL(path, lstSelect)
         try:
-            return self.rfRequest()
+            response = self.rfRequest(True, "GET", url)
+            if (response != None):
+                self.nLastStatus = response.getcode()
+            if (lstSelect and response != None and response.getcode() == 200 and
+                    url == path):
+                response = RestResponse.fromJson(
+                    response, parsers.selectProperties(response.json(), lstSelect))
+            return response
         except ValueError:
             self.logger.error(
-                "Error in json decoding. path=%s, method=%s", self.url, self.method)
+                "Error in json decoding. path=%s, method=%s", url, "GET")
             raise JsonDecodingError('Error in json decoding.')
 
     # Get Redfish V1 root
     def getRedfishV1(self):
-        self.method = "GET"
-        self.url = "/redfish/v1"
-        self.logger.info(
-            "--> getRedfishV1 [%s %s]", self.method, self.url)
-        self.payload = None
-        if (self.connection == None):
-            self.connection = http.client.HTTPSConnection(
-                self.hostname, self.port, timeout=self.theTimeout)
-            self.logger.debug("Start the http connection")
-        response = self.rfRequest()
+        self.connect()
+        json_data = self.getResource("getRedfishV1", "/redfish/v1")
         # Get the next link of getRedfishV1
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if (i[0] in {"OData", "SessionService", "AccountService", "EventService", "Systems", "Chassis", "Managers", "Links"}):
-                    json_data2 = i[1]
-                    for ii in json_data2.items():
-                        if ii[0] == '@odata.id':
-                            self.lstURL.append(ii[1])
-                            self.nIndex += 1
-                            self.nCount += 1
-                            self.logger.debug("%s: %s", ii[0], ii[1])
-                            self.logger.info("Next link=%s", ii[1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
-
-    # Get OData
+        if (json_data == None):
+            return self.setLinks([])
+        self.dictProtocolFeatures = json_data.get('ProtocolFeaturesSupported', {})
+        lstURL = self.setLinks(parsers.parseLinks(json_data, parsers.ROOT_LINKS))
+        self.logItems(json_data, parsers.ROOT_LINKS)
+        self.loadLinks(json_data.get('UUID', ''))
+        return lstURL
+
+    # Get OData and return its service documents
     def getOData(self):
-        self.method = "GET"
-        self.url = "/redfish/v1/OData"
-        self.logger.info(
-            "--> getOData [%s %s]", self.method, self.url)
-        self.payload = None
-        if (self.connection == None):
-            self.connection = http.client.HTTPSConnection(
-                self.hostname, self.port, timeout=self.theTimeout)
-            self.logger.debug("Start the http connection")
-        response = self.rfRequest()
+        self.connect()
+        json_data = self.getResource("getOData", "/redfish/v1/OData")
         # Get the next link of getOData
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
+        self.setCollection(0, [])
+        if (json_data == None):
+            return []
+        if (self.bLogItems):
             for i in json_data.items():
                 if i[0] == 'value':
                     if (self.get_logVerbose() >= 3):
@@ -260,50 +700,119 @@ class redfish_advantech:
                             "%s: %s", i[0], json.dumps(i[1], indent=4))
                 else:
                     self.logger.debug("%s: %s", i[0], i[1])
+        # The service documents of the OData service document
+        return json_data.get('value', [])
 
     # Login
     def login(self):
-        """ Login and start a REST session.  Remember to call logout() when you are done. """
-        self.url = "/redfish/v1/SessionService/Sessions"
-        self.method = "POST"
-        self.logger.info("--> Login [%s %s]", self.method, self.url)
-        if (not self.connection):
-            self.connection = http.client.HTTPSConnection(
-                self.hostname, self.port, timeout=self.theTimeout)
-            self.logger.debug("Start the http connection")
+        """ Login and start a REST session.  Remember to call logout() when you are done.
+
+        With a sessionStore, the session an earlier run kept is reused as long
+        as the BMC still accepts its token.
+
+        :raises InvalidCredentialsError: if the BMC answered without a token.
+
+        """
+        self.connect()
+        if (self.resumeSession()):
+            return
+        url = SESSIONS_URL
+        self.logger.info("--> Login [%s %s]", "POST", url)
         data = dict()
         data['UserName'] = self.username
         data['Password'] = self.password
-        self.payload = data
 
-        response = self.rfRequest(self)
-        result = response.read().decode(errors='replace')
+        response = self.rfRequest(True, "POST", url, data)
         if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
+            self.logger.debug("result=%s", response.text())
         # Get Token and Location of session after login
         self.authToken = response.headers['X-Auth-Token']
+        if (response.getcode() >= 400 or not self.authToken):
+            self.authToken = None
+            raise InvalidCredentialsError("Login to %s:%s as %s failed: %d(%s)" % (
+                self.hostname, self.port, self.username, response.status, response.reason))
         self.logger.info("--> X-Auth-Token=%s]", self.authToken)
         # Get the next link of Chassis
         if (response.getcode() == 302):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == '@odata.id':
-                    self.location = i[1]
-                    self.logger.info("location=%s", self.location)
-        self.payload = None
+            json_data = response.json()
+            if ('@odata.id' in json_data):
+                self.location = json_data['@odata.id']
+                self.logger.info("location=%s", self.location)
+        if (self.sessionStore != None and self.authToken and self.location):
+            if (not self.sessionStore.put(self.getSessionKey(), self.authToken, self.location)):
+                self.logger.info("Another session is kept for %s, %s is deleted at logout",
+                                 self.getSessionKey(), self.location)
+
+    # Get the key of this BMC and user in the session store
+    def getSessionKey(self):
+        return self.sessionStore.makeKey(self.hostname, self.port, self.username)
+
+    # Reuse the session kept in the session store if its token is still valid
+    def resumeSession(self):
+        if (self.sessionStore == None):
+            return False
+        session = self.sessionStore.get(self.getSessionKey())
+        if (session == None):
+            return False
+        self.authToken, self.location = session
+        if (self.isSessionAlive()):
+            self.logger.info("Reuse session %s", self.location)
+            return True
+        self.logger.info("Session %s is gone, login again", self.location)
+        self.sessionStore.forget(self.getSessionKey(), self.authToken)
+        self.authToken = None
+        self.location = None
+        return False
+
+    # Return True if the BMC still accepts the session token
+    def isSessionAlive(self):
+        # A GET of the session resource is the cheapest check of the token
+        response = self.rfRequest(True, "GET", self.location, bReauth=False)
+        return (response != None and response.getcode() == 200)
+
+    # Login again after the BMC rejected strToken; return True if the
+    # request can be replayed with self.authToken
+    def reauthenticate(self, strToken, nStatus=401):
+        if (strToken == None):
+            return False
+        with self.authLock:
+            if (canReplay(strToken, self.authToken)):
+                # Another thread has already logged in again
+                return True
+            if (self.authToken == None or
+                    (nStatus == 403 and self.location and self.isSessionAlive())):
+                # Logged out, or a valid session lacking the privilege
+                return False
+            self.logger.warning("Session %s has expired, login again", self.location)
+            if (self.sessionStore != None):
+                self.sessionStore.forget(self.getSessionKey(), strToken)
+            self.location = None
+            self.login()
+            return canReplay(strToken, self.authToken)
 
     # Logout
-    def logout(self):
-        """ Logout of session. YOU MUST CALL THIS WHEN YOU ARE DONE TO FREE UP SESSIONS"""
+    def logout(self, bDelete=False):
+        """ Logout of session. YOU MUST CALL THIS WHEN YOU ARE DONE TO FREE UP SESSIONS
+
+        With a sessionStore the session is kept open for the next run unless
+        bDelete is True.  A session the store does not keep (another process
+        stored its own first) is always deleted.
+        """
+        if (self.authToken and self.sessionStore != None and not bDelete):
+            session = self.sessionStore.get(self.getSessionKey())
+            if (session != None and session[0] == self.authToken):
+                self.logger.info("Keep session %s for reuse", self.location)
+                self.authToken = None
+                self.location = None
         if (self.authToken):
-            self.url = self.location
-            self.method = "DELETE"
-            self.logger.info("--> Logout [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
+            if (self.sessionStore != None):
+                self.sessionStore.forget(self.getSessionKey(), self.authToken)
+            url = self.location
+            self.logger.info("--> Logout [%s %s]", "DELETE", url)
+            response = self.rfRequest(True, "DELETE", url, bReauth=False)
             if response.status not in [200, 202, 204]:
                 self.logger.info("Invalid session resource: %s, return code: %d" % (
-                    self.url, response.status))
+                    url, response.status))
             self.logger.info("User logout response.status(reason)=%d(%s)",
                              response.status, response.reason)
             self.authToken = None
@@ -312,934 +821,921 @@ class redfish_advantech:
     # Disconnect
     def disconnect(self):
         if (self.get_logVerbose() >= 1): 
-            self.logger.debug("=== Disconnecting http redfish_advantech.connection ===")
-        if (self.connection):
+            self.logger.debug("=== Disconnecting http redfish_advantech.pool ===")
+        if (self.pool):
             try:
-                ret = self.connection.close()
-                if (ret == None):
-                    self.logger.info(
-                        'http self.connection closed successfully')
-                else:
-                    logging.error(
-                        'http self.connection closed failed with ', ret)
+                self.pool.close()
+                self.logger.info(
+                    'http connection pool closed successfully')
             except:
                 logging.error(
-                    'Unknown exception when close the http self.connection')
+                    'Unknown exception when close the http connection pool')
         else:
             self.logger.info(
-                'http self.connection is not connected. No need to close it.')
-        self.connection = None
+                'http connection pool is not connected. No need to close it.')
+        self.pool = None
         self.logger.debug('=== End to of redfish_advantech.disconnect ===')
 
-    # Get SessionService
-    def getSessionService(self):
-        self.method = "GET"
-        self.url = "/redfish/v1/SessionService"
-        self.logger.info(
-            "--> getSessionService [%s %s]", self.method, self.url)
-        self.payload = None
-        response = self.rfRequest()
-        # Get the next link of SessionService
-        self.url = ''
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Sessions':
-                    json_data2 = i[1]
-                    for ii in json_data2.items():
-                        if ii[0] == '@odata.id':
-                            self.url = ii[1]
-                    self.logger.debug("%s: %s", i[0], i[1])
-                    self.logger.info("Next link=%s", self.url)
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+    # Keep the links found by a parser as the next links to walk
+    def setLinks(self, lstLink):
+        lstURL = []
+        for key, link in lstLink:
+            lstURL.append(link)
+            self.logger.debug("%s: %s", key, link)
+            self.logger.info("Next link=%s", link)
+        self.setCollection(len(lstURL), lstURL)
+        return lstURL
+
+    # Keep nCount member links as the links the *All methods walk next
+    def setCollection(self, nCount, lstURL, bSecond=False):
+        with self.linkLock:
+            if (bSecond):
+                self.nCount2, self.lstURL2, self.nIndex2 = nCount, lstURL, len(lstURL)
+            else:
+                self.nCount, self.lstURL, self.nIndex = nCount, lstURL, len(lstURL)
+
+    # Return the member links kept by the last collection method
+    def getCollection(self, bSecond=False):
+        with self.linkLock:
+            if (bSecond):
+                return [url for url in self.lstURL2[:self.nCount2] if url != '']
+            return [url for url in self.lstURL[:self.nCount] if url != '']
+
+    # Keep url as the link the next method of the walk starts from
+    def setNext(self, url):
+        with self.linkLock:
+            self.url = url
+        return url
+
+    # Return a consistent copy of the discovered links (LINK_KEYS)
+    def getLinks(self):
+        with self.linkLock:
+            return dict((key, getattr(self, key)) for key in LINK_KEYS)
+
+    # Set several discovered links at once
+    def updateLinks(self, dictLinks):
+        with self.linkLock:
+            for key, url in dictLinks.items():
+                setattr(self, key, url)
+
+    # Set the link attributes this BMC's entry of the link map remembers
+    def loadLinks(self, strUUID):
+        if (self.linkMap == None):
+            return
+        self.strLinkKey = self.linkMap.makeKey(self.hostname, self.port, strUUID)
+        with self.linkLock:
+            for key, url in self.linkMap.get(self.strLinkKey).items():
+                if (key in LINK_KEYS and getattr(self, key) == ''):
+                    setattr(self, key, url)
+                    self.setRemembered.add(url)
+                    self.logger.debug("Remembered %s=%s", key, url)
+
+    # Remember the discovered link attributes in the link map
+    def saveLinks(self):
+        if (self.linkMap == None or self.strLinkKey == ''):
+            return
+        self.linkMap.put(self.strLinkKey, dict(
+            (key, url) for key, url in self.getLinks().items() if url != ''))
+
+    # Forget every link of this BMC after a remembered link answered 404
+    def isStaleLink(self, url):
+        with self.linkLock:
+            if (self.linkMap == None or self.nLastStatus != 404 or
+                    url not in self.setRemembered):
+                return False
+            self.logger.warning("Link %s is gone, discover %s again", url, self.strLinkKey)
+            self.linkMap.forget(self.strLinkKey)
+            self.setRemembered.clear()
+            for key in LINK_KEYS:
+                setattr(self, key, '')
+            return True
+
+    # GET the link in attribute strAttr with fetch(url) and, if a remembered
+    # link has gone away, rediscover it with discover() and GET it again
+    def fetchLink(self, strAttr, fetch, discover):
+        json_data = fetch(getattr(self, strAttr))
+        if (json_data == None and self.isStaleLink(getattr(self, strAttr))):
+            discover()
+            if (getattr(self, strAttr) != ''):
+                json_data = fetch(getattr(self, strAttr))
+        return json_data
+
+    # Walk Chassis → Chassis/1u unless the Thermal and Power links are known
+    def discoverChassis(self):
+        if (self.urlThermal == '' or self.urlPower == ''):
+            self.getChassis1u(self.getChassis())
+
+    # Walk Systems → Systems/0 unless a link of Systems/0 is known
+    def discoverSystems(self):
+        if ((self.urlBios, self.urlProcessors, self.urlSimpleStorage, self.urlMemory,
+             self.urlEthernetInterfaces, self.urlLogServices) == ('',) * 6):
+            self.getSystems0(self.getSystems())
+
+    # Walk down to LogServices/Log unless the Entries link is known
+    def discoverLogEntries(self):
+        if (self.urlLogEntries == ''):
+            self.discoverSystems()
+            self.getSystems0LogServicesLog(self.getSystems0LogServices())
+
+    # Add the $expand query to a collection url when the BMC supports it
+    def expandURL(self, url):
+        strExpand = ''
+        if (self.bExpand):
+            strExpand = parsers.parseExpandQuery(self.dictProtocolFeatures)
+        if (strExpand == '' or url == ''):
+            return url
+        return url + ('&' if '?' in url else '?') + strExpand
+
+    # Add the $select query to url when the BMC supports it
+    def selectURL(self, url, lstSelect):
+        if (not lstSelect or not parsers.parseSelectQuery(self.dictProtocolFeatures)):
+            return url
+        return url + ('&' if '?' in url else '?') + parsers.selectQuery(lstSelect)
+
+    # GET url and return the response before its body is read
+    def openStream(self, url, headers):
+        attempts = RequestAttempts(self, "GET", url, bRetry=False)
+        delay = attempts.begin()
+        try:
+            if (delay > 0):
+                time.sleep(delay)
+            if (self.limiter != None):
+                self.limiter.acquire()
+            attempts.sending()
+            stream = self.pool.stream("GET", url, None, headers)
+        except BaseException as e:
+            attempts.failed(e)
+            raise
+        attempts.answered(stream)
+        return stream
+
+    # GET the collection url and yield each member as soon as it is parsed
+    def streamMembers(self, strName, url, parse=None, dictProperties=None):
+        """GET a collection and parse its Members incrementally from the socket
+
+        The body is never held whole: each member is parsed and yielded as
+        soon as it has arrived (see jsonstream.MembersParser), so memory
+        stays bounded by the largest member.  The response is not retried
+        nor cached.
+
+        :param strName: The name logged with the request.
+        :type strName: str
+        :param url: The collection link (with $expand for inline members).
+        :type url: str
+        :param parse: Turns each member into the yielded value, e.g.
+                      parsers.parseLogEntry (default the member document).
+        :type parse: callable
+        :param dictProperties: Filled with the other top level properties
+                               of the collection (Members@odata.count,
+                               Members@odata.nextLink, ...).
+        :type dictProperties: dict
+        :returns: generator of the members
 
-    # Get SessionService/Sessions
-    def getSessionServiceSessions(self):
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        if (self.url != ''):
-            #self.url = self.urlEthernetInterfaces
-            self.method = "GET"
-            self.logger.info(
-                "--> getSessionServiceSessions [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    if i[0] == 'Members@odata.count':
-                        self.nCount = i[1]
-                    if i[0] == 'Members':
-                        if (self.get_logVerbose() >= 2):
-                            self.logger.debug(
-                                "%s: %s", i[0], json.dumps(i[1], indent=4))
-                    else:
-                        self.logger.debug("%s: %s", i[0], i[1])
-        # Get the next link(s) of getSessionServiceSessions
+        """
+        self.connect()
+        self.logger.info("--> %s [GET %s] (streamed)", strName, url)
+        headers = self.getHeaders("GET", url)
+        stream = self.openStream(url, headers)
+        if (stream.status in (401, 403) and
+                self.reauthenticate(headers.get('X-Auth-Token'), stream.status)):
+            stream.close()
+            headers['X-Auth-Token'] = self.authToken
+            self.logger.info("Replay [GET %s] with the new session", url)
+            stream = self.openStream(url, headers)
+        self.nLastStatus = stream.status
+        with stream:
+            if (stream.status != 200):
+                self.logger.info("response.status(reason)=%d(%s)",
+                                 stream.status, stream.reason)
+                return
+            parser = jsonstream.MembersParser(self.jsonBackend)
+            for chunk in stream.iterChunks():
+                for json_data in parser.feed(chunk):
+                    yield json_data if parse == None else parse(json_data)
+            parser.close()
+            with self.statsLock:
+                self.nBytes += stream.nBytes
+                self.nWireBytes += stream.nWireBytes
+        if (dictProperties != None):
+            dictProperties.update(parser.dictProperties)
+        self.logger.debug("%s: %d members streamed", strName, parser.nMembers)
+
+    # GET url and return the parsed body of a 200 response or None
+    def getResource(self, strName, url, nLogVerbose=1):
+        self.logger.info("--> %s [GET %s]", strName, url)
+        response = self.rfRequest(True, "GET", url)
+        if (self.get_logVerbose() >= nLogVerbose):
+            self.logger.debug("result=%s", response.text())
+        self.nLastStatus = response.getcode()
         if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members@odata.count':
-                    self.nCount = i[1]
-                elif i[0] == 'Members':
-                    json_data2 = dict(enumerate(i[1]))
-                    for ii in json_data2.items():
-                        for iii in ii[1].items():
-                            if iii[0] == '@odata.id':
-                                self.lstURL.append(iii[1])
-                                self.nIndex += 1
-                                if (self.get_logVerbose() >= 2):
-                                    self.logger.info(
-                                        "Next link=%s", self.lstURL[self.nIndex-1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+            return response.json()
+        return None
+
+    # GET url projected to lstSelect and return the parsed body or None
+    def getSelected(self, strName, url, lstSelect=None):
+        urlSelect = self.selectURL(url, lstSelect)
+        json_data = self.getResource(strName, urlSelect)
+        if (json_data != None and lstSelect and urlSelect == url):
+            json_data = parsers.selectProperties(json_data, lstSelect)
+        return json_data
+
+    # Keep the member links of a collection as the next links to walk
+    def setMembers(self, json_data, nLogVerbose=0, bSecond=False):
+        nCount, lstURL = parsers.parseMembers(json_data)
+        # Members that came back inline are served without another GET
+        dictExpanded = parsers.parseExpandedMembers(json_data)
+        with self.linkLock:
+            self.dictExpanded = dictExpanded
+        self.setCollection(nCount, lstURL, bSecond)
+        if (self.get_logVerbose() >= nLogVerbose):
+            for url in lstURL:
+                self.logger.info("Next link=%s", url)
+        return (nCount, lstURL)
+
+    # GET every member link in lstURL and log its properties
+    def getMembers(self, strName, lstURL, nCount=None, nLogVerbose=0, parse=None):
+        lstURL = [url for url in lstURL[:nCount] if url != '']
+        self.logger.debug("--> %s [GET %d members]", strName, len(lstURL))
+        return self.fetchMembers(lstURL, nLogVerbose=nLogVerbose, parse=parse)
+
+    # GET every url of lstURL concurrently and return the parsed bodies in order
+    def fetchMembers(self, lstURL, nConcurrency=None, progress=None, nLogVerbose=2,
+                     dictExpanded=None, parse=None):
+        """GET every member link concurrently, keeping the order of lstURL
+
+        :param lstURL: The member links to GET.
+        :type lstURL: list
+        :param nConcurrency: The maximum number of requests in flight to the
+                             BMC (default self.nConcurrency).
+        :type nConcurrency: int
+        :param progress: Called as progress(nDone, nTotal, url) after each
+                         member has been fetched.
+        :type progress: callable
+        :param nLogVerbose: The log verbose level from which each member's
+                            properties are logged.
+        :type nLogVerbose: int
+        :param dictExpanded: Members already fetched with $expand (default
+                             the ones of the last collection).
+        :type dictExpanded: dict
+        :param parse: Turns each member document into the returned record,
+                      e.g. parsers.parseMemory (default the document).
+        :type parse: callable
+        :returns: list of the parsed members (None for non-200 responses)
 
-    # Get SessionService/Sessions/*
-    def getSessionServiceSessionsAll(self):
-        for i in range(self.nCount):
-            if (self.lstURL[i] != ''):
-                self.url = self.lstURL[i]
-                self.method = "GET"
-                self.logger.debug(
-                    "--> getSessionServiceSessionsAll [%s %s]", self.method, self.url)
-                self.payload = None
-                response = self.rfRequest()
-                result = response.read().decode(errors='replace')
-                if (self.get_logVerbose() >= 2):
-                    self.logger.debug(result)
+        """
+        nTotal = len(lstURL)
+        lstDone = [0]
+        lock = threading.Lock()
+        if (dictExpanded == None):
+            with self.linkLock:
+                dictExpanded = self.dictExpanded
+
+        def fetchOne(url):
+            json_data = dictExpanded.get(url)
+            if (json_data == None):
+                response = self.rfRequest(False, "GET", url)
+                if (self.get_logVerbose() >= 3):
+                    self.logger.debug(response.text())
                 if (response.getcode() == 200):
-                    json_data = json.loads(result)
-                    for i in json_data.items():
-                        if (self.get_logVerbose() >= 1):
-                            self.logger.debug("%s: %s", i[0], i[1])
+                    json_data = response.json()
+            if (json_data != None and self.get_logVerbose() >= nLogVerbose):
+                self.logItems(json_data)
+            if (progress != None):
+                with lock:
+                    lstDone[0] += 1
+                    progress(lstDone[0], nTotal, url)
+            if (json_data != None and parse != None):
+                return parse(json_data)
+            return json_data
+
+        nMissing = len([url for url in lstURL if url not in dictExpanded])
+        nWorkers = max(1, min(nConcurrency or self.nConcurrency, nMissing))
+        if (nWorkers == 1):
+            return [fetchOne(url) for url in lstURL]
+        with ThreadPoolExecutor(max_workers=nWorkers) as executor:
+            return list(executor.map(fetchOne, lstURL))
+
+    # Crawl the whole tree breadth-first and yield each (uri, document)
+    def crawl(self, lstInclude=None, lstExclude=None, nMaxDepth=None, nConcurrency=None):
+        """Follow every @odata.id link from /redfish/v1; see crawler.Crawler
+
+        :returns: generator of (uri, dict) in the order they arrive
+
+        """
+        return Crawler(self, lstInclude, lstExclude, nMaxDepth, nConcurrency).crawl()
+
+    # Iterate lazily over the members of every page of the collection url
+    def iterCollection(self, strName, url, nPageSize=None, bPrefetch=True, nLogVerbose=2):
+        """Return a collection.CollectionIterator over the members of url
+
+        :param nPageSize: The members per $top/$skip page (default
+                          self.nPageSize).
+        :type nPageSize: int
+        :returns: CollectionIterator; its members are the documents when
+                  the BMC expanded them, otherwise {'@odata.id': link}
+
+        """
+        return CollectionIterator(self, strName, self.expandURL(url),
+                                  nPageSize or self.nPageSize, bPrefetch, nLogVerbose)
+
+    # Walk every page of the collection url and keep its member links as
+    # the next links to walk; return (collection, member links, members
+    # that came back inline)
+    def getPagedMembers(self, strName, url, nLogVerbose=1, nLinkVerbose=2):
+        collection = self.iterCollection(strName, url, nLogVerbose=nLogVerbose)
+        lstURL = []
+        dictExpanded = {}
+        for member in collection:
+            link = member.get('@odata.id', '')
+            if (link != ''):
+                lstURL.append(link)
+                if (len(member) > 1):
+                    dictExpanded[link] = member
+        with self.linkLock:
+            self.dictExpanded = dictExpanded
+        self.setCollection(len(lstURL), lstURL)
+        if (self.get_logVerbose() >= nLinkVerbose):
+            for link in lstURL:
+                self.logger.info("Next link=%s", link)
+        return (collection, lstURL, dictExpanded)
+
+    # Get SessionService and return the link of its Sessions
+    def getSessionService(self):
+        json_data = self.getResource("getSessionService", "/redfish/v1/SessionService")
+        # Get the next link of SessionService
+        url = ''
+        if (json_data != None):
+            url = parsers.parseLink(json_data, 'Sessions')
+            self.logItems(json_data)
+            self.logger.info("Next link=%s", url)
+        return self.setNext(url)
+
+    # Get SessionService/Sessions and return its member links
+    def getSessionServiceSessions(self, url=None):
+        url = self.url if url == None else url
+        self.setCollection(0, [])
+        if (url != ''):
+            # Get the next link(s) of getSessionServiceSessions, page by page
+            collection, lstURL, _ = self.getPagedMembers("getSessionServiceSessions", url)
+            self.logItems(collection.dictProperties)
+            return lstURL
+        return []
+
+    # Get SessionService/Sessions/*
+    def getSessionServiceSessionsAll(self, lstURL=None):
+        return self.getMembers("getSessionServiceSessionsAll",
+                               self.getCollection() if lstURL == None else lstURL, None, 1)
 
-    # Get AccountService
+    # Get AccountService and return the links of ACCOUNT_SERVICE_LINKS
     def getAccountService(self):
-        self.method = "GET"
-        self.url = "/redfish/v1/AccountService"
-        self.logger.info(
-            "--> getAccountService [%s %s]", self.method, self.url)
-        self.payload = None
-        response = self.rfRequest()
+        json_data = self.getResource("getAccountService", "/redfish/v1/AccountService")
         # Get the next link of AccountService
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if (i[0] in {"Accounts", "Roles", "PrivilegeMap"}):
-                    json_data2 = i[1]
-                    for ii in json_data2.items():
-                        if ii[0] == '@odata.id':
-                            self.lstURL.append(ii[1])
-                            self.nIndex += 1
-                            self.nCount += 1
-                            self.logger.debug("%s: %s", ii[0], ii[1])
-                            self.logger.info("Next link=%s", ii[1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+        if (json_data == None):
+            return self.setLinks([])
+        lstURL = self.setLinks(parsers.parseLinks(
+            json_data, parsers.ACCOUNT_SERVICE_LINKS))
+        self.logItems(json_data, parsers.ACCOUNT_SERVICE_LINKS)
+        return lstURL
+
+    # Get a collection of AccountService and return its member links
+    def getAccountServiceCollection(self, strName, url):
+        json_data = self.getResource(strName, self.expandURL(url))
+        self.setCollection(0, [], True)
+        # Get the next link(s) of the collection
+        if (json_data != None):
+            self.logItems(json_data, ('Members@odata.count', 'Members'))
+            return self.setMembers(json_data, 1, True)[1]
+        return []
 
     # Get AccountService/Accounts
     def getAccountServiceAccounts(self):
-        self.method = "GET"
-        self.url = "/redfish/v1/AccountService/Accounts"
-        self.logger.info(
-            "--> getAccountServiceAccounts [%s %s]", self.method, self.url)
-        self.payload = None
-        response = self.rfRequest()
-        # Get the next link of AccountServiceAccounts
-        self.lstURL2 = []
-        self.nCount2 = 0
-        self.nIndex2 = 0
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
-        # Get the next link(s) of AccountServiceAccounts
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members@odata.count':
-                    self.nCount2 = i[1]
-                elif i[0] == 'Members':
-                    json_data2 = dict(enumerate(i[1]))
-                    for ii in json_data2.items():
-                        for iii in ii[1].items():
-                            if iii[0] == '@odata.id':
-                                self.lstURL2.append(iii[1])
-                                self.nIndex2 += 1
-                                if (self.get_logVerbose() >= 1):
-                                    self.logger.info(
-                                        "Next link=%s", self.lstURL2[self.nIndex2-1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+        return self.getAccountServiceCollection(
+            "getAccountServiceAccounts", "/redfish/v1/AccountService/Accounts")
 
     # Get AccountService/Accounts/*
-    def getAccountServiceAccountsAll(self):
-        for i in range(self.nCount2):
-            if (self.lstURL2[i] != ''):
-                self.url = self.lstURL2[i]
-                self.method = "GET"
-                self.logger.debug(
-                    "--> getAccountServiceAccountsAll [%s %s]", self.method, self.url)
-                self.payload = None
-                response = self.rfRequest()
-                result = response.read().decode(errors='replace')
-                if (self.get_logVerbose() >= 1):
-                    self.logger.debug(result)
-                if (response.getcode() == 200):
-                    json_data = json.loads(result)
-                    for i in json_data.items():
-                        if (self.get_logVerbose() >= 1):
-                            self.logger.debug("%s: %s", i[0], i[1])
+    def getAccountServiceAccountsAll(self, lstURL=None):
+        return self.getMembers("getAccountServiceAccountsAll",
+                               self.getCollection(True) if lstURL == None else lstURL, None, 1)
 
     # Get AccountService/Roles
     def getAccountServiceRoles(self):
-        self.method = "GET"
-        self.url = "/redfish/v1/AccountService/Roles"
-        self.logger.info(
-            "--> getAccountServiceRoles [%s %s]", self.method, self.url)
-        self.payload = None
-        response = self.rfRequest()
-        # Get the next link of getAccountServiceRoles
-        self.lstURL2 = []
-        self.nCount2 = 0
-        self.nIndex2 = 0
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
-        # Get the next link(s) of AccountServiceAccounts
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members@odata.count':
-                    self.nCount2 = i[1]
-                elif i[0] == 'Members':
-                    json_data2 = dict(enumerate(i[1]))
-                    for ii in json_data2.items():
-                        for iii in ii[1].items():
-                            if iii[0] == '@odata.id':
-                                self.lstURL2.append(iii[1])
-                                self.nIndex2 += 1
-                                if (self.get_logVerbose() >= 1):
-                                    self.logger.info(
-                                        "Next link=%s", self.lstURL2[self.nIndex2-1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+        return self.getAccountServiceCollection(
+            "getAccountServiceRoles", "/redfish/v1/AccountService/Roles")
 
     # Get AccountService/Roles/*
-    def getAccountServiceRolesAll(self):
-        for i in range(self.nCount2):
-            if (self.lstURL2[i] != ''):
-                self.url = self.lstURL2[i]
-                self.method = "GET"
-                self.logger.debug(
-                    "--> getAccountServiceRolesAll [%s %s]", self.method, self.url)
-                self.payload = None
-                response = self.rfRequest()
-                result = response.read().decode(errors='replace')
-                if (self.get_logVerbose() >= 1):
-                    self.logger.debug(result)
-                if (response.getcode() == 200):
-                    json_data = json.loads(result)
-                    for i in json_data.items():
-                        if (self.get_logVerbose() >= 1):
-                            self.logger.debug("%s: %s", i[0], i[1])
+    def getAccountServiceRolesAll(self, lstURL=None):
+        return self.getMembers("getAccountServiceRolesAll",
+                               self.getCollection(True) if lstURL == None else lstURL, None, 1)
 
     # Get AccountService/PrivilegeMap
     def getAccountServicePrivilegeMap(self):
-        self.method = "GET"
-        self.url = "/redfish/v1/AccountService/PrivilegeMap"
-        self.logger.info(
-            "--> getAccountServicePrivilegeMap [%s %s]", self.method, self.url)
-        self.payload = None
-        response = self.rfRequest()
-        # Get the next link of getAccountServicePrivilegeMap
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 3):
-            self.logger.debug("result=%s", result)
+        """GET the PrivilegeMap and return the privileges of each operation
+
+        :returns: records.PrivilegeMap or None
 
-    # Get EventService
+        """
+        json_data = self.getResource("getAccountServicePrivilegeMap",
+                                     "/redfish/v1/AccountService/PrivilegeMap", 3)
+        if (json_data == None):
+            return None
+        return parsers.parsePrivilegeMap(json_data)
+
+    # Get EventService and return the links of EVENT_SERVICE_LINKS
     def getEventService(self):
-        self.method = "GET"
-        self.url = "/redfish/v1/EventService"
-        self.logger.info(
-            "--> getEventService [%s %s]", self.method, self.url)
-        self.payload = None
-        response = self.rfRequest()
+        json_data = self.getResource("getEventService", "/redfish/v1/EventService")
         # Get the next link of EventService
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if (i[0] in {"Subscriptions"}):
-                    json_data2 = i[1]
-                    for ii in json_data2.items():
-                        if ii[0] == '@odata.id':
-                            self.lstURL.append(ii[1])
-                            self.nIndex += 1
-                            self.nCount += 1
-                            self.logger.debug("%s: %s", ii[0], ii[1])
-                            self.logger.info("Next link=%s", ii[1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
-
-    # Get EventService/Subscriptions
+        if (json_data == None):
+            return self.setLinks([])
+        lstURL = self.setLinks(parsers.parseLinks(
+            json_data, parsers.EVENT_SERVICE_LINKS))
+        self.logItems(json_data, parsers.EVENT_SERVICE_LINKS)
+        return lstURL
+
+    # Get EventService/Subscriptions and return its member links
     def getEventServiceSubscriptions(self):
-        self.method = "GET"
-        self.url = "/redfish/v1/EventService/Subscriptions"
-        self.logger.info(
-            "--> getEventServiceSubscriptions [%s %s]", self.method, self.url)
-        self.payload = None
-        response = self.rfRequest()
-        # Get the next link of AccountService
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
-        # Get the next link(s) of getEventServiceSubscriptions
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members@odata.count':
-                    self.nCount = i[1]
-                elif i[0] == 'Members':
-                    json_data2 = dict(enumerate(i[1]))
-                    for ii in json_data2.items():
-                        for iii in ii[1].items():
-                            if iii[0] == '@odata.id':
-                                self.lstURL.append(iii[1])
-                                self.nIndex += 1
-                                if (self.get_logVerbose() >= 1):
-                                    self.logger.info(
-                                        "Next link=%s", self.lstURL[self.nIndex-1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+        # Get the next link(s) of getEventServiceSubscriptions, page by page
+        collection, lstURL, _ = self.getPagedMembers(
+            "getEventServiceSubscriptions", "/redfish/v1/EventService/Subscriptions", 1, 1)
+        self.logItems(collection.dictProperties, ('Members@odata.count',))
+        return lstURL
 
-                                    
-    # Get Chassis
+    # Get Chassis and return the link of its first member
     def getChassis(self):
-        self.method = "GET"
-        self.url = "/redfish/v1/Chassis"
-        self.logger.info("--> getChassis [%s %s]", self.method, self.url)
-        self.payload = None
-        response = self.rfRequest()
+        json_data = self.getResource("getChassis", "/redfish/v1/Chassis")
         # Get the next link of Chassis
-        self.url = ''
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug("result=%s", result)
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members':
-                    json_data2 = i[1][0]
-                    for ii in json_data2.items():
-                        if ii[0] == '@odata.id':
-                            self.url = ii[1]
-                    self.logger.debug("%s: %s", i[0], i[1])
-                    self.logger.info("Next link=%s", self.url)
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+        url = ''
+        if (json_data != None):
+            url = parsers.parseFirstMember(json_data)
+            self.logItems(json_data)
+            self.logger.info("Next link=%s", url)
+        return self.setNext(url)
 
-    # Get Chassis/1u
-    def getChassis1u(self):
-        if (self.url != ''):
-            self.method = "GET"
-            self.payload = None
-            self.logger.info("--> getChassis1u [%s %s]", self.method, self.url)
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug("result=%s", result)
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    if i[0] == "Thermal":
-                        json_data2 = json.loads(json.dumps(i[1]))
-                        for ii in json_data2.items():
-                            if ii[0] == '@odata.id':
-                                self.urlThermal = ii[1]
-                        self.logger.debug("%s: %s", ii[0], ii[1])
-                        self.logger.info(
-                            "Thermal self.url=%s", self.urlThermal)
-                    elif i[0] == 'Power':
-                        json_data2 = json.loads(json.dumps(i[1]))
-                        for ii in json_data2.items():
-                            if ii[0] == '@odata.id':
-                                self.urlPower = ii[1]
-                        self.logger.debug("%s: %s", i[0], i[1])
-                        self.logger.info("Power self.url=%s", self.urlPower)
-                    else:
-                        self.logger.debug("%s: %s", i[0], i[1])
+    # Get Chassis/1u (or the chassis at url) and keep its Thermal and Power links
+    def getChassis1u(self, url=None):
+        """GET a chassis and keep its Thermal and Power links
+
+        :returns: parsers.parseChassis() of the chassis or None
+
+        """
+        url = self.url if url == None else url
+        dictChassis = None
+        if (url != ''):
+            json_data = self.getResource("getChassis1u", url)
+            if (json_data != None):
+                dictChassis = parsers.parseChassis(json_data)
+                self.updateLinks({'urlThermal': dictChassis['Thermal'],
+                                  'urlPower': dictChassis['Power']})
+                self.logItems(json_data)
+                self.logger.info("Thermal self.url=%s", dictChassis['Thermal'])
+                self.logger.info("Power self.url=%s", dictChassis['Power'])
+                self.saveLinks()
+        return dictChassis
 
     # Get Chassis/1u/Thermal
-    def getChassis1uThermal(self):
+    def getChassis1uThermal(self, bSelect=False):
+        """GET Thermal and return its temperatures and fan speeds
+
+        :param bSelect: Only fetch the properties in parsers.THERMAL_SELECT.
+        :type bSelect: bool
+        :returns: parsers.parseThermal() of Thermal or None
+
+        """
+        dictThermal = None
         if (self.urlThermal != ''):
-            self.method = "GET"
-            self.url = self.urlThermal
-            self.logger.info(
-                "--> getChassis1uThermal [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    if i[0] == "Temperatures":
-                        self.logger.debug("Temperatures")
-                        json_data2 = dict(enumerate(i[1]))
-                        for ii in json_data2.items():
-                            for iii in ii[1].items():
-                                if iii[0] == 'Name':
-                                    sensorName = iii[1]
-                                elif iii[0] == 'ReadingCelsius':
-                                    sensorValues = iii[1]
-                                    self.logger.debug(
-                                        "SensorName: %s = %s °C", sensorName, sensorValues)
-                    elif i[0] == 'Fans':
-                        self.logger.info("Fans")
-                        json_data2 = dict(enumerate(i[1]))
-                        for ii in json_data2.items():
-                            for iii in ii[1].items():
-                                if iii[0] == 'Name':
-                                    sensorName = iii[1]
-                                elif iii[0] == 'Reading':
-                                    sensorValues = iii[1]
-                                    self.logger.info(
-                                        "SensorName: %s=%s RPM", sensorName, sensorValues)
-                    elif i[0] == 'Redundancy':
-                        self.logger.info("Redundancy")
-                    else:
-                        self.logger.debug("%s: %s", i[0], i[1])
+            json_data = self.fetchLink(
+                'urlThermal', lambda url: self.getSelected(
+                    "getChassis1uThermal", url,
+                    parsers.THERMAL_SELECT if bSelect else None),
+                self.discoverChassis)
+            if (json_data != None):
+                dictThermal = parsers.parseThermal(json_data)
+                if (self.bLogItems):
+                    self.logger.debug("Temperatures")
+                    for reading in dictThermal['Temperatures']:
+                        self.logger.debug(
+                            "SensorName: %s = %s °C", reading.name, reading.readingCelsius)
+                    self.logger.info("Fans")
+                    for reading in dictThermal['Fans']:
+                        self.logger.info(
+                            "SensorName: %s=%s RPM", reading.name, reading.reading)
+                self.logItems(json_data, ('Temperatures', 'Fans', 'Redundancy'))
+        return dictThermal
 
     # Get Chassis/1u/Power
-    def getChassis1uPower(self):
+    def getChassis1uPower(self, bSelect=False):
+        """GET Power and return its voltages and PSU input voltages
+
+        :param bSelect: Only fetch the properties in parsers.POWER_SELECT.
+        :type bSelect: bool
+        :returns: parsers.parsePower() of Power or None
+
+        """
+        dictPower = None
         if (self.urlPower != ''):
-            self.method = "GET"
-            self.url = self.urlPower
-            self.logger.info(
-                "--> getChassis1uPower [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    if i[0] == "Voltages":
-                        self.logger.debug("Voltages")
-                        json_data2 = dict(enumerate(i[1]))
-                        for ii in json_data2.items():
-                            for iii in ii[1].items():
-                                if iii[0] == 'Name':
-                                    sensorName = iii[1]
-                                elif iii[0] == 'ReadingVolts':
-                                    sensorValues = iii[1]
-                                    self.logger.info(
-                                        "SensorName: %s=%s V(DC)", sensorName, sensorValues)
-                    elif i[0] == 'PowerSupplies':
-                        self.logger.info("PowerSupplies")
-                        json_data2 = dict(enumerate(i[1]))
-                        for ii in json_data2.items():
-                            for iii in ii[1].items():
-                                if iii[0] == 'Name':
-                                    sensorName = iii[1]
-                                elif iii[0] == 'LineInputVoltage':
-                                    sensorValues = iii[1]
-                                    self.logger.info(
-                                        "SensorName: %s=%s V(AC)", sensorName, sensorValues)
-                    elif i[0] == 'Redundancy':
-                        self.logger.info("Redundancy")
-                    else:
-                        self.logger.debug("%s: %s", i[0], i[1])
-
-    # Get Systems
+            json_data = self.fetchLink(
+                'urlPower', lambda url: self.getSelected(
+                    "getChassis1uPower", url,
+                    parsers.POWER_SELECT if bSelect else None),
+                self.discoverChassis)
+            if (json_data != None):
+                dictPower = parsers.parsePower(json_data)
+                if (self.bLogItems):
+                    self.logger.debug("Voltages")
+                    for reading in dictPower['Voltages']:
+                        self.logger.info(
+                            "SensorName: %s=%s V(DC)", reading.name, reading.readingVolts)
+                    self.logger.info("PowerSupplies")
+                    for reading in dictPower['PowerSupplies']:
+                        self.logger.info(
+                            "SensorName: %s=%s V(AC)", reading.name, reading.lineInputVoltage)
+                self.logItems(json_data, ('Voltages', 'PowerSupplies', 'Redundancy'))
+        return dictPower
+
+    # Get Systems and return the link of its first member
     def getSystems(self):
-        self.url = "/redfish/v1/Systems"
-        self.method = "GET"
-        self.logger.info("--> getSystems [%s %s]", self.method, self.url)
-        self.payload = None
-        response = self.rfRequest()
-        result = response.read().decode(errors='replace')
-        if (self.get_logVerbose() >= 1):
-            self.logger.debug(result)
+        json_data = self.getResource("getSystems", "/redfish/v1/Systems")
         # Get the next link of Systems
-        self.url = ''
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members':
-                    json_data2 = i[1][0]
-                    for ii in json_data2.items():
-                        if ii[0] == '@odata.id':
-                            self.url = ii[1]
-                    self.logger.debug("%s: %s", i[0], i[1])
-                    self.logger.info("Next link=%s", self.url)
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
-
-    # Get Systems/0
-    def getSystems0(self):
-        if (self.url != ''):
-            self.url = "/redfish/v1/Systems/0"
-            self.method = "GET"
-            self.logger.debug("--> getSystems0 [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    if i[0] == "PowerState":
-                        self.strPowerState = i[1]
-                        self.logger.debug("%s: %s", i[0], i[1])
-                    elif i[0] == "Bios":
-                        json_data2 = json.loads(json.dumps(i[1]))
-                        for ii in json_data2.items():
-                            if ii[0] == '@odata.id':
-                                self.urlBios = ii[1]
-                        self.logger.debug("%s: %s", i[0], i[1])
-                        self.logger.info("Next link=%s", self.urlBios)
-                    elif i[0] == 'Processors':
-                        json_data2 = json.loads(json.dumps(i[1]))
-                        for ii in json_data2.items():
-                            if ii[0] == '@odata.id':
-                                self.urlProcessors = ii[1]
-                        self.logger.debug("%s: %s", i[0], i[1])
-                        self.logger.info("Next link=%s", self.urlProcessors)
-                    elif i[0] == 'SimpleStorage':
-                        json_data2 = json.loads(json.dumps(i[1]))
-                        for ii in json_data2.items():
-                            if ii[0] == '@odata.id':
-                                self.urlSimpleStorage = ii[1]
-                        self.logger.debug("%s: %s", i[0], i[1])
-                        self.logger.info("Next link=%s", self.urlSimpleStorage)
-                    elif i[0] == 'Memory':
-                        json_data2 = json.loads(json.dumps(i[1]))
-                        for ii in json_data2.items():
-                            if ii[0] == '@odata.id':
-                                self.urlMemory = ii[1]
-                        self.logger.debug("%s: %s", i[0], i[1])
-                        self.logger.info("Next link=%s", self.urlMemory)
-                    elif i[0] == 'EthernetInterfaces':
-                        json_data2 = json.loads(json.dumps(i[1]))
-                        for ii in json_data2.items():
-                            if ii[0] == '@odata.id':
-                                self.urlEthernetInterfaces = ii[1]
-                        self.logger.debug("%s: %s", i[0], i[1])
-                        self.logger.info(
-                            "Next link=%s", self.urlEthernetInterfaces)
-                    elif i[0] == 'LogServices':
-                        json_data2 = json.loads(json.dumps(i[1]))
-                        for ii in json_data2.items():
-                            if ii[0] == '@odata.id':
-                                self.urlLogServices = ii[1]
-                        self.logger.debug("%s: %s", i[0], i[1])
-                        self.logger.info("Next link=%s", self.urlLogServices)
-                    else:
-                        if (i[0] == 'Voltages' or i[0] == 'PowerSupplies'):
-                            self.logger.debug("%s: a lots of data", i[0])
-                        else:
-                            self.logger.debug("%s: %s", i[0], i[1])
-
-    # Get Systems/0/Bios
+        url = ''
+        if (json_data != None):
+            url = parsers.parseFirstMember(json_data)
+            self.logItems(json_data)
+            self.logger.info("Next link=%s", url)
+        return self.setNext(url)
+
+    # Get Systems/0 (the system at url), keep the links of its resources and
+    # return parseSystem()
+    def getSystems0(self, url=None):
+        url = self.url if url == None else url
+        dictSystem = None
+        if (url != ''):
+            json_data = self.getResource("getSystems0", url)
+            if (json_data != None):
+                dictSystem = parsers.parseSystem(json_data)
+                with self.linkLock:
+                    self.strPowerState = dictSystem['PowerState']
+                    self.urlReset = dictSystem['Reset']
+                    self.updateLinks({'urlBios': dictSystem['Bios'],
+                                      'urlProcessors': dictSystem['Processors'],
+                                      'urlSimpleStorage': dictSystem['SimpleStorage'],
+                                      'urlMemory': dictSystem['Memory'],
+                                      'urlEthernetInterfaces': dictSystem['EthernetInterfaces'],
+                                      'urlLogServices': dictSystem['LogServices']})
+                for key in parsers.SYSTEM_LINKS:
+                    self.logger.info("Next link=%s", dictSystem[key])
+                self.logItems(json_data)
+                self.saveLinks()
+        return dictSystem
+
+    # GET a resource of Systems/0 and log its properties
+    def getSystems0Resource(self, strName, url):
+        with self.linkLock:
+            json_data = self.dictExpanded.get(url)
+        if (json_data != None):
+            self.logger.info("--> %s [$expand %s]", strName, url)
+            self.logItems(json_data)
+            return json_data
+        json_data = self.getResource(strName, url)
+        if (json_data != None):
+            self.logItems(json_data)
+        return json_data
+
+    # GET a collection of Systems/0 and keep its member links
+    def getSystems0Collection(self, strName, url):
+        json_data = self.getSystems0Resource(strName, self.expandURL(url))
+        # Get the next link(s) of the collection
+        self.setCollection(0, [])
+        if (json_data != None):
+            self.setMembers(json_data)
+        return json_data
+
+    # Return the member links of a Systems/0 collection
+    def getCollectionMembers(self, json_data):
+        if (json_data == None):
+            return []
+        nCount, lstURL = parsers.parseMembers(json_data)
+        return [url for url in lstURL[:nCount] if url != '']
+
+    # Get Systems/0/Bios and return parsers.parseBios() of it
     def getSystems0Bios(self):
+        json_data = None
         if (self.urlBios != ''):
-            self.url = self.urlBios
-            self.method = "GET"
-            self.logger.info(
-                "--> getSystems0Bios [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            # Get contents of Systems/Bios
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    self.logger.debug("%s: %s", i[0], i[1])
+            json_data = self.fetchLink('urlBios', lambda url: self.getSystems0Resource(
+                "getSystems0Bios", url), self.discoverSystems)
+        return None if json_data == None else parsers.parseBios(json_data)
 
-    # Get Systems/0/Processors
+    # Get Systems/0/Processors and return the link of its first member
     def getSystems0Processors(self):
+        json_data = None
         if (self.urlProcessors != ''):
-            self.url = self.urlProcessors
-            self.method = "GET"
-            self.logger.info(
-                "--> getSystems0Processors [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            # Get contents of Systems/Bios
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    self.logger.debug("%s: %s", i[0], i[1])
+            json_data = self.fetchLink('urlProcessors', lambda url: self.getSystems0Resource(
+                "getSystems0Processors", self.expandURL(url)), self.discoverSystems)
         # Get the next link of Processors
-        self.url = ''
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members':
-                    json_data2 = i[1][0]
-                    for ii in json_data2.items():
-                        if ii[0] == '@odata.id':
-                            self.url = ii[1]
-                    self.logger.debug("%s: %s", i[0], i[1])
-                    self.logger.info("Next link=%s", self.url)
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
-
-    # Get Systems/0/Processors/CPU0
-    def getSystems0ProcessorsCPU0(self):
-        if (self.url != ''):
-            self.method = "GET"
-            self.logger.info(
-                "--> getSystems0ProcessorsCPU0 [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            # Get contents of Systems/Bios
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    self.logger.debug("%s: %s", i[0], i[1])
-
-    # Get Systems/0/SimpleStorage
+        url = ''
+        if (json_data != None):
+            dictExpanded = parsers.parseExpandedMembers(json_data)
+            with self.linkLock:
+                self.dictExpanded = dictExpanded
+            url = parsers.parseFirstMember(json_data)
+            self.logger.info("Next link=%s", url)
+        return self.setNext(url)
+
+    # Get Systems/0/Processors/CPU0 (or the processor at url) and return
+    # parsers.parseProcessor() of it
+    def getSystems0ProcessorsCPU0(self, url=None):
+        url = self.url if url == None else url
+        json_data = None
+        if (url != ''):
+            json_data = self.getSystems0Resource("getSystems0ProcessorsCPU0", url)
+        return None if json_data == None else parsers.parseProcessor(json_data)
+
+    # Get Systems/0/SimpleStorage and return its member links
     def getSystems0SimpleStorage(self):
         if (self.urlSimpleStorage != ''):
-            self.url = self.urlSimpleStorage
-            self.method = "GET"
-            self.logger.debug(
-                "--> getSystems0SimpleStorage [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            # Get contents of Systems/Bios
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    self.logger.debug("%s: %s", i[0], i[1])
-        # Get the next link(s) of SimpleStorage
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members@odata.count':
-                    self.nCount = i[1]
-                elif i[0] == 'Members':
-                    json_data2 = dict(enumerate(i[1]))
-                    for ii in json_data2.items():
-                        for iii in ii[1].items():
-                            if iii[0] == '@odata.id':
-                                self.lstURL.append(iii[1])
-                                self.nIndex = self.nIndex + 1
-                                self.logger.info(
-                                    "Next link=%s", self.lstURL[self.nIndex-1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+            return self.getCollectionMembers(self.fetchLink(
+                'urlSimpleStorage', lambda url: self.getSystems0Collection(
+                    "getSystems0SimpleStorage", url), self.discoverSystems))
+        return []
 
     # Get Systems/0/SimpleStorage/*
-    def getSystems0SimpleStorageAll(self):
-        for i in range(self.nCount):
-            if (self.lstURL[i] != ''):
-                self.url = self.lstURL[i]
-                self.method = "GET"
-                self.logger.debug(
-                    "--> getSystems0SimpleStorageAll [%s %s]", self.method, self.url)
-                self.payload = None
-                response = self.rfRequest()
-                result = response.read().decode(errors='replace')
-                if (self.get_logVerbose() >= 1):
-                    self.logger.debug(result)
-                if (response.getcode() == 200):
-                    json_data = json.loads(result)
-                    for i in json_data.items():
-                        self.logger.debug("%s: %s", i[0], i[1])
+    def getSystems0SimpleStorageAll(self, lstURL=None):
+        return self.getMembers("getSystems0SimpleStorageAll",
+                               self.getCollection() if lstURL == None else lstURL,
+                               parse=parsers.parseStorage)
 
-    # Get Systems/0/Memory
+    # Get Systems/0/Memory and return its member links
     def getSystems0Memory(self):
         if (self.urlMemory != ''):
-            self.url = self.urlMemory
-            self.method = "GET"
-            self.logger.info(
-                "--> getSystems0Memory [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    self.logger.debug("%s: %s", i[0], i[1])
-        # Get the next link(s) of Memory
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members@odata.count':
-                    self.nCount = i[1]
-                elif i[0] == 'Members':
-                    json_data2 = dict(enumerate(i[1]))
-                    for ii in json_data2.items():
-                        for iii in ii[1].items():
-                            if iii[0] == '@odata.id':
-                                self.lstURL.append(iii[1])
-                                self.nIndex = self.nIndex + 1
-                                self.logger.info(
-                                    "Next link=%s", self.lstURL[self.nIndex-1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+            return self.getCollectionMembers(self.fetchLink(
+                'urlMemory', lambda url: self.getSystems0Collection(
+                    "getSystems0Memory", url), self.discoverSystems))
+        return []
 
     # Get Systems/0/Memory/*
-    def getSystems0MemoryAll(self):
-        for i in range(self.nCount):
-            if (self.lstURL[i] != ''):
-                self.url = self.lstURL[i]
-                self.method = "GET"
-                self.logger.info(
-                    "--> getSystems0MemoryAll [%s %s]", self.method, self.url)
-                self.payload = None
-                response = self.rfRequest()
-                result = response.read().decode(errors='replace')
-                if (self.get_logVerbose() >= 1):
-                    self.logger.debug(result)
-                if (response.getcode() == 200):
-                    json_data = json.loads(result)
-                    for i in json_data.items():
-                        self.logger.debug("%s: %s", i[0], i[1])
+    def getSystems0MemoryAll(self, lstURL=None):
+        return self.getMembers("getSystems0MemoryAll",
+                               self.getCollection() if lstURL == None else lstURL,
+                               parse=parsers.parseMemory)
 
-    # Get Systems/0/EthernetInterfaces
+    # Get Systems/0/EthernetInterfaces and return its member links
     def getSystems0EthernetInterfaces(self):
         if (self.urlEthernetInterfaces != ''):
-            self.url = self.urlEthernetInterfaces
-            self.method = "GET"
-            self.logger.info(
-                "--> getSystems0EthernetInterfaces [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    self.logger.debug("%s: %s", i[0], i[1])
-        # Get the next link(s) of EthernetInterfaces
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members@odata.count':
-                    self.nCount = i[1]
-                elif i[0] == 'Members':
-                    json_data2 = dict(enumerate(i[1]))
-                    for ii in json_data2.items():
-                        for iii in ii[1].items():
-                            if iii[0] == '@odata.id':
-                                self.lstURL.append(iii[1])
-                                self.nIndex = self.nIndex + 1
-                                self.logger.info(
-                                    "Next link=%s", self.lstURL[self.nIndex-1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+            return self.getCollectionMembers(self.fetchLink(
+                'urlEthernetInterfaces', lambda url: self.getSystems0Collection(
+                    "getSystems0EthernetInterfaces", url), self.discoverSystems))
+        return []
 
     # Get Systems/0/EthernetInterfaces/*
-    def getSystems0EthernetInterfacesAll(self):
-        for i in range(self.nCount):
-            if (self.lstURL[i] != ''):
-                self.url = self.lstURL[i]
-                self.method = "GET"
-                self.logger.info(
-                    "--> getSystems0EthernetInterfacesAll [%s %s]", self.method, self.url)
-                self.payload = None
-                response = self.rfRequest()
-                result = response.read().decode(errors='replace')
-                if (self.get_logVerbose() >= 1):
-                    self.logger.debug(result)
-                if (response.getcode() == 200):
-                    json_data = json.loads(result)
-                    for i in json_data.items():
-                        self.logger.debug("%s: %s", i[0], i[1])
+    def getSystems0EthernetInterfacesAll(self, lstURL=None):
+        return self.getMembers("getSystems0EthernetInterfacesAll",
+                               self.getCollection() if lstURL == None else lstURL,
+                               parse=parsers.parseEthernetInterface)
 
-    # Get Systems/0/LogServices
+    # Get Systems/0/LogServices and return its member links
     def getSystems0LogServices(self):
         if (self.urlLogServices != ''):
-            self.url = self.urlLogServices
-            self.method = "GET"
-            self.logger.info(
-                "--> getSystems0LogServices [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    self.logger.debug("%s: %s", i[0], i[1])
-        # Get the next link(s) of LogServices
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members@odata.count':
-                    self.nCount = i[1]
-                elif i[0] == 'Members':
-                    json_data2 = dict(enumerate(i[1]))
-                    for ii in json_data2.items():
-                        for iii in ii[1].items():
-                            if iii[0] == '@odata.id':
-                                self.lstURL.append(iii[1])
-                                self.nIndex = self.nIndex + 1
-                                self.logger.info(
-                                    "Next link=%s", self.lstURL[self.nIndex-1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+            return self.getCollectionMembers(self.fetchLink(
+                'urlLogServices', lambda url: self.getSystems0Collection(
+                    "getSystems0LogServices", url), self.discoverSystems))
+        return []
 
-    # Get Systems/0/LogServices/Log
-    def getSystems0LogServicesLog(self):
-        self.urlLogEntries = ''
-        for i in range(self.nCount):
-            if (self.lstURL[i] != ''):
-                self.url = self.lstURL[i]
-                self.method = "GET"
-                self.logger.info(
-                    "--> getSystems0LogServicesLog [%s %s]", self.method, self.url)
-                self.payload = None
-                response = self.rfRequest()
-                result = response.read().decode(errors='replace')
-                if (self.get_logVerbose() >= 1):
-                    self.logger.debug(result)
-                if (response.getcode() == 200):
-                    json_data = json.loads(result)
-                    for i in json_data.items():
-                        self.logger.debug("%s: %s", i[0], i[1])
-                    if i[0] == 'Entries':
-                        json_data2 = list(i[1].items())
-                        if json_data2[0][0] == '@odata.id':
-                            self.urlLogEntries = json_data2[0][1]
-                            self.logger.info(
-                                "Next link=%s", self.urlLogEntries)
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+    # Get Systems/0/LogServices/Log and keep the link of its Entries
+    def getSystems0LogServicesLog(self, lstURL=None):
+        """GET each log service and keep the Entries link of the last one
+
+        :param lstURL: The log service links (default: the members of the
+                       last collection read).
+        :type lstURL: list
+        :returns: list of parsers.parseLogService() of the log services
+
+        """
+        urlLogEntries = ''
+        lstLogService = []
+        for url in (self.getCollection() if lstURL == None else lstURL):
+            json_data = self.getSystems0Resource(
+                "getSystems0LogServicesLog", url)
+            if (json_data != None):
+                logService = parsers.parseLogService(json_data)
+                lstLogService.append(logService)
+                if (logService.entries != ''):
+                    urlLogEntries = logService.entries
+                    self.logger.info("Next link=%s", urlLogEntries)
+        self.updateLinks({'urlLogEntries': urlLogEntries})
+        self.saveLinks()
+        return lstLogService
 
     # Get Systems/0/LogServices/Log/Entries
-    def getSystems0LogServicesLogEntries(self):
-        if (self.urlLogEntries != ''):
-            self.url = self.urlLogEntries
-            self.method = "GET"
+    def getSystems0LogServicesLogEntries(self, nConcurrency=None, progress=None):
+        """GET the log entry collection and then every entry concurrently
+
+        :param nConcurrency: The maximum number of entry requests in flight
+                             (default self.nConcurrency).
+        :type nConcurrency: int
+        :param progress: Called as progress(nDone, nTotal, url) after each
+                         entry, e.g. to print a console line per entry.
+        :type progress: callable
+        :returns: list of parsers.parseLogEntry() of the entries in
+                  collection order
+
+        """
+        urlLogEntries = self.urlLogEntries
+        lstURL = []
+        dictExpanded = {}
+        if (urlLogEntries != ''):
+            # Get the next link(s) of Entries, page by page
+            collection, lstURL, dictExpanded = self.getPagedMembers(
+                "getSystems0LogServicesLogEntries", urlLogEntries, 2, 2)
+            if (collection.nPages == 0 and self.isStaleLink(urlLogEntries)):
+                self.discoverLogEntries()
+                return self.getSystems0LogServicesLogEntries(nConcurrency, progress)
+            self.logItems(collection.dictProperties, ('Members@odata.count',))
             self.logger.info(
-                "--> getSystems0LogServicesLogEntries [%s %s]", self.method, self.url)
-            self.payload = None
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
-            if (self.get_logVerbose() >= 2):
-                self.logger.debug(result)
-            if (response.getcode() == 200):
-                json_data = json.loads(result)
-                for i in json_data.items():
-                    if (i[0] != "Members"):
-                        self.logger.debug("%s: %s", i[0], i[1])
-        # Get the next link(s) of Entries
-        self.lstURL = []
-        self.nCount = 0
-        self.nIndex = 0
-        if (response.getcode() == 200):
-            json_data = json.loads(result)
-            for i in json_data.items():
-                if i[0] == 'Members@odata.count':
-                    self.nCount = i[1]
-                    self.logger.info(
-                        "Number of LogServicesLogEntries %d", self.nCount)
-                elif i[0] == 'Members':
-                    json_data2 = dict(enumerate(i[1]))
-                    for ii in json_data2.items():
-                        for iii in ii[1].items():
-                            if iii[0] == '@odata.id':
-                                self.lstURL.append(iii[1])
-                                self.nIndex = self.nIndex + 1
-                                if (self.get_logVerbose() >= 2):
-                                    self.logger.debug(
-                                        "Next link=%s", self.lstURL[self.nIndex-1])
-                else:
-                    self.logger.debug("%s: %s", i[0], i[1])
+                "Number of LogServicesLogEntries %d", len(lstURL))
         # Get Systems/0/LogServices/Log/Entries/*
-        for i in range(self.nCount):
-            if (self.lstURL[i] != ''):
-                if (self.get_logVerbose() <= 1):
-                    if i < self.nCount - 1:
-                        print("\rLogServicesLogEntries({})={}".format(i+1, self.lstURL[i]), end = '')
-                    else:
-                        print("\rLogServicesLogEntries({})={}".format(i+1, self.lstURL[i]))
-                self.url = self.lstURL[i]
-                self.method = "GET"
-                self.payload = None
-                response = self.rfRequest(False)
-                result = response.read().decode(errors='replace')
-                if (self.get_logVerbose() >= 3):
-                    self.logger.debug(result)
-                if (response.getcode() == 200):
-                    json_data = json.loads(result)
-                    for i in json_data.items():
-                        if (self.get_logVerbose() >= 2):
-                            self.logger.debug("%s: %s", i[0], i[1])
+        return self.fetchMembers(lstURL, nConcurrency, progress, dictExpanded=dictExpanded,
+                                 parse=parsers.parseLogEntry)
+
+    # Yield every entry of Systems/0/LogServices/Log/Entries as it arrives
+    def iterSystems0LogServicesLogEntries(self, nConcurrency=None):
+        """Stream the log entry collection instead of reading it whole
+
+        Entries that come back inline ($expand) are yielded as soon as they
+        are parsed off the socket, page after page of Members@odata.nextLink.
+        Entries that are only linked are fetched once the collection has
+        been read (its connection is then free), nConcurrency at a time, so
+        memory stays bounded by their links.
+
+        :param nConcurrency: The maximum number of entry requests in flight
+                             (default self.nConcurrency).
+        :type nConcurrency: int
+        :returns: generator of parsers.parseLogEntry() of the entries
+
+        """
+        urlLogEntries = self.urlLogEntries
+        if (urlLogEntries == ''):
+            return
+        lstURL = []
+        url = self.expandURL(urlLogEntries)
+        setSeen = set()
+        while (url != '' and url not in setSeen):
+            setSeen.add(url)
+            dictProperties = {}
+            for json_data in self.streamMembers("iterSystems0LogServicesLogEntries", url,
+                                                dictProperties=dictProperties):
+                if (len(json_data) > 1):
+                    yield parsers.parseLogEntry(json_data)
+                elif (json_data.get('@odata.id', '') != ''):
+                    lstURL.append(json_data['@odata.id'])
+            if (len(setSeen) == 1 and self.isStaleLink(urlLogEntries)):
+                self.discoverLogEntries()
+                for entry in self.iterSystems0LogServicesLogEntries(nConcurrency):
+                    yield entry
+                return
+            url = parsers.parseNextLink(dictProperties)
+        nBatch = max(1, nConcurrency or self.nConcurrency)
+        for i in range(0, len(lstURL), nBatch):
+            for entry in self.fetchMembers(lstURL[i:i + nBatch], nConcurrency, dictExpanded={},
+                                           parse=parsers.parseLogEntry):
+                yield entry
 
     # GracefulShutdown or Power on
     def actionGracefulShutdownOrPowerOn(self):
-        if (self.strPowerState != ''):
-            self.url = "/redfish/v1/Systems/0/Actions/ComputerSystem.Reset"
-            self.method = "POST"
+        with self.linkLock:
+            strPowerState, url = self.strPowerState, self.urlReset
+        if (strPowerState != ''):
+            url = url or "/redfish/v1/Systems/0/Actions/ComputerSystem.Reset"
             self.logger.info(
-                "--> actionGracefulShutdownOrPowerOn [%s %s]", self.method, self.url)
-            if (self.strPowerState == 'On'):
-                #self.payload = {'ResetType': 'GracefulShutdown'}
-                data = dict()
-                data['ResetType'] = 'GracefulShutdown'
-                self.payload = data
-                self.logger.info('self.payload GracefulShutdown')
+                "--> actionGracefulShutdownOrPowerOn [%s %s]", "POST", url)
+            if (strPowerState == 'On'):
+                payload = {'ResetType': 'GracefulShutdown'}
+                self.logger.info('payload GracefulShutdown')
             else:
-                #self.payload = {'ResetType': 'On'}
-                data = dict()
-                data['ResetType'] = 'On'
-                self.payload = data
-                self.logger.info('self.payload Power On')
-            response = self.rfRequest()
-            result = response.read().decode(errors='replace')
+                payload = {'ResetType': 'On'}
+                self.logger.info('payload Power On')
+            response = self.rfRequest(True, "POST", url, payload)
             if (self.get_logVerbose() >= 1):
-                self.logger.debug(result)
-        self.payload = None
\ No newline at end of file
+                self.logger.debug(response.text())
+            return response
+        return None
+
+    # GET a collection and every one of its members concurrently
+    def fetchCollection(self, strName, url, nConcurrency=None):
+        """GET the collection at url and then all of its members
+
+        Members that came back inline with $expand are not fetched again.
+
+        :returns: list of (member link, member document) of the members
+                  that could be fetched, in collection order
+
+        """
+        json_data = None
+        if (url != ''):
+            json_data = self.getResource(strName, self.expandURL(url))
+        if (json_data == None):
+            return []
+        nCount, lstURL = parsers.parseMembers(json_data)
+        lstURL = [url for url in lstURL[:nCount] if url != '']
+        lstJson = self.fetchMembers(lstURL, nConcurrency,
+                                    dictExpanded=parsers.parseExpandedMembers(json_data))
+        return [(url, json_data) for url, json_data in zip(lstURL, lstJson)
+                if json_data != None]
+
+    # GET every member of a collection and return {member id: parse(member)}
+    def fetchCollectionById(self, strName, url, parse, nConcurrency=None):
+        dictMember = {}
+        for urlMember, json_data in self.fetchCollection(strName, url, nConcurrency):
+            dictMember[parsers.parseMemberId(json_data, urlMember)] = parse(json_data)
+        return dictMember
+
+    # Run process(url, json_data) on every member concurrently and return
+    # {member id: result}
+    def processMembers(self, lstMember, process, nConcurrency=None):
+        nWorkers = max(1, min(nConcurrency or self.nConcurrency, len(lstMember)))
+        if (nWorkers == 1):
+            lstResult = [process(url, json_data) for url, json_data in lstMember]
+        else:
+            with ThreadPoolExecutor(max_workers=nWorkers) as executor:
+                lstResult = list(executor.map(lambda member: process(*member), lstMember))
+        return dict((parsers.parseMemberId(json_data, url), result)
+                    for (url, json_data), result in zip(lstMember, lstResult))
+
+    # Get the readings of every chassis
+    def getChassisAll(self, bSelect=False, nConcurrency=None):
+        """GET Thermal and Power of every member of /redfish/v1/Chassis
+
+        :param bSelect: Only fetch the properties the sensor parsers read.
+        :type bSelect: bool
+        :param nConcurrency: The maximum number of chassis processed at once
+                             (default self.nConcurrency).
+        :type nConcurrency: int
+        :returns: {chassis id: {'Thermal': parsers.parseThermal() or None,
+                   'Power': parsers.parsePower() or None}}
+
+        """
+        def processChassis(url, json_data):
+            dictChassis = {}
+            for key, parse, lstSelect in (('Thermal', parsers.parseThermal, parsers.THERMAL_SELECT),
+                                          ('Power', parsers.parsePower, parsers.POWER_SELECT)):
+                urlSensors = parsers.parseLink(json_data, key)
+                json_sensors = None
+                if (urlSensors != ''):
+                    json_sensors = self.getSelected("getChassisAll" + key, urlSensors,
+                                                    lstSelect if bSelect else None)
+                dictChassis[key] = None if json_sensors == None else parse(json_sensors)
+            return dictChassis
+
+        return self.processMembers(
+            self.fetchCollection("getChassisAll", "/redfish/v1/Chassis", nConcurrency),
+            processChassis, nConcurrency)
+
+    # Get the processors of the system whose Processors collection is url
+    def getProcessorsAll(self, url=None, nConcurrency=None):
+        """GET every member of a Processors collection concurrently
+
+        :param url: The Processors collection (default the one of the last
+                    getSystems0()).
+        :type url: str
+        :returns: {processor id: records.Processor}
+
+        """
+        return self.fetchCollectionById(
+            "getProcessorsAll", self.urlProcessors if url == None else url,
+            parsers.parseProcessor, nConcurrency)
+
+    # Get the inventory of every system
+    def getSystemsAll(self, nConcurrency=None):
+        """GET the inventory of every member of /redfish/v1/Systems
+
+        The systems are processed concurrently and so are the members of
+        each of their collections.
+
+        :param nConcurrency: The maximum number of systems processed at once
+                             (default self.nConcurrency).
+        :type nConcurrency: int
+        :returns: {system id: {'System': parsers.parseSystem(),
+                   'Bios': parsers.parseBios() or None,
+                   'Processors': {id: records.Processor},
+                   'Memory': {id: records.MemoryModule},
+                   'SimpleStorage': {id: records.Storage},
+                   'EthernetInterfaces': {id: records.NetworkInterface}}}
+
+        """
+        def processSystem(url, json_data):
+            dictSystem = parsers.parseSystem(json_data)
+            json_bios = None
+            if (dictSystem['Bios'] != ''):
+                json_bios = self.getResource("getSystemsAllBios", dictSystem['Bios'])
+            return {'System': dictSystem,
+                    'Bios': None if json_bios == None else parsers.parseBios(json_bios),
+                    'Processors': self.getProcessorsAll(dictSystem['Processors']),
+                    'Memory': self.fetchCollectionById(
+                        "getSystemsAllMemory", dictSystem['Memory'], parsers.parseMemory),
+                    'SimpleStorage': self.fetchCollectionById(
+                        "getSystemsAllSimpleStorage", dictSystem['SimpleStorage'],
+                        parsers.parseStorage),
+                    'EthernetInterfaces': self.fetchCollectionById(
+                        "getSystemsAllEthernetInterfaces", dictSystem['EthernetInterfaces'],
+                        parsers.parseEthernetInterface)}
+
+        return self.processMembers(
+            self.fetchCollection("getSystemsAll", "/redfish/v1/Systems", nConcurrency),
+            processSystem, nConcurrency)
@@ -0,0 +1,222 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the asyncio client; skipped where asyncapi cannot be imported.
+
+The tests drive the loop with callbacks rather than coroutines of their
+own so this module still imports on the Pythons asyncapi does not support.
+"""
+
+# ---------Imports---------
+import asyncio
+import threading
+import unittest
+import http.client
+from unittest import mock
+# ---------End of imports---------
+
+from redfish_advantech.restful import v1api
+from redfish_advantech.restful.concurrency import AdaptiveLimiter
+from redfish_advantech.restful.connectionpool import PoolTimeoutError
+
+try:
+    from redfish_advantech.restful import asyncapi
+except SyntaxError:
+    asyncapi = None
+
+
+@unittest.skipIf(asyncapi == None, "asyncapi needs Python 3.6+")
+class TestAcquireSlot(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    # Let the loop run the callbacks that are ready
+    def runFor(self, seconds=0.01):
+        self.loop.run_until_complete(asyncio.sleep(seconds))
+
+    def test_free_slot(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        self.loop.run_until_complete(asyncapi.acquireSlot(limiter))
+        self.assertEqual(limiter.nInFlight, 1)
+
+    def test_fifo(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        limiter.acquire()
+        lstOrder = []
+        for i in range(5):
+            task = asyncio.ensure_future(asyncapi.acquireSlot(limiter))
+            task.add_done_callback(lambda task, i=i: lstOrder.append(i))
+        self.runFor()
+        self.assertEqual(lstOrder, [])
+        for i in range(5):
+            limiter.release(0.001)
+            self.runFor()
+            self.assertEqual(lstOrder, list(range(i + 1)))
+        self.assertEqual(limiter.nInFlight, 1)
+
+    def test_release_from_a_thread(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        limiter.acquire()
+        task = asyncio.ensure_future(asyncapi.acquireSlot(limiter))
+        threading.Timer(0.02, limiter.release, (0.01,)).start()
+        self.loop.run_until_complete(asyncio.wait_for(task, 5))
+        self.assertEqual(limiter.nInFlight, 1)
+
+    def test_cancelled_waiter(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        limiter.acquire()
+        first = asyncio.ensure_future(asyncapi.acquireSlot(limiter))
+        second = asyncio.ensure_future(asyncapi.acquireSlot(limiter))
+        self.runFor()
+        first.cancel()
+        limiter.release(0.01)
+        self.loop.run_until_complete(asyncio.wait_for(second, 5))
+        self.assertTrue(first.cancelled())
+        self.assertEqual(limiter.nInFlight, 1)
+
+    def test_cancelled_after_hand_over(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        limiter.acquire()
+        waiter = asyncio.ensure_future(asyncapi.acquireSlot(limiter))
+        self.runFor()
+        limiter.release(0.01)
+        waiter.cancel()
+        self.runFor()
+        self.assertEqual(limiter.nInFlight, 0)
+
+
+class FakeWriter:
+    """The writer of an AsyncHTTPSConnection that drops what it is sent"""
+
+    def write(self, data):
+        pass
+
+    def drain(self):
+        future = asyncio.get_event_loop().create_future()
+        future.set_result(None)
+        return future
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """An AsyncHTTPSConnection whose requests never get an answer"""
+
+    def __init__(self, *args):
+        pass
+
+    def isOpen(self):
+        return True
+
+    def request(self, method, url, body=None, headers=None):
+        return asyncio.get_event_loop().create_future()
+
+    def close(self):
+        pass
+
+
+@unittest.skipIf(asyncapi == None, "asyncapi needs Python 3.6+")
+class TestAsyncConnection(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    # A connection that reads answer as the response of its next request
+    def makeConnection(self, answer):
+        conn = asyncapi.AsyncHTTPSConnection("bmc", 443, timeout=5)
+        conn.reader = asyncio.StreamReader()
+        conn.reader.feed_data(answer)
+        conn.reader.feed_eof()
+        conn.writer = FakeWriter()
+        return conn
+
+    def test_chunked(self):
+        conn = self.makeConnection(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                                   b"3\r\nabc\r\n2;x=1\r\nde\r\n0\r\n\r\n")
+        status, reason, headers, data, nWireBytes, bWillClose = \
+            self.loop.run_until_complete(conn.request("GET", "/x"))
+        self.assertEqual((status, data), (200, b"abcde"))
+
+    def test_malformed_chunk_size(self):
+        conn = self.makeConnection(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                                   b"zz\r\nabc\r\n")
+        self.assertRaises(http.client.IncompleteRead, self.loop.run_until_complete,
+                          conn.request("GET", "/x"))
+
+    def test_eof_in_chunks(self):
+        conn = self.makeConnection(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                                   b"3\r\nabc\r\n")
+        self.assertRaises(http.client.IncompleteRead, self.loop.run_until_complete,
+                          conn.request("GET", "/x"))
+
+    def test_pool_timeout(self):
+        pool = asyncapi.AsyncConnectionPool("bmc", 443, nMaxConnections=1, poolTimeout=0.05)
+        with mock.patch.object(asyncapi, 'AsyncHTTPSConnection', FakeConnection):
+            busy = asyncio.ensure_future(pool.request("GET", "/busy"))
+            self.assertRaises(PoolTimeoutError, self.loop.run_until_complete,
+                              pool.request("GET", "/x"))
+            busy.cancel()
+            self.assertRaises(asyncio.CancelledError, self.loop.run_until_complete, busy)
+            # The cancelled request gave its connection back: the next one
+            # is still waiting for its answer past poolTimeout
+            second = asyncio.ensure_future(pool.request("GET", "/y"))
+            self.loop.run_until_complete(asyncio.sleep(0.1))
+            self.assertFalse(second.done())
+            second.cancel()
+            self.assertRaises(asyncio.CancelledError, self.loop.run_until_complete, second)
+
+
+@unittest.skipIf(asyncapi == None, "asyncapi needs Python 3.6+")
+class TestMapLimited(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def test_concurrency_cap(self):
+        # The tests do not need the logging.conf of the examples
+        v1api._bLoggingConfLoaded = True
+        client = asyncapi.AsyncRedfishAdvantech("bmc", 443, "admin", "secret",
+                                                bCircuitBreaker=False, bAdaptive=False,
+                                                nConcurrency=3)
+        lstInFlight = []
+        nInFlight = [0]
+
+        def done(future, arg):
+            nInFlight[0] -= 1
+            future.set_result(arg * 2)
+
+        # Answer after a while, counting the fetches awaited at once
+        def fetch(arg):
+            nInFlight[0] += 1
+            lstInFlight.append(nInFlight[0])
+            future = self.loop.create_future()
+            self.loop.call_later(0.001, done, future, arg)
+            return future
+
+        lstResult = self.loop.run_until_complete(client.mapLimited(fetch, list(range(10))))
+        self.assertEqual(lstResult, [i * 2 for i in range(10)])
+        self.assertEqual(max(lstInFlight), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
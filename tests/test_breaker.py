@@ -0,0 +1,101 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the per-BMC circuit breakers."""
+
+# ---------Imports---------
+import time
+import logging
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful import breaker
+from redfish_advantech.restful.breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    # A breaker that opened after nFailureThreshold failures
+    def makeOpen(self, resetTimeout=0):
+        circuit = CircuitBreaker("bmc:443", nFailureThreshold=2, resetTimeout=resetTimeout)
+        circuit.recordFailure()
+        circuit.recordFailure()
+        return circuit
+
+    def test_opens_after_threshold(self):
+        circuit = CircuitBreaker("bmc:443", nFailureThreshold=3, resetTimeout=60)
+        circuit.recordFailure()
+        circuit.recordFailure()
+        self.assertEqual(circuit.getState(), CLOSED)
+        circuit.recordSuccess()
+        circuit.recordFailure()
+        circuit.recordFailure()
+        self.assertTrue(circuit.allow())
+        circuit.recordFailure()
+        self.assertEqual(circuit.getState(), OPEN)
+        self.assertFalse(circuit.allow())
+        self.assertEqual(circuit.nRejected, 1)
+
+    def test_half_open_probe(self):
+        circuit = self.makeOpen()
+        self.assertEqual(circuit.getState(), HALF_OPEN)
+        self.assertTrue(circuit.allow())
+        self.assertFalse(circuit.allow())
+        circuit.recordSuccess()
+        self.assertEqual(circuit.getState(), CLOSED)
+        self.assertTrue(circuit.allow())
+
+    def test_half_open_failure(self):
+        circuit = self.makeOpen(resetTimeout=0.05)
+        time.sleep(0.06)
+        self.assertTrue(circuit.allow())
+        circuit.recordFailure()
+        self.assertEqual(circuit.getState(), OPEN)
+        self.assertFalse(circuit.allow())
+
+    def test_cancel_gives_the_probe_back(self):
+        circuit = self.makeOpen()
+        self.assertTrue(circuit.allow())
+        self.assertFalse(circuit.allow())
+        circuit.cancel()
+        self.assertTrue(circuit.allow())
+        self.assertEqual(circuit.strState, HALF_OPEN)
+
+    def test_cancel_when_closed(self):
+        circuit = CircuitBreaker("bmc:443")
+        self.assertTrue(circuit.allow())
+        circuit.cancel()
+        self.assertEqual(circuit.getState(), CLOSED)
+        self.assertEqual(circuit.nProbes, 0)
+
+
+class TestGetBreaker(unittest.TestCase):
+
+    def test_shared_per_host(self):
+        circuit = breaker.getBreaker("shared.test", 443, nFailureThreshold=2)
+        self.assertIs(breaker.getBreaker("shared.test", 443, nFailureThreshold=2), circuit)
+        self.assertIsNot(breaker.getBreaker("shared.test", 8443), circuit)
+        self.assertEqual(breaker.getBreakerStates()["shared.test:443"], CLOSED)
+
+    def test_conflicting_thresholds(self):
+        circuit = breaker.getBreaker("conflict.test", 443, nFailureThreshold=2)
+        logger = logging.getLogger('simpleExample')
+        lstRecord = []
+        handler = logging.Handler()
+        handler.emit = lstRecord.append
+        logger.addHandler(handler)
+        try:
+            self.assertIs(breaker.getBreaker("conflict.test", 443, nFailureThreshold=9),
+                          circuit)
+        finally:
+            logger.removeHandler(handler)
+        self.assertEqual(circuit.nFailureThreshold, 2)
+        self.assertEqual(len(lstRecord), 1)
+        self.assertIn("nFailureThreshold=2 (asked 9)", lstRecord[0].getMessage())
+
+
+if __name__ == '__main__':
+    unittest.main()
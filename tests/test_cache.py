@@ -0,0 +1,124 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the ETag and TTL + LRU response caches."""
+
+# ---------Imports---------
+import time
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful.cache import ETagCache, ResponseCache
+from redfish_advantech.restful.v1api import RestResponse
+
+HOST = "bmc:443"
+
+
+# A response of status with body and the ETag etag, if any
+def makeResponse(status=200, body=b'{}', etag=None):
+    headers = {} if etag == None else {'ETag': etag}
+    return RestResponse(status, 'OK', headers, body)
+
+
+class TestETagCache(unittest.TestCase):
+
+    def test_validator(self):
+        cache = ETagCache()
+        self.assertEqual(cache.getValidator("/a"), None)
+        response = makeResponse(etag='"1"')
+        cache.store("/a", response)
+        self.assertEqual(cache.getValidator("/a"), '"1"')
+        self.assertIs(cache.notModified("/a"), response)
+        self.assertEqual(cache.getStats(), {'entries': 1, 'hit': 1, 'miss': 1,
+                                            'notModified': 1})
+
+    def test_no_etag_or_error_drops(self):
+        cache = ETagCache()
+        cache.store("/a", makeResponse(etag='"1"'))
+        cache.store("/a", makeResponse())
+        self.assertEqual(cache.getValidator("/a"), None)
+        cache.store("/a", makeResponse(etag='"1"'))
+        cache.store("/a", makeResponse(404, etag='"2"'))
+        self.assertEqual(cache.notModified("/a"), None)
+
+    def test_lru(self):
+        cache = ETagCache(nMaxEntries=2)
+        for url in ("/a", "/b"):
+            cache.store(url, makeResponse(etag='"%s"' % url))
+        cache.getValidator("/a")
+        cache.store("/c", makeResponse(etag='"c"'))
+        self.assertEqual(cache.getValidator("/b"), None)
+        self.assertEqual(cache.getValidator("/a"), '"/a"')
+
+    def test_invalidate(self):
+        cache = ETagCache()
+        cache.store("/a", makeResponse(etag='"1"'))
+        cache.store("/b", makeResponse(etag='"2"'))
+        cache.invalidate("/a")
+        self.assertEqual(cache.getValidator("/a"), None)
+        cache.invalidate()
+        self.assertEqual(cache.getStats()['entries'], 0)
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_policy(self):
+        cache = ResponseCache()
+        self.assertEqual(cache.getTTL("/redfish/v1/"), 86400)
+        self.assertEqual(cache.getTTL("/redfish/v1/Chassis/1u/Thermal"), 5)
+        self.assertEqual(cache.getTTL("/redfish/v1/Systems/0/Bios?$select=Id"), None)
+        self.assertEqual(cache.getTTL("/redfish/v1/Systems/0"), 0)
+        cache.setPolicy(r'/Thermal$', 0)
+        self.assertEqual(cache.getTTL("/redfish/v1/Chassis/1u/Thermal"), 0)
+
+    def test_get_put(self):
+        cache = ResponseCache()
+        response = makeResponse()
+        cache.put(HOST, "/redfish/v1", response)
+        self.assertIs(cache.get(HOST, "/redfish/v1"), response)
+        self.assertEqual(cache.get("other:443", "/redfish/v1"), None)
+        # Not cached: no policy, or not a 200
+        cache.put(HOST, "/redfish/v1/Systems/0", response)
+        cache.put(HOST, "/redfish/v1/Chassis/1u/Power", makeResponse(404))
+        self.assertEqual(cache.get(HOST, "/redfish/v1/Systems/0"), None)
+        self.assertEqual(cache.get(HOST, "/redfish/v1/Chassis/1u/Power"), None)
+
+    def test_expiry(self):
+        cache = ResponseCache(policy=[(r'/Thermal$', 0.01)])
+        cache.put(HOST, "/Thermal", makeResponse())
+        self.assertNotEqual(cache.get(HOST, "/Thermal"), None)
+        time.sleep(0.02)
+        self.assertEqual(cache.get(HOST, "/Thermal"), None)
+        self.assertEqual(cache.getStats()['entries'], 0)
+
+    def test_lru_entries_and_bytes(self):
+        cache = ResponseCache(nMaxEntries=2, nMaxBytes=10, defaultTTL=60)
+        cache.put(HOST, "/a", makeResponse(body=b'1234'))
+        cache.put(HOST, "/b", makeResponse(body=b'1234'))
+        cache.get(HOST, "/a")
+        cache.put(HOST, "/c", makeResponse(body=b'1234'))
+        self.assertEqual(cache.get(HOST, "/b"), None)
+        cache.put(HOST, "/d", makeResponse(body=b'12345678'))
+        self.assertEqual(cache.getStats()['bytes'], 8)
+        # A body larger than the cache is not kept
+        cache.put(HOST, "/e", makeResponse(body=b'12345678901'))
+        self.assertEqual(cache.get(HOST, "/e"), None)
+        self.assertEqual(cache.getStats()['evicted'], 3)
+
+    def test_invalidate_for(self):
+        cache = ResponseCache(defaultTTL=None)
+        for url in ("/redfish/v1/Systems", "/redfish/v1/Systems/0",
+                    "/redfish/v1/Systems/0/Bios", "/redfish/v1/Systems/1"):
+            cache.put(HOST, url, makeResponse())
+        self.assertEqual(cache.invalidateFor(HOST, "GET", "/redfish/v1/Systems/0"), 0)
+        nDropped = cache.invalidateFor(
+            HOST, "POST", "/redfish/v1/Systems/0/Actions/ComputerSystem.Reset")
+        self.assertEqual(nDropped, 3)
+        self.assertNotEqual(cache.get(HOST, "/redfish/v1/Systems/1"), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the lazy iterator over paged collections."""
+
+# ---------Imports---------
+import threading
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful.collection import CollectionIterator
+
+URL = "/redfish/v1/Systems/0/LogServices/Log/Entries"
+
+
+class FakeClient:
+    """Serve the pages of dictPage (url: document) as getResource() does"""
+
+    def __init__(self, dictPage, bTopSkip=False):
+        self.dictPage = dictPage
+        self.dictProtocolFeatures = {'TopSkipQuery': bTopSkip}
+        self.lstURL = []
+        self.lock = threading.Lock()
+
+    def getResource(self, strName, url, nLogVerbose=2):
+        with self.lock:
+            self.lstURL.append(url)
+        return self.dictPage.get(url)
+
+
+# The members Id nFirst to nLast - 1
+def makeMembers(nFirst, nLast):
+    return [{'@odata.id': "%s/%d" % (URL, i), 'Id': str(i)} for i in range(nFirst, nLast)]
+
+
+class TestCollectionIterator(unittest.TestCase):
+
+    def test_next_link(self):
+        dictPage = {URL: {'Name': "Log", 'Members@odata.count': 5, 'Members': makeMembers(0, 2),
+                          'Members@odata.nextLink': URL + "?page=2"},
+                    URL + "?page=2": {'Members': makeMembers(2, 4),
+                                      'Members@odata.nextLink': URL + "?page=3"},
+                    URL + "?page=3": {'Members': makeMembers(4, 5)}}
+        for bPrefetch in (False, True):
+            client = FakeClient(dictPage)
+            iterator = CollectionIterator(client, "Log", URL, bPrefetch=bPrefetch)
+            self.assertEqual([member['Id'] for member in iterator], ['0', '1', '2', '3', '4'])
+            self.assertEqual(client.lstURL, [URL, URL + "?page=2", URL + "?page=3"])
+            self.assertEqual(iterator.nPages, 3)
+            self.assertEqual(iterator.nCount, 5)
+            self.assertEqual(iterator.dictProperties['Name'], "Log")
+            self.assertNotIn('Members', iterator.dictProperties)
+
+    def test_lazy(self):
+        dictPage = {URL: {'Members': makeMembers(0, 2),
+                          'Members@odata.nextLink': URL + "?page=2"},
+                    URL + "?page=2": {'Members': makeMembers(2, 4)}}
+        client = FakeClient(dictPage)
+        iterator = iter(CollectionIterator(client, "Log", URL, bPrefetch=False))
+        next(iterator)
+        self.assertEqual(client.lstURL, [URL])
+        iterator.close()
+
+    def test_loop_stops(self):
+        dictPage = {URL: {'Members': makeMembers(0, 1), 'Members@odata.nextLink': URL}}
+        client = FakeClient(dictPage)
+        lstMember = list(CollectionIterator(client, "Log", URL))
+        self.assertEqual(len(lstMember), 1)
+        self.assertEqual(client.lstURL, [URL])
+
+    def test_missing_page_ends(self):
+        dictPage = {URL: {'Members': makeMembers(0, 1),
+                          'Members@odata.nextLink': URL + "?page=2"}}
+        lstMember = list(CollectionIterator(FakeClient(dictPage), "Log", URL))
+        self.assertEqual(len(lstMember), 1)
+
+    def test_top_skip(self):
+        dictPage = {URL + "?$top=2": {'Members@odata.count': 5, 'Members': makeMembers(0, 2)},
+                    URL + "?$top=2&$skip=2": {'Members': makeMembers(2, 4)},
+                    URL + "?$top=2&$skip=4": {'Members': makeMembers(4, 5)}}
+        client = FakeClient(dictPage, bTopSkip=True)
+        iterator = CollectionIterator(client, "Log", URL, nPageSize=2)
+        self.assertEqual([member['Id'] for member in iterator], ['0', '1', '2', '3', '4'])
+        self.assertEqual(len(client.lstURL), 3)
+
+    def test_top_skip_count_saves_the_empty_page(self):
+        dictPage = {URL + "?$top=2": {'Members@odata.count': 4, 'Members': makeMembers(0, 2)},
+                    URL + "?$top=2&$skip=2": {'Members': makeMembers(2, 4)},
+                    URL + "?$top=2&$skip=4": {'Members': []}}
+        client = FakeClient(dictPage, bTopSkip=True)
+        self.assertEqual(len(list(CollectionIterator(client, "Log", URL, nPageSize=2))), 4)
+        self.assertEqual(len(client.lstURL), 2)
+
+    def test_top_skip_unsupported(self):
+        dictPage = {URL: {'Members': makeMembers(0, 3)}}
+        client = FakeClient(dictPage, bTopSkip=False)
+        self.assertEqual(len(list(CollectionIterator(client, "Log", URL, nPageSize=2))), 3)
+        self.assertEqual(client.lstURL, [URL])
+
+    def test_page_url(self):
+        client = FakeClient({}, bTopSkip=True)
+        iterator = CollectionIterator(client, "Log", URL + "?$expand=.", nPageSize=50)
+        self.assertEqual(iterator.pageURL(100), URL + "?$expand=.&$top=50&$skip=100")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the adaptive (AIMD) concurrency limiter."""
+
+# ---------Imports---------
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful.concurrency import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+
+    def test_no_increase_below_the_limit(self):
+        limiter = AdaptiveLimiter(nInitial=2, nMax=16)
+        for i in range(100):
+            limiter.acquire()
+            limiter.release(0.01)
+        self.assertEqual(limiter.getLimit(), 2)
+        self.assertEqual(limiter.nIncreases, 0)
+
+    def test_increase_when_in_use(self):
+        limiter = AdaptiveLimiter(nInitial=2, nMax=4)
+        for i in range(20):
+            nLimit = limiter.getLimit()
+            for j in range(nLimit):
+                limiter.acquire()
+            for j in range(nLimit):
+                limiter.release(0.01)
+        self.assertEqual(limiter.getLimit(), 4)
+
+    def test_decrease_on_error(self):
+        limiter = AdaptiveLimiter(nInitial=8, nMin=2)
+        limiter.acquire()
+        limiter.release(0.01, bError=True)
+        self.assertEqual(limiter.getLimit(), 4)
+        # At most once per cooldown
+        limiter.acquire()
+        limiter.release(0.01, bError=True)
+        self.assertEqual(limiter.getLimit(), 4)
+        self.assertEqual(limiter.nDecreases, 1)
+
+    def test_try_acquire(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        self.assertTrue(limiter.tryAcquire())
+        self.assertFalse(limiter.tryAcquire())
+        limiter.release(0.01)
+        self.assertTrue(limiter.tryAcquire())
+
+
+class TestAcquireOrWait(unittest.TestCase):
+
+    def test_free_slot(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        self.assertTrue(limiter.acquireOrWait(lambda: True))
+        self.assertEqual(limiter.nInFlight, 1)
+
+    def test_waiters_in_order(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        limiter.acquire()
+        lstWoken = []
+        for i in range(3):
+            self.assertFalse(limiter.acquireOrWait(lambda i=i: lstWoken.append(i) or True))
+        limiter.release(0.01)
+        limiter.release(0.01)
+        self.assertEqual(lstWoken, [0, 1])
+        self.assertEqual(limiter.nInFlight, 1)
+
+    def test_gone_waiter_passes_the_slot_on(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        limiter.acquire()
+        lstWoken = []
+        limiter.acquireOrWait(lambda: False)
+        limiter.acquireOrWait(lambda: lstWoken.append(1) or True)
+        limiter.release(0.01)
+        self.assertEqual(lstWoken, [1])
+        self.assertEqual(limiter.nInFlight, 1)
+
+    def test_cancel_wait(self):
+        limiter = AdaptiveLimiter(nInitial=1, nMax=1)
+        limiter.acquire()
+        wake = lambda: True
+        limiter.acquireOrWait(wake)
+        self.assertTrue(limiter.cancelWait(wake))
+        limiter.release(0.01)
+        self.assertEqual(limiter.nInFlight, 0)
+        # Handed the slot already: give it back
+        limiter.acquire()
+        limiter.acquireOrWait(wake)
+        limiter.release(0.01)
+        self.assertFalse(limiter.cancelWait(wake))
+        limiter.cancel()
+        self.assertEqual(limiter.nInFlight, 0)
+        self.assertTrue(limiter.tryAcquire())
+
+
+if __name__ == '__main__':
+    unittest.main()
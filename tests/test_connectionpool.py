@@ -0,0 +1,223 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the HTTPS connection pool against a fake connection."""
+
+# ---------Imports---------
+import io
+import gzip
+import socket
+import unittest
+import http.client
+from unittest import mock
+# ---------End of imports---------
+
+from redfish_advantech.restful.connectionpool import (HTTPSConnectionPool, PoolTimeoutError,
+                                                      DecompressResponseError, CHUNK_SIZE)
+
+
+class FakeResponse:
+    """The http.client.HTTPResponse of a FakeConnection"""
+
+    def __init__(self, status, body=b'', dictHeader=None, bWillClose=False):
+        lstLine = ["%s: %s\r\n" % item for item in (dictHeader or {}).items()]
+        self.status = status
+        self.reason = "Reason"
+        self.headers = http.client.parse_headers(
+            io.BytesIO("".join(lstLine).encode('latin-1') + b"\r\n"))
+        self.will_close = bWillClose
+        self.__body = io.BytesIO(body)
+
+    def read(self, amt=None):
+        return self.__body.read(amt)
+
+
+class FakeConnection:
+    """An http.client.HTTPSConnection answering from FakeConnection.lstAnswer
+
+    Each answer is a FakeResponse or an exception raised by request().
+    The connection is open (has a sock) after its first request and until
+    it is closed.
+
+    """
+
+    lstAnswer = []
+    lstCreated = []
+    sock0 = None
+
+    def __init__(self, hostname, port, timeout=None):
+        self.sock = None
+        self.nClosed = 0
+        self.lstRequest = []
+        self.response = None
+        FakeConnection.lstCreated.append(self)
+
+    def request(self, method, url, body=None, headers=None):
+        self.lstRequest.append((method, url))
+        answer = FakeConnection.lstAnswer.pop(0)
+        if (isinstance(answer, BaseException)):
+            raise answer
+        # An idle socket with nothing to read: healthy for the pool
+        self.sock = FakeConnection.sock0
+        self.response = answer
+
+    def getresponse(self):
+        return self.response
+
+    def close(self):
+        self.sock = None
+        self.nClosed += 1
+
+
+class PoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.sockPair = socket.socketpair()
+        FakeConnection.sock0 = self.sockPair[0]
+        FakeConnection.lstAnswer = []
+        FakeConnection.lstCreated = []
+        patcher = mock.patch.object(http.client, 'HTTPSConnection', FakeConnection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        for sock in self.sockPair:
+            sock.close()
+
+
+class TestCheckout(PoolTestCase):
+
+    def test_pool_timeout(self):
+        pool = HTTPSConnectionPool("bmc", 443, nMaxConnections=1, poolTimeout=0.05)
+        conn = pool.getConnection(pool.poolTimeout)
+        self.assertRaises(PoolTimeoutError, pool.getConnection, 0.05)
+        self.assertRaises(PoolTimeoutError, pool.request, "GET", "/x")
+        pool.putConnection(conn)
+        self.assertIs(pool.getConnection(0), conn)
+
+    def test_closed(self):
+        pool = HTTPSConnectionPool("bmc", 443)
+        pool.close()
+        self.assertRaises(PoolTimeoutError, pool.getConnection, 0)
+
+    def test_reuse(self):
+        FakeConnection.lstAnswer = [FakeResponse(200, b'1'), FakeResponse(200, b'2')]
+        pool = HTTPSConnectionPool("bmc", 443)
+        self.assertEqual(pool.request("GET", "/x")[3], b'1')
+        self.assertEqual(pool.request("GET", "/x")[3], b'2')
+        self.assertEqual((pool.nCreated, pool.nReused), (1, 1))
+
+    def test_will_close(self):
+        FakeConnection.lstAnswer = [FakeResponse(200, bWillClose=True), FakeResponse(200)]
+        pool = HTTPSConnectionPool("bmc", 443, nMaxConnections=1)
+        pool.request("GET", "/x")
+        pool.request("GET", "/x")
+        self.assertEqual(pool.nCreated, 2)
+        self.assertEqual(FakeConnection.lstCreated[0].nClosed, 1)
+
+
+class TestReplay(PoolTestCase):
+
+    # A pool whose only connection has answered once and is idle again
+    def makeReused(self, *lstAnswer):
+        FakeConnection.lstAnswer = [FakeResponse(200)] + list(lstAnswer)
+        pool = HTTPSConnectionPool("bmc", 443, nMaxConnections=1)
+        pool.request("GET", "/first")
+        return pool
+
+    def test_stale_connection_replayed(self):
+        pool = self.makeReused(http.client.RemoteDisconnected("closed"), FakeResponse(200, b'ok'))
+        self.assertEqual(pool.request("GET", "/x")[3], b'ok')
+        self.assertEqual(pool.nReconnects, 1)
+        self.assertEqual(FakeConnection.lstCreated[0].lstRequest[1:], [("GET", "/x")] * 2)
+
+    def test_stale_connection_post_not_replayed(self):
+        pool = self.makeReused(ConnectionResetError(), FakeResponse(200))
+        self.assertRaises(ConnectionResetError, pool.request, "POST", "/x", b'{}')
+        self.assertEqual(pool.nReconnects, 0)
+        self.assertEqual(len(FakeConnection.lstAnswer), 1)
+        # The failed connection was given back
+        pool.getConnection(0)
+
+    def test_stale_connection_replayed_once(self):
+        pool = self.makeReused(BrokenPipeError(), BrokenPipeError(), FakeResponse(200))
+        self.assertRaises(BrokenPipeError, pool.request, "GET", "/x")
+        self.assertEqual(pool.nReconnects, 1)
+
+    def test_fresh_connection_not_replayed(self):
+        FakeConnection.lstAnswer = [http.client.RemoteDisconnected("closed"), FakeResponse(200)]
+        pool = HTTPSConnectionPool("bmc", 443, nMaxConnections=1)
+        self.assertRaises(http.client.RemoteDisconnected, pool.request, "GET", "/x")
+        self.assertEqual(pool.nReconnects, 0)
+        pool.getConnection(0)
+
+
+class TestStream(PoolTestCase):
+
+    def test_read_to_the_end_reuses(self):
+        body = b'x' * (CHUNK_SIZE + 10)
+        FakeConnection.lstAnswer = [FakeResponse(200, body)]
+        pool = HTTPSConnectionPool("bmc", 443, nMaxConnections=1)
+        stream = pool.stream("GET", "/x")
+        self.assertEqual(stream.read(), body)
+        self.assertEqual((stream.nBytes, stream.nWireBytes), (len(body), len(body)))
+        self.assertIs(pool.getConnection(0), FakeConnection.lstCreated[0])
+        self.assertEqual(FakeConnection.lstCreated[0].nClosed, 0)
+
+    def test_early_close_releases(self):
+        FakeConnection.lstAnswer = [FakeResponse(200, b'x' * (3 * CHUNK_SIZE))]
+        pool = HTTPSConnectionPool("bmc", 443, nMaxConnections=1)
+        with pool.stream("GET", "/x") as stream:
+            chunks = stream.iterChunks()
+            self.assertEqual(len(next(chunks)), CHUNK_SIZE)
+            self.assertRaises(PoolTimeoutError, pool.getConnection, 0)
+        # The rest of the body is still on the socket: closed, not reused
+        self.assertEqual(FakeConnection.lstCreated[0].nClosed, 1)
+        pool.getConnection(0)
+        chunks.close()
+
+
+class TestGzip(PoolTestCase):
+
+    def request(self, body):
+        FakeConnection.lstAnswer = [FakeResponse(200, body, {'Content-Encoding': 'gzip'})]
+        pool = HTTPSConnectionPool("bmc", 443, nMaxConnections=1)
+        try:
+            return pool.request("GET", "/x")
+        finally:
+            # The connection is given back whatever happened
+            pool.getConnection(0)
+
+    def test_gzip(self):
+        body = b'{"Id": "1"}' * 1000
+        status, reason, headers, data, nWireBytes = self.request(gzip.compress(body))
+        self.assertEqual(data, body)
+        self.assertEqual(nWireBytes, len(gzip.compress(body)))
+
+    def test_corrupt(self):
+        body = bytearray(gzip.compress(b'{"Id": "1"}' * 1000))
+        body[12:20] = b'\xff' * 8
+        self.assertRaises(DecompressResponseError, self.request, bytes(body))
+        self.assertEqual(FakeConnection.lstCreated[0].nClosed, 1)
+
+    def test_truncated(self):
+        body = gzip.compress(b'{"Id": "1"}' * 1000)
+        with self.assertRaisesRegex(DecompressResponseError, "Truncated"):
+            self.request(body[:len(body) // 2])
+        self.assertEqual(FakeConnection.lstCreated[0].nClosed, 1)
+
+    def test_stream_truncated(self):
+        body = gzip.compress(b'{"Id": "1"}' * 1000)
+        FakeConnection.lstAnswer = [FakeResponse(200, body[:-8], {'Content-Encoding': 'gzip'})]
+        pool = HTTPSConnectionPool("bmc", 443, nMaxConnections=1)
+        stream = pool.stream("GET", "/x")
+        self.assertRaises(DecompressResponseError, stream.read)
+        self.assertEqual(FakeConnection.lstCreated[0].nClosed, 1)
+        pool.getConnection(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the breadth-first crawler against a fake client."""
+
+# ---------Imports---------
+import json
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful.crawler import Crawler
+from redfish_advantech.restful.v1api import RestResponse
+
+
+def ref(url):
+    return {'@odata.id': url}
+
+
+TREE = {
+    '/redfish/v1': {'@odata.id': '/redfish/v1', 'Chassis': ref('/redfish/v1/Chassis'),
+                    'Systems': ref('/redfish/v1/Systems')},
+    '/redfish/v1/Chassis': {'@odata.id': '/redfish/v1/Chassis',
+                            'Members': [ref('/redfish/v1/Chassis/1u'),
+                                        ref('/redfish/v1/Chassis/2u')]},
+    '/redfish/v1/Chassis/1u': {'@odata.id': '/redfish/v1/Chassis/1u',
+                               'Thermal': ref('/redfish/v1/Chassis/1u/Thermal')},
+    '/redfish/v1/Chassis/2u': {'@odata.id': '/redfish/v1/Chassis/2u',
+                               'Thermal': ref('/redfish/v1/Chassis/2u/Thermal')},
+    '/redfish/v1/Chassis/1u/Thermal': {'@odata.id': '/redfish/v1/Chassis/1u/Thermal'},
+    '/redfish/v1/Chassis/2u/Thermal': {'@odata.id': '/redfish/v1/Chassis/2u/Thermal'},
+    '/redfish/v1/Systems': {'@odata.id': '/redfish/v1/Systems',
+                            'Members': [ref('/redfish/v1/Systems/0')]},
+    '/redfish/v1/Systems/0': {'@odata.id': '/redfish/v1/Systems/0'},
+}
+
+
+class FakeClient:
+    """Answer rfRequest() from TREE; 404 for the links it lacks"""
+
+    nConcurrency = 2
+
+    def __init__(self):
+        self.lstURL = []
+
+    def rfRequest(self, log=True, method=None, url=None):
+        self.lstURL.append(url)
+        if (url not in TREE):
+            return RestResponse(404, "Not Found", {}, b'')
+        return RestResponse(200, "OK", {}, json.dumps(TREE[url]).encode())
+
+
+class TestCrawler(unittest.TestCase):
+
+    def test_crawl(self):
+        client = FakeClient()
+        dictDoc = dict(Crawler(client).crawl())
+        self.assertEqual(sorted(dictDoc), sorted(TREE))
+        self.assertEqual(sorted(client.lstURL), sorted(TREE))
+
+    def test_include_filters_only_the_output(self):
+        client = FakeClient()
+        crawler = Crawler(client, lstInclude=['/Thermal$'])
+        self.assertEqual(sorted(url for url, json_data in crawler.crawl()),
+                         ['/redfish/v1/Chassis/1u/Thermal', '/redfish/v1/Chassis/2u/Thermal'])
+        self.assertEqual(crawler.nFetched, len(TREE))
+
+    def test_exclude_prunes(self):
+        client = FakeClient()
+        crawler = Crawler(client, lstExclude=['^/redfish/v1/Chassis/'])
+        self.assertEqual(sorted(url for url, json_data in crawler.crawl()),
+                         ['/redfish/v1', '/redfish/v1/Chassis', '/redfish/v1/Systems',
+                          '/redfish/v1/Systems/0'])
+        self.assertFalse(any(url.startswith('/redfish/v1/Chassis/') for url in client.lstURL))
+
+    def test_depth(self):
+        crawler = Crawler(FakeClient(), nMaxDepth=1)
+        self.assertEqual(sorted(url for url, json_data in crawler.crawl()),
+                         ['/redfish/v1', '/redfish/v1/Chassis', '/redfish/v1/Systems'])
+
+    def test_failed(self):
+        TREE['/redfish/v1']['Managers'] = ref('/redfish/v1/Managers')
+        try:
+            crawler = Crawler(FakeClient())
+            self.assertNotIn('/redfish/v1/Managers', dict(crawler.crawl()))
+            self.assertEqual(crawler.dictFailed, {'/redfish/v1/Managers': 404})
+        finally:
+            del TREE['/redfish/v1']['Managers']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the fleet of BMCs."""
+
+# ---------Imports---------
+import logging
+import unittest
+from unittest import mock
+# ---------End of imports---------
+
+from redfish_advantech.restful import breaker
+from redfish_advantech.restful import fleet
+from redfish_advantech.restful.fleet import Fleet, FleetResult
+from redfish_advantech.restful.v1api import (InvalidCredentialsError,
+                                             ServerDownOrUnreachableError)
+
+
+class ListHandler(logging.Handler):
+    """Keep the records logged"""
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.lstRecord = []
+
+    def emit(self, record):
+        self.lstRecord.append(record)
+
+
+class TestFleetResult(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = ListHandler()
+        logging.getLogger('simpleExample').addHandler(self.handler)
+
+    def tearDown(self):
+        logging.getLogger('simpleExample').removeHandler(self.handler)
+
+    def test_breaker_state_without_warning(self):
+        circuit = breaker.getBreaker("fleet-result", 443, nFailureThreshold=2, resetTimeout=60)
+        circuit.recordFailure()
+        circuit.recordFailure()
+        result = FleetResult("fleet-result", 443, "thermal")
+        self.assertEqual(result.breakerState, breaker.OPEN)
+        self.assertEqual([record for record in self.handler.lstRecord
+                          if record.levelno >= logging.WARNING and
+                          "already exists" in record.getMessage()], [])
+
+    def test_unknown_bmc(self):
+        result = FleetResult("fleet-unknown", 443, "thermal")
+        self.assertEqual(result.breakerState, breaker.CLOSED)
+        self.assertEqual(result.nConcurrencyLimit, None)
+
+
+class FakeClient:
+    """A redfish_advantech whose BMC is down, rejects the login or works
+    as its hostname says; every client made is kept in lstClient"""
+
+    lstClient = []
+
+    def __init__(self, hostname, port, username, password, *args, **kwargs):
+        self.hostname = hostname
+        self.port = port
+        self.bLoggedIn = False
+        self.bDisconnected = False
+        FakeClient.lstClient.append(self)
+
+    def getRedfishV1(self):
+        if (self.hostname.startswith("down")):
+            raise ServerDownOrUnreachableError("%s is down" % self.hostname)
+
+    def login(self):
+        if (self.hostname.startswith("badauth")):
+            raise InvalidCredentialsError("Login to %s failed" % self.hostname)
+        self.bLoggedIn = True
+
+    def logout(self):
+        self.bLoggedIn = False
+        if (self.hostname.endswith("-nologout")):
+            raise ServerDownOrUnreachableError("%s went down" % self.hostname)
+
+    def disconnect(self):
+        self.bDisconnected = True
+
+
+# A walk that fails on the BMCs named "failing*"
+def walkName(client):
+    if (client.hostname.startswith("failing")):
+        raise KeyError("Thermal")
+    return client.hostname
+
+
+class TestFleet(unittest.TestCase):
+
+    def setUp(self):
+        FakeClient.lstClient = []
+        patcher = mock.patch.object(fleet, 'redfish_advantech', FakeClient)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # The failures are logged as errors on purpose
+        logging.getLogger('simpleExample').setLevel(logging.CRITICAL)
+        self.addCleanup(logging.getLogger('simpleExample').setLevel, logging.NOTSET)
+
+    def test_failures_are_isolated(self):
+        lstBMC = [("ok%d" % i, 443, "admin", "pw") for i in range(4)] + [
+            ("down", 443, "admin", "pw"), ("badauth", 443, ("admin", "pw")),
+            ("failing", 443, "admin", "pw")]
+        dictResult = dict((result.hostname, result)
+                          for result in Fleet(lstBMC, nMaxWorkers=3).run(walkName))
+        self.assertEqual(sorted(dictResult), sorted(bmc[0] for bmc in lstBMC))
+        for i in range(4):
+            self.assertTrue(dictResult["ok%d" % i].ok())
+            self.assertEqual(dictResult["ok%d" % i].result, "ok%d" % i)
+        self.assertIsInstance(dictResult["down"].error, ServerDownOrUnreachableError)
+        self.assertIsInstance(dictResult["badauth"].error, InvalidCredentialsError)
+        self.assertIsInstance(dictResult["failing"].error, KeyError)
+        self.assertEqual(dictResult["failing"].walk, "walkName")
+        # Every client is logged out and disconnected, failed or not
+        self.assertTrue(all(client.bDisconnected and not client.bLoggedIn
+                            for client in FakeClient.lstClient))
+
+    def test_failed_logout(self):
+        lstBMC = [("ok-nologout", 443, "admin", "pw"), ("failing-nologout", 443, "admin", "pw")]
+        dictResult = dict((result.hostname, result)
+                          for result in Fleet(lstBMC).run(walkName))
+        # The walk's result or error, not the logout's
+        self.assertTrue(dictResult["ok-nologout"].ok())
+        self.assertEqual(dictResult["ok-nologout"].result, "ok-nologout")
+        self.assertIsInstance(dictResult["failing-nologout"].error, KeyError)
+
+
+if __name__ == '__main__':
+    unittest.main()
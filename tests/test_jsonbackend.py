@@ -0,0 +1,89 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the JSON backends."""
+
+# ---------Imports---------
+import json
+import unittest
+from unittest import mock
+# ---------End of imports---------
+
+from redfish_advantech.restful import jsonbackend
+from redfish_advantech.restful.v1api import RestResponse
+
+
+# Build a backend whose library is not installed
+def _makeMissing():
+    raise ImportError("No module named 'missing'")
+
+
+class TestLoadsLenient(unittest.TestCase):
+
+    def test_valid(self):
+        self.assertEqual(jsonbackend.STDLIB.loadsLenient(b'{"Name": "\xc2\xb0C"}'),
+                         {'Name': "°C"})
+
+    def test_latin1(self):
+        self.assertEqual(jsonbackend.STDLIB.loadsLenient(b'{"Name": "\xb0C"}'),
+                         {'Name': "�C"})
+
+    def test_not_json(self):
+        self.assertRaises(ValueError, jsonbackend.STDLIB.loadsLenient, b'{"Name": }')
+        self.assertRaises(ValueError, jsonbackend.STDLIB.loadsLenient, b'{"Name": \xb0}')
+
+    def test_every_backend(self):
+        for strName in sorted(jsonbackend.BACKENDS):
+            if (jsonbackend.isAvailable(strName)):
+                backend = jsonbackend.getBackend(strName)
+                self.assertEqual(backend.loadsLenient(b'{"Name": "\xb0C"}'),
+                                 {'Name': "�C"}, strName)
+
+    def test_response(self):
+        response = RestResponse(200, "OK", {}, b'{"Reading": 40, "Units": "\xb0C"}')
+        self.assertEqual(response.json(), {'Reading': 40, 'Units': "�C"})
+        self.assertEqual(response.text(), '{"Reading": 40, "Units": "�C"}')
+
+
+class TestGetBackend(unittest.TestCase):
+
+    def test_default(self):
+        self.assertIs(jsonbackend.getBackend(), jsonbackend.STDLIB)
+        self.assertIs(jsonbackend.getBackend(jsonbackend.STDLIB), jsonbackend.STDLIB)
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, jsonbackend.getBackend, 'yaml')
+
+    def test_not_installed(self):
+        with mock.patch.dict(jsonbackend.BACKENDS, {'missing': _makeMissing}):
+            self.assertRaises(ValueError, jsonbackend.getBackend, 'missing')
+            self.assertFalse(jsonbackend.isAvailable('missing'))
+
+    def test_auto_falls_back_to_json(self):
+        dictMissing = dict((strName, _makeMissing) for strName in jsonbackend.BACKENDS
+                           if strName != 'json')
+        with mock.patch.dict(jsonbackend.BACKENDS, dictMissing), \
+                mock.patch.object(jsonbackend, '_dictBackend', {'json': jsonbackend.STDLIB}):
+            self.assertIs(jsonbackend.getBackend('auto'), jsonbackend.STDLIB)
+
+    def test_auto_prefers_the_first_installed(self):
+        fake = jsonbackend.JsonBackend('ujson', json.loads, lambda obj: json.dumps(obj).encode())
+        with mock.patch.dict(jsonbackend.BACKENDS, {'orjson': _makeMissing,
+                                                    'simdjson': _makeMissing,
+                                                    'ujson': lambda: fake}), \
+                mock.patch.object(jsonbackend, '_dictBackend', {'json': jsonbackend.STDLIB}):
+            self.assertIs(jsonbackend.getBackend('auto'), fake)
+
+    def test_dumps_bytes(self):
+        for strName in sorted(jsonbackend.BACKENDS):
+            if (jsonbackend.isAvailable(strName)):
+                backend = jsonbackend.getBackend(strName)
+                self.assertEqual(json.loads(backend.dumps({'Id': "1"}).decode()), {'Id': "1"},
+                                 strName)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the incremental Members parser."""
+
+# ---------Imports---------
+import json
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful import jsonbackend
+from redfish_advantech.restful.jsonstream import MembersParser, iterMembers
+
+URL = "/redfish/v1/Systems/0/LogServices/Log/Entries"
+
+
+# A LogEntries collection of nEntry entries with every kind of string
+def makeCollection(nEntry):
+    return {'@odata.id': URL,
+            'Name': "Log Entries",
+            'Members@odata.count': nEntry,
+            'Members': [{'@odata.id': "%s/%d" % (URL, i), 'Id': str(i),
+                         'Message': 'Event %d "quoted" {brace} [bracket] \\ back\\slash' % i,
+                         'Oem': {'Advantech': {'Sensor': "Temp °C 温度",
+                                               'Values': [i, [i + 1, {'x': None}]]}}}
+                        for i in range(nEntry)],
+            'Members@odata.nextLink': URL + "?$skip=%d" % nEntry}
+
+
+# Split data into chunks of nSize bytes
+def split(data, nSize):
+    return [data[i:i + nSize] for i in range(0, len(data), nSize)]
+
+
+class TestMembersParser(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = makeCollection(5)
+        self.body = json.dumps(self.collection, ensure_ascii=False).encode('utf-8')
+
+    # Parse body fed in chunks of nSize bytes
+    def parse(self, body, nSize, jsonBackend=None):
+        parser = MembersParser(jsonBackend)
+        lstMember = list(parser.parse(split(body, nSize)))
+        return parser, lstMember
+
+    def test_whole_body(self):
+        parser, lstMember = self.parse(self.body, len(self.body))
+        self.assertEqual(lstMember, self.collection['Members'])
+        self.assertEqual(parser.nMembers, 5)
+        self.assertTrue(parser.bDone)
+
+    def test_every_chunk_size(self):
+        # Cuts escapes, UTF-8 sequences, keys and brackets at every offset
+        for nSize in range(1, 40):
+            parser, lstMember = self.parse(self.body, nSize)
+            self.assertEqual(lstMember, self.collection['Members'], nSize)
+
+    def test_split_escape(self):
+        body = b'{"Members": [{"Message": "a\\"b\\\\"}, {"Message": "\\\\\\""}]}'
+        for nSize in range(1, len(body)):
+            parser, lstMember = self.parse(body, nSize)
+            self.assertEqual(lstMember, [{'Message': 'a"b\\'}, {'Message': '\\"'}], nSize)
+
+    def test_split_utf8(self):
+        body = '{"Members": [{"Name": "°C"}, {"Name": "温度"}]}'.encode('utf-8')
+        for nSize in range(1, len(body)):
+            parser, lstMember = self.parse(body, nSize)
+            self.assertEqual(lstMember, [{'Name': "°C"}, {'Name': "温度"}], nSize)
+
+    def test_nesting(self):
+        member = {'a': [[{'b': [{}]}], {'c': {'d': [1, "]}"]}}]}
+        body = json.dumps({'Members': [member, {}, {'e': member}]}).encode()
+        for nSize in (1, 3, len(body)):
+            parser, lstMember = self.parse(body, nSize)
+            self.assertEqual(lstMember, [member, {}, {'e': member}], nSize)
+
+    def test_properties(self):
+        parser, lstMember = self.parse(self.body, 7)
+        self.assertEqual(parser.dictProperties, {
+            '@odata.id': URL,
+            'Name': "Log Entries",
+            'Members@odata.count': 5,
+            'Members@odata.nextLink': URL + "?$skip=5"})
+
+    def test_properties_only(self):
+        parser, lstMember = self.parse(b'{"Members": [], "Members@odata.count": 0}', 2)
+        self.assertEqual(lstMember, [])
+        self.assertEqual(parser.dictProperties, {'Members@odata.count': 0})
+
+    def test_members_released_as_they_complete(self):
+        parser = MembersParser()
+        lstMember = parser.feed(b'{"Members": [{"Id": "0"}, {"Id": "1"')
+        self.assertEqual(lstMember, [{'Id': "0"}])
+        self.assertEqual(parser.feed(b'}]}'), [{'Id': "1"}])
+        parser.close()
+
+    def test_truncated_body(self):
+        parser = MembersParser()
+        parser.feed(b'{"Members": [{"Id": "0"}, {"Id"')
+        self.assertRaises(ValueError, parser.close)
+
+    def test_not_an_object(self):
+        self.assertRaises(ValueError, MembersParser().feed, b'[{"Id": "0"}]')
+
+    def test_bad_member(self):
+        self.assertRaises(ValueError, MembersParser().feed, b'{"Members": [{"Id": 0x1}]}')
+
+    def test_invalid_utf8(self):
+        parser, lstMember = self.parse(b'{"Members": [{"Name": "\xb0C"}]}', 4)
+        self.assertEqual(lstMember, [{'Name': "�C"}])
+
+    def test_backends(self):
+        for strName in sorted(jsonbackend.BACKENDS):
+            if (jsonbackend.isAvailable(strName)):
+                backend = jsonbackend.getBackend(strName)
+                parser, lstMember = self.parse(self.body, 11, backend)
+                self.assertEqual(lstMember, self.collection['Members'], strName)
+
+    def test_iter_members(self):
+        lstMember = list(iterMembers(split(self.body, 5)))
+        self.assertEqual(lstMember, self.collection['Members'])
+
+    def test_other_key(self):
+        body = b'{"Members": [{"Id": "0"}], "Temperatures": [{"Name": "CPU"}]}'
+        lstMember = list(iterMembers([body], strKey='Temperatures'))
+        self.assertEqual(lstMember, [{'Name': "CPU"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the SQLite link map."""
+
+# ---------Imports---------
+import os
+import shutil
+import tempfile
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful.linkmap import LinkMap
+
+
+class TestLinkMap(unittest.TestCase):
+
+    def setUp(self):
+        self.strDir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.strDir, 'links.db')
+        self.key = LinkMap.makeKey("bmc", 443, "uuid")
+
+    def tearDown(self):
+        shutil.rmtree(self.strDir)
+
+    def test_put_merges(self):
+        linkMap = LinkMap(self.fname)
+        self.assertEqual(linkMap.get(self.key), {})
+        linkMap.put(self.key, {'urlThermal': "/t", 'urlPower': "/p"})
+        linkMap.put(self.key, {'urlPower': "/p2"})
+        self.assertEqual(LinkMap(self.fname).get(self.key), {'urlThermal': "/t", 'urlPower': "/p2"})
+
+    def test_processes_do_not_overwrite_each_other(self):
+        first = LinkMap(self.fname)
+        second = LinkMap(self.fname)
+        first.put(self.key, {'urlThermal': "/t"})
+        second.put("other:443/uuid", {'urlThermal': "/o"})
+        self.assertEqual(first.get(self.key), {'urlThermal': "/t"})
+        self.assertEqual(first.get("other:443/uuid"), {'urlThermal': "/o"})
+
+    def test_forget(self):
+        linkMap = LinkMap(self.fname)
+        linkMap.put(self.key, {'urlThermal': "/t"})
+        linkMap.forget(self.key)
+        self.assertEqual(linkMap.get(self.key), {})
+
+    def test_memory(self):
+        linkMap = LinkMap(':memory:')
+        linkMap.put(self.key, {'urlThermal': "/t"})
+        self.assertEqual(linkMap.get(self.key), {'urlThermal': "/t"})
+        # Each instance has a database of its own
+        self.assertEqual(LinkMap(':memory:').get(self.key), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
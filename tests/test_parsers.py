@@ -0,0 +1,209 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the parsers of Advantech BMC Redfish documents."""
+
+# ---------Imports---------
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful import parsers
+from redfish_advantech.restful import records
+
+CHASSIS = "/redfish/v1/Chassis/1u"
+
+
+class TestLinks(unittest.TestCase):
+
+    def test_link(self):
+        json_data = {'Thermal': {'@odata.id': CHASSIS + "/Thermal"}, 'Power': "x"}
+        self.assertEqual(parsers.parseLink(json_data, 'Thermal'), CHASSIS + "/Thermal")
+        self.assertEqual(parsers.parseLink(json_data, 'Power'), '')
+        self.assertEqual(parsers.parseLink(json_data, 'Bios'), '')
+
+    def test_links_in_document_order(self):
+        json_data = {'Systems': {'@odata.id': "/s"}, 'Name': "Root",
+                     'Chassis': {'@odata.id': "/c"}, 'Links': {}}
+        self.assertEqual(parsers.parseLinks(json_data, parsers.ROOT_LINKS),
+                         [('Systems', "/s"), ('Chassis', "/c")])
+
+    def test_members(self):
+        json_data = {'Members': [{'@odata.id': "/a"}, {}, {'@odata.id': "/b"}]}
+        self.assertEqual(parsers.parseMembers(json_data), (2, ["/a", "/b"]))
+        json_data['Members@odata.count'] = 7
+        self.assertEqual(parsers.parseMembers(json_data)[0], 7)
+        self.assertEqual(parsers.parseFirstMember(json_data), "/a")
+        self.assertEqual(parsers.parseFirstMember({'Members': []}), '')
+
+    def test_next_link(self):
+        self.assertEqual(parsers.parseNextLink({'Members@odata.nextLink': "/p2"}), "/p2")
+        self.assertEqual(parsers.parseNextLink({'Members@odata.nextLink': None}), '')
+        self.assertEqual(parsers.parseNextLink({}), '')
+
+    def test_all_links(self):
+        json_data = {'@odata.id': CHASSIS,
+                     'Thermal': {'@odata.id': CHASSIS + "/Thermal"},
+                     'Links': {'ComputerSystems': [{'@odata.id': "/s/0"}, {'@odata.id': "/s/1"}]},
+                     'Temperatures': [{'@odata.id': CHASSIS + "/Thermal#/Temperatures/0"}],
+                     'Self': {'@odata.id': CHASSIS}}
+        self.assertEqual(parsers.parseAllLinks(json_data),
+                         [CHASSIS + "/Thermal", "/s/0", "/s/1"])
+
+    def test_expanded_members(self):
+        json_data = {'Members': [{'@odata.id': "/a", 'Id': "a"}, {'@odata.id': "/b"}]}
+        self.assertEqual(parsers.parseExpandedMembers(json_data),
+                         {"/a": {'@odata.id': "/a", 'Id': "a"}})
+
+
+class TestQueries(unittest.TestCase):
+
+    def test_expand(self):
+        self.assertEqual(parsers.parseExpandQuery(None), '')
+        self.assertEqual(parsers.parseExpandQuery({'ExpandQuery': {'ExpandAll': True}}),
+                         '$expand=*')
+        self.assertEqual(parsers.parseExpandQuery(
+            {'ExpandQuery': {'NoLinks': True, 'ExpandAll': True, 'Levels': True}}),
+            '$expand=.($levels=1)')
+
+    def test_select(self):
+        self.assertTrue(parsers.parseSelectQuery({'SelectQuery': True}))
+        self.assertFalse(parsers.parseSelectQuery({}))
+        self.assertEqual(parsers.selectQuery(("Fans/Name", "Fans/Reading")),
+                         '$select=Fans/Name,Fans/Reading')
+
+    def test_top_skip(self):
+        self.assertTrue(parsers.parseTopSkipQuery({'TopSkipQuery': True}))
+        self.assertFalse(parsers.parseTopSkipQuery(None))
+        self.assertEqual(parsers.topSkipQuery(50), '$top=50')
+        self.assertEqual(parsers.topSkipQuery(50, 100), '$top=50&$skip=100')
+
+    def test_select_properties(self):
+        json_data = {'@odata.id': CHASSIS + "/Thermal", 'Id': "Thermal",
+                     'Fans': [{'@odata.id': "f0", 'Name': "FAN0", 'Reading': 5000,
+                               'Status': {'Health': "OK"}}],
+                     'Temperatures': []}
+        self.assertEqual(parsers.selectProperties(json_data, ("Fans/Name", "Fans/Reading")),
+                         {'@odata.id': CHASSIS + "/Thermal",
+                          'Fans': [{'@odata.id': "f0", 'Name': "FAN0", 'Reading': 5000}]})
+        self.assertEqual(parsers.selectProperties(json_data, ("Id",)),
+                         {'@odata.id': CHASSIS + "/Thermal", 'Id': "Thermal"})
+
+
+class TestResources(unittest.TestCase):
+
+    def test_thermal(self):
+        json_data = {'Temperatures': [{'@odata.id': "t0", 'Name': "CPU", 'ReadingCelsius': 41,
+                                       'Status': {'Health': "OK"}},
+                                      {'Name': "Absent"}],
+                     'Fans': [{'@odata.id': "f0", 'Name': "FAN0", 'Reading': 5000,
+                               'ReadingUnits': "RPM"}]}
+        dictThermal = parsers.parseThermal(json_data)
+        self.assertEqual(dictThermal['Temperatures'],
+                         [records.TemperatureReading("t0", "CPU", 41, "OK")])
+        self.assertEqual(dictThermal['Fans'],
+                         [records.FanReading("f0", "FAN0", 5000, "RPM", '')])
+
+    def test_power(self):
+        json_data = {'Voltages': [{'Name': "P12V", 'ReadingVolts': 12.1}],
+                     'PowerSupplies': [{'Name': "PSU0", 'LineInputVoltage': 230}]}
+        dictPower = parsers.parsePower(json_data)
+        self.assertEqual(dictPower['Voltages'][0].readingVolts, 12.1)
+        self.assertEqual(dictPower['PowerSupplies'][0].lineInputVoltage, 230)
+        self.assertEqual(parsers.parsePower({}), {'Voltages': [], 'PowerSupplies': []})
+
+    def test_selected_thermal_and_power(self):
+        json_thermal = {'@odata.id': CHASSIS + "/Thermal", 'Id': "Thermal",
+                        'Temperatures': [{'@odata.id': "t0", 'Name': "CPU", 'ReadingCelsius': 41,
+                                          'PhysicalContext': "CPU",
+                                          'Status': {'State': "Enabled", 'Health': "OK"}}],
+                        'Fans': [{'@odata.id': "f0", 'Name': "FAN0", 'Reading': 5000,
+                                  'ReadingUnits': "RPM", 'Status': {'Health': "Warning"}}]}
+        json_power = {'Voltages': [{'Name': "P12V", 'ReadingVolts': 12.1,
+                                    'Status': {'Health': "OK"}}],
+                      'PowerSupplies': [{'Name': "PSU0", 'LineInputVoltage': 230,
+                                         'Model': "X", 'Status': {'Health': "Critical"}}]}
+        # The body a BMC answers to $select holds what the parsers read
+        for json_data, lstSelect, parse in ((json_thermal, parsers.THERMAL_SELECT,
+                                             parsers.parseThermal),
+                                            (json_power, parsers.POWER_SELECT,
+                                             parsers.parsePower)):
+            self.assertEqual(parse(parsers.selectProperties(json_data, lstSelect)),
+                             parse(json_data))
+        dictThermal = parsers.parseThermal(
+            parsers.selectProperties(json_thermal, parsers.THERMAL_SELECT))
+        self.assertEqual(dictThermal['Fans'],
+                         [records.FanReading("f0", "FAN0", 5000, "RPM", "Warning")])
+
+    def test_chassis(self):
+        json_data = {'Id': "1u", 'Name': "Chassis", 'ChassisType': "RackMount",
+                     'Status': {'Health': "Warning"},
+                     'Thermal': {'@odata.id': CHASSIS + "/Thermal"}}
+        self.assertEqual(parsers.parseChassis(json_data),
+                         {'Id': "1u", 'Name': "Chassis", 'ChassisType': "RackMount",
+                          'Health': "Warning", 'Thermal': CHASSIS + "/Thermal", 'Power': ''})
+
+    def test_system(self):
+        json_data = {'PowerState': "On", 'Bios': {'@odata.id': "/s/0/Bios"},
+                     'Actions': {'#ComputerSystem.Reset': {'target': "/s/0/Actions/Reset"}}}
+        dictSystem = parsers.parseSystem(json_data)
+        self.assertEqual(dictSystem['PowerState'], "On")
+        self.assertEqual(dictSystem['Bios'], "/s/0/Bios")
+        self.assertEqual(dictSystem['Memory'], '')
+        self.assertEqual(dictSystem['Reset'], "/s/0/Actions/Reset")
+        self.assertEqual(parsers.parseSystem({})['Reset'], '')
+
+    def test_member_id(self):
+        self.assertEqual(parsers.parseMemberId({'Id': "3"}, "/x/4"), "3")
+        self.assertEqual(parsers.parseMemberId({}, "/x/4/?$expand=."), "4")
+
+    def test_inventory(self):
+        processor = parsers.parseProcessor({'@odata.id': "/p/0", 'Id': "0", 'TotalCores': 8})
+        self.assertEqual((processor.uri, processor.id, processor.totalCores, processor.model),
+                         ("/p/0", "0", 8, None))
+        storage = parsers.parseStorage({'Devices': [{'Name': "SSD", 'CapacityBytes': 512}]})
+        self.assertEqual(storage.devices, [("SSD", 512)])
+        nic = parsers.parseEthernetInterface({'IPv4Addresses': [{'Address': "10.0.0.2"}]})
+        self.assertEqual(nic.ipv4Addresses, ["10.0.0.2"])
+        memory = parsers.parseMemory({'CapacityMiB': 16384, 'Status': {'Health': "OK"}})
+        self.assertEqual((memory.capacityMiB, memory.health), (16384, "OK"))
+        bios = parsers.parseBios({'Id': "Bios", 'Attributes': {'Boot': "UEFI"}})
+        self.assertEqual(bios['Attributes'], {'Boot': "UEFI"})
+
+    def test_log_service(self):
+        logService = parsers.parseLogService({
+            '@odata.id': "/s/0/LogServices/Log", 'Id': "Log", 'MaxNumberOfRecords': 512,
+            'OverWritePolicy': "WrapsWhenFull", 'ServiceEnabled': True,
+            'Entries': {'@odata.id': "/s/0/LogServices/Log/Entries"}})
+        self.assertEqual(logService.entries, "/s/0/LogServices/Log/Entries")
+        self.assertEqual(logService.maxNumberOfRecords, 512)
+        self.assertEqual(parsers.parseLogService({}).entries, '')
+
+    def test_log_entry(self):
+        entry = parsers.parseLogEntry({'Id': "1", 'Severity': "Critical",
+                                       'Message': "Fan failed"})
+        self.assertEqual((entry.id, entry.severity, entry.message),
+                         ("1", "Critical", "Fan failed"))
+
+    def test_privilege_map(self):
+        privilegeMap = parsers.parsePrivilegeMap({
+            '@odata.id': "/redfish/v1/AccountService/PrivilegeMap",
+            'Mappings': [{'Entity': "Manager",
+                          'OperationMap': {'GET': [{'Privilege': ["Login"]}],
+                                           'PATCH': [{'Privilege': ["ConfigureManager"]},
+                                                     {'Privilege': ["Login", "ConfigureSelf"]}]}}]})
+        self.assertEqual(privilegeMap.operationMap, {
+            'Manager': {'GET': [["Login"]],
+                        'PATCH': [["ConfigureManager"], ["Login", "ConfigureSelf"]]}})
+        self.assertEqual(parsers.parsePrivilegeMap({}).operationMap, {})
+
+    def test_strings_interned(self):
+        first = parsers.parseLogEntry({'Severity': "".join(["Criti", "cal"])})
+        second = parsers.parseLogEntry({'Severity': "".join(["Crit", "ical"])})
+        self.assertIs(first.severity, second.severity)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the per-BMC token bucket rate limiters."""
+
+# ---------Imports---------
+import time
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful import ratelimit
+from redfish_advantech.restful.ratelimit import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst(self):
+        bucket = TokenBucket(rate=1, nBurst=3)
+        self.assertEqual([bucket.reserve() for i in range(3)], [0.0, 0.0, 0.0])
+        self.assertEqual(bucket.nWaits, 0)
+
+    def test_wait_grows_in_order(self):
+        bucket = TokenBucket(rate=10, nBurst=1)
+        bucket.reserve()
+        lstDelay = [bucket.reserve() for i in range(3)]
+        for delay, expected in zip(lstDelay, (0.1, 0.2, 0.3)):
+            self.assertAlmostEqual(delay, expected, delta=0.01)
+        self.assertEqual(bucket.nWaits, 3)
+
+    def test_refill(self):
+        bucket = TokenBucket(rate=100, nBurst=1)
+        bucket.reserve()
+        time.sleep(0.02)
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_refill_capped_at_burst(self):
+        bucket = TokenBucket(rate=1000, nBurst=2)
+        time.sleep(0.01)
+        self.assertEqual([bucket.reserve() for i in range(2)], [0.0, 0.0])
+        self.assertGreater(bucket.reserve(), 0.0)
+
+    def test_set_rate(self):
+        bucket = TokenBucket(rate=1, nBurst=1)
+        bucket.setRate(10, nBurst=5)
+        self.assertEqual(bucket.rate, 10.0)
+        self.assertEqual(bucket.nBurst, 5)
+        bucket.setRate(0)
+        self.assertGreater(bucket.rate, 0)
+
+    def test_acquire_sleeps(self):
+        bucket = TokenBucket(rate=50, nBurst=1)
+        bucket.acquire()
+        start = time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.015)
+
+    def test_shared_per_host(self):
+        bucket = ratelimit.getRateLimiter("ratelimit.test", 443, rate=5)
+        self.assertIs(ratelimit.getRateLimiter("ratelimit.test", 443), bucket)
+        self.assertEqual(bucket.rate, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the compact sensor and inventory records."""
+
+# ---------Imports---------
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful import records
+
+
+class TestRecord(unittest.TestCase):
+
+    def test_fields(self):
+        reading = records.TemperatureReading("t0", "CPU", 41)
+        self.assertEqual(reading.asDict(), {'uri': "t0", 'name': "CPU",
+                                            'readingCelsius': 41, 'health': None})
+        self.assertFalse(hasattr(reading, '__dict__'))
+        self.assertEqual(repr(reading), "TemperatureReading(uri='t0', name='CPU', "
+                                        "readingCelsius=41, health=None)")
+
+    def test_equality(self):
+        self.assertEqual(records.FanReading("f0", "FAN0", 1), records.FanReading("f0", "FAN0", 1))
+        self.assertNotEqual(records.FanReading("f0", "FAN0", 1),
+                            records.FanReading("f0", "FAN0", 2))
+        # Same fields, other record type
+        self.assertNotEqual(records.VoltageReading("v", "P12V", 12),
+                            records.PsuReading("v", "P12V", 12))
+
+    def test_hash(self):
+        first = records.TemperatureReading("t0", "CPU", 41, "OK")
+        second = records.TemperatureReading("t0", "CPU", 41, "OK")
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(len(set([first, second, records.TemperatureReading("t1")])), 2)
+        self.assertEqual({first: 1}[second], 1)
+
+    def test_hash_of_list_and_dict_fields(self):
+        storage = records.Storage("s", "0", "Disk", [("SSD", 512)], "OK")
+        self.assertEqual(hash(storage), hash(records.Storage("s", "0", "Disk", [("SSD", 512)], "OK")))
+        privilegeMap = records.PrivilegeMap("p", None, None, {'Manager': {'GET': [["Login"]]}})
+        self.assertIn(privilegeMap, set([privilegeMap]))
+
+    def test_intern(self):
+        self.assertIs(records.intern("".join(["O", "K"])), records.intern("OK"))
+        self.assertEqual(records.intern(5), 5)
+        self.assertEqual(records.intern(None), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the retry policy."""
+
+# ---------Imports---------
+import time
+import unittest
+from email.utils import formatdate
+# ---------End of imports---------
+
+from redfish_advantech.restful.retry import RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retryable(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.isRetryable("GET"))
+        self.assertTrue(policy.isRetryable("DELETE", 503))
+        self.assertFalse(policy.isRetryable("GET", 500))
+        self.assertFalse(policy.isRetryable("POST"))
+        self.assertFalse(policy.isRetryable("PATCH", 503))
+
+    def test_status(self):
+        policy = RetryPolicy(lstStatus=[429])
+        self.assertTrue(policy.isRetryable("GET", 429))
+        self.assertFalse(policy.isRetryable("GET", 503))
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff=0.5, maxBackoff=3, jitter=0)
+        self.assertEqual([policy.getDelay(n) for n in range(5)], [0.5, 1, 2, 3, 3])
+
+    def test_jitter(self):
+        policy = RetryPolicy(backoff=1, jitter=0.5)
+        for i in range(50):
+            self.assertTrue(2 <= policy.getDelay(1) <= 3)
+
+    def test_retry_after_seconds(self):
+        policy = RetryPolicy(maxRetryAfter=60)
+        self.assertEqual(policy.getDelay(0, "7"), 7)
+        self.assertEqual(policy.getDelay(0, "600"), 60)
+        self.assertEqual(policy.getDelay(0, "-1"), 0)
+
+    def test_retry_after_date(self):
+        policy = RetryPolicy()
+        delay = policy.getDelay(0, formatdate(time.time() + 20, usegmt=True))
+        self.assertTrue(18 <= delay <= 20, delay)
+
+    def test_bad_retry_after(self):
+        policy = RetryPolicy(backoff=1, jitter=0)
+        self.assertEqual(policy.parseRetryAfter("soon"), None)
+        self.assertEqual(policy.getDelay(0, "soon"), 1)
+
+    def test_no_retries(self):
+        self.assertEqual(RetryPolicy(nMaxRetries=-1).nMaxRetries, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the SQLite session store."""
+
+# ---------Imports---------
+import os
+import stat
+import shutil
+import tempfile
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful.sessionstore import SessionStore
+
+
+class TestSessionStore(unittest.TestCase):
+
+    def setUp(self):
+        self.strDir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.strDir, 'sessions.db')
+        self.key = SessionStore.makeKey("bmc", 443, "admin")
+
+    def tearDown(self):
+        shutil.rmtree(self.strDir)
+
+    def test_owner_only(self):
+        SessionStore(self.fname)
+        self.assertEqual(stat.S_IMODE(os.stat(self.fname).st_mode), 0o600)
+
+    def test_put_keeps_the_first_session(self):
+        store = SessionStore(self.fname)
+        self.assertTrue(store.put(self.key, "token1", "/s/1"))
+        # Another process logged in at the same time
+        self.assertFalse(SessionStore(self.fname).put(self.key, "token2", "/s/2"))
+        self.assertEqual(store.get(self.key), ("token1", "/s/1"))
+
+    def test_forget(self):
+        store = SessionStore(self.fname)
+        store.put(self.key, "token1", "/s/1")
+        store.forget(self.key, "other")
+        self.assertEqual(store.get(self.key), ("token1", "/s/1"))
+        store.forget(self.key, "token1")
+        self.assertEqual(store.get(self.key), None)
+        self.assertTrue(store.put(self.key, "token2", "/s/2"))
+
+    def test_memory(self):
+        store = SessionStore(':memory:')
+        self.assertTrue(store.put(self.key, "token1", "/s/1"))
+        self.assertEqual(store.get(self.key), ("token1", "/s/1"))
+        store.forget(self.key)
+        self.assertEqual(store.get(self.key), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+# Copyright Notice:
+# Copyright 2016-2021 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link:
+# https://github.com/DMTF/python-redfish-library/blob/master/LICENSE.md
+
+# -*- coding: utf-8 -*-
+"""Tests of the request path of redfish_advantech against a fake pool."""
+
+# ---------Imports---------
+import io
+import json
+import http.client
+import unittest
+# ---------End of imports---------
+
+from redfish_advantech.restful import v1api
+from redfish_advantech.restful.breaker import CircuitBreaker, CLOSED, OPEN
+from redfish_advantech.restful.ratelimit import TokenBucket
+from redfish_advantech.restful.retry import RetryPolicy
+from redfish_advantech.restful.v1api import (redfish_advantech, InvalidCredentialsError,
+                                             ServerDownOrUnreachableError)
+
+SESSIONS = "/redfish/v1/SessionService/Sessions"
+
+
+def makeHeaders(dictHeader=None):
+    lstLine = ["%s: %s\r\n" % item for item in (dictHeader or {}).items()]
+    return http.client.parse_headers(io.BytesIO("".join(lstLine).encode('latin-1') + b"\r\n"))
+
+
+class FakePool:
+    """Answer pool.request() from a list of (status, body, headers) or exceptions"""
+
+    def __init__(self, lstAnswer):
+        self.lstAnswer = list(lstAnswer)
+        self.lstRequest = []
+
+    def request(self, method, url, body=None, headers=None):
+        self.lstRequest.append((method, url, dict(headers or {})))
+        answer = self.lstAnswer.pop(0)
+        if (isinstance(answer, BaseException)):
+            raise answer
+        status, json_data, dictHeader = answer
+        body = b'' if json_data == None else json.dumps(json_data).encode()
+        return (status, "Reason", makeHeaders(dictHeader), body, len(body))
+
+    def stream(self, method, url, body=None, headers=None):
+        status, reason, headers, body, nWireBytes = self.request(method, url, body, headers)
+        return FakeStream(status, body)
+
+    def close(self):
+        pass
+
+
+class FakeStream:
+    """The StreamedResponse of FakePool: the body comes in 7 byte chunks"""
+
+    def __init__(self, status, body):
+        self.status = status
+        self.reason = "Reason"
+        self.nBytes = len(body)
+        self.nWireBytes = len(body)
+        self.body = body
+        self.bClosed = False
+
+    def iterChunks(self):
+        for i in range(0, len(self.body), 7):
+            yield self.body[i:i + 7]
+
+    def close(self):
+        self.bClosed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# A client whose requests are answered by FakePool(lstAnswer)
+def makeClient(lstAnswer, **kwargs):
+    # The tests do not need the logging.conf of the examples
+    v1api._bLoggingConfLoaded = True
+    kwargs.setdefault('bCircuitBreaker', False)
+    kwargs.setdefault('bAdaptive', False)
+    client = redfish_advantech("bmc", 443, "admin", "secret", **kwargs)
+    client.pool = FakePool(lstAnswer)
+    return client
+
+
+class TestLogin(unittest.TestCase):
+
+    def test_login(self):
+        client = makeClient([(302, {'@odata.id': SESSIONS + "/1"}, {'X-Auth-Token': "t1"})])
+        client.login()
+        self.assertEqual((client.authToken, client.location), ("t1", SESSIONS + "/1"))
+
+    def test_login_rejected(self):
+        client = makeClient([(401, {'error': "unauth"}, None)])
+        self.assertRaises(InvalidCredentialsError, client.login)
+        self.assertEqual(client.authToken, None)
+
+    def test_failed_relogin_is_not_replayed(self):
+        client = makeClient([(401, None, None), (401, {'error': "unauth"}, None)])
+        client.authToken = "expired"
+        client.location = SESSIONS + "/1"
+        self.assertRaises(InvalidCredentialsError, client.rfRequest, True, "GET", "/redfish/v1")
+        self.assertEqual([request[:2] for request in client.pool.lstRequest],
+                         [("GET", "/redfish/v1"), ("POST", SESSIONS)])
+
+    def test_relogin_replays(self):
+        client = makeClient([(401, None, None),
+                             (302, {'@odata.id': SESSIONS + "/2"}, {'X-Auth-Token': "t2"}),
+                             (200, {'Id': "RootService"}, None)])
+        client.authToken = "expired"
+        client.location = SESSIONS + "/1"
+        response = client.rfRequest(True, "GET", "/redfish/v1")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(client.pool.lstRequest[-1][2]['X-Auth-Token'], "t2")
+
+
+class TestBreaker(unittest.TestCase):
+
+    # A client whose own breaker is half-open: the next request is its probe
+    def makeProbing(self, lstAnswer):
+        client = makeClient(lstAnswer, retryPolicy=RetryPolicy(nMaxRetries=0))
+        client.breaker = CircuitBreaker("bmc:443", nFailureThreshold=1, resetTimeout=0)
+        client.breaker.recordFailure()
+        return client
+
+    def test_transport_error_fails_the_probe(self):
+        client = self.makeProbing([ConnectionResetError()])
+        self.assertRaises(ServerDownOrUnreachableError, client.rfRequest, True, "GET", "/x")
+        self.assertEqual(client.breaker.strState, OPEN)
+
+    def test_server_error_fails_the_probe(self):
+        client = self.makeProbing([(500, None, None)])
+        client.rfRequest(True, "GET", "/x")
+        self.assertEqual(client.breaker.strState, OPEN)
+
+    def test_client_error_closes(self):
+        client = self.makeProbing([(404, None, None)])
+        client.rfRequest(True, "GET", "/x")
+        self.assertEqual(client.breaker.strState, CLOSED)
+
+    def test_client_bug_releases_the_probe(self):
+        client = self.makeProbing([TypeError("expected string"), (200, {}, None)])
+        self.assertRaises(TypeError, client.rfRequest, True, "GET", "/x")
+        self.assertEqual(client.breaker.nFailures, 1)
+        # The probe is free again
+        self.assertEqual(client.rfRequest(True, "GET", "/x").status, 200)
+        self.assertEqual(client.breaker.strState, CLOSED)
+
+
+class TestRateLimit(unittest.TestCase):
+
+    def test_rate_and_burst(self):
+        client = makeClient([], bRateLimit=True, rate=5, nBurst=2)
+        self.assertEqual((client.rateLimiter.rate, client.rateLimiter.nBurst), (5.0, 2))
+
+    def test_open_circuit_takes_no_token(self):
+        client = makeClient([], bRateLimit=True, rate=5, nBurst=2)
+        client.rateLimiter = TokenBucket(rate=5, nBurst=2)
+        client.breaker = CircuitBreaker("bmc:443", nFailureThreshold=1, resetTimeout=60)
+        client.breaker.recordFailure()
+        for i in range(5):
+            self.assertRaises(ServerDownOrUnreachableError, client.rfRequest, True, "GET", "/x")
+        self.assertEqual(client.rateLimiter.reserve(), 0.0)
+        self.assertEqual(client.rateLimiter.nWaits, 0)
+
+
+class TestStreamMembers(unittest.TestCase):
+
+    def test_split_chunks(self):
+        lstMember = [{'@odata.id': "/e/%d" % i, 'Message': 'Event "%d" {°C}' % i}
+                     for i in range(20)]
+        collection = {'Members@odata.count': 20, 'Members': lstMember,
+                      'Members@odata.nextLink': "/e?$skip=20"}
+        client = makeClient([(200, collection, None)])
+        client.authToken = "t1"
+        dictProperties = {}
+        self.assertEqual(list(client.streamMembers("x", "/e", dictProperties=dictProperties)),
+                         lstMember)
+        self.assertEqual(dictProperties, {'Members@odata.count': 20,
+                                          'Members@odata.nextLink': "/e?$skip=20"})
+        self.assertEqual(client.getTransferStats()['nBytes'], len(json.dumps(collection)))
+
+    def test_not_found(self):
+        client = makeClient([(404, {'error': "nf"}, None)])
+        self.assertEqual(list(client.streamMembers("x", "/e")), [])
+        self.assertEqual(client.nLastStatus, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()